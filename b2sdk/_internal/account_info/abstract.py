@@ -368,6 +368,19 @@ class AbstractAccountInfo(metaclass=B2TraceMetaAbstract):
         needed at some point.
         """
 
+    def update_auth_token(self, auth_token: str) -> bool:
+        """
+        Replace only the account auth token, keeping the rest of the auth data
+        as well as the cached buckets and upload URLs.
+
+        Account info classes which cannot do that return ``False``, in which case
+        all of the auth data has to be stored again with :meth:`set_auth_data`.
+
+        :param str auth_token: the new account auth token
+        :return: whether the token was replaced
+        """
+        return False
+
     @abstractmethod
     def take_bucket_upload_url(self, bucket_id):
         """
@@ -421,3 +434,37 @@ class AbstractAccountInfo(metaclass=B2TraceMetaAbstract):
         :param str file_id: a file ID
         """
         pass
+
+    def count_bucket_upload_urls(self, bucket_id) -> int | None:
+        """
+        Return the number of upload URLs pooled for the bucket, or ``None`` if not known
+        (then upload URLs are not prefetched for it).
+
+        :param str bucket_id: a bucket ID
+        """
+        return None
+
+    def count_large_file_upload_urls(self, file_id) -> int | None:
+        """
+        Return the number of upload URLs pooled for the large file, or ``None`` if not known
+        (then upload URLs are not prefetched for it).
+
+        :param str file_id: a file ID
+        """
+        return None
+
+    def record_upload_url_success(self, upload_url, duration, size):
+        """
+        Record that an upload to the URL succeeded, so that URLs of healthy pods can be preferred.
+
+        :param str upload_url: an upload URL
+        :param float duration: duration of the upload, in seconds
+        :param int size: number of bytes uploaded
+        """
+
+    def record_upload_url_failure(self, upload_url):
+        """
+        Record that an upload to the URL failed, so that URLs of failing pods can be avoided.
+
+        :param str upload_url: an upload URL
+        """
@@ -85,6 +85,12 @@ class InMemoryAccountInfo(UrlPoolAccountInfo):
         self._s3_api_url = s3_api_url
         self._allowed = allowed
 
+    def update_auth_token(self, auth_token: str) -> bool:
+        if self._account_id is None:
+            return False
+        self._auth_token = auth_token
+        return True
+
     def refresh_entire_bucket_name_cache(self, name_id_iterable):
         self._buckets = dict(name_id_iterable)
 
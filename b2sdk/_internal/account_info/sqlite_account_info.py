@@ -17,10 +17,11 @@ import sqlite3
 import stat
 import sys
 import threading
+import time
 from contextlib import contextmanager
 
 from .exception import CorruptAccountInfo, MissingAccountData
-from .upload_url_pool import UrlPoolAccountInfo
+from .upload_url_pool import UploadUrlPool, UrlPoolAccountInfo
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,8 @@ B2_ACCOUNT_INFO_PROFILE_FILE = os.path.join('~', '.b2db-{profile}.sqlite')
 B2_ACCOUNT_INFO_PROFILE_NAME_REGEXP = re.compile(r'[a-zA-Z0-9_\-]{1,64}')
 XDG_CONFIG_HOME_ENV_VAR = 'XDG_CONFIG_HOME'
 
+_NOT_CACHED = object()
+
 DEFAULT_ABSOLUTE_MINIMUM_PART_SIZE = (
     5000000  # this value is used ONLY in migrating db, and in v1 wrapper, it is not
 )
@@ -43,9 +46,29 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
 
     The ``update_done`` table tracks the schema updates that have been
     completed.
+
+    The database is used in WAL journal mode, so that readers do not block each other or a writer.
+    Every thread keeps its own connection and a copy of the account row, which is read again
+    only after ``PRAGMA data_version`` reports a change made by another connection
+    (of this or another process).
+
+    Upload URLs are kept in memory unless ``share_upload_urls`` is set, in which case the upload URLs
+    of buckets are kept in the database, so that processes sharing it reuse them - at the cost of
+    two write transactions (serialized between all the threads and processes) per upload of a small file.
     """
 
-    def __init__(self, file_name=None, last_upgrade_to_run=None, profile: str | None = None):
+    JOURNAL_MODE = 'WAL'
+    BUCKET_UPLOAD_URL_TTL = (
+        UploadUrlPool.MAX_AGE
+    )  #: Seconds after which a bucket upload URL is not used.
+
+    def __init__(
+        self,
+        file_name=None,
+        last_upgrade_to_run=None,
+        profile: str | None = None,
+        share_upload_urls: bool = False,
+    ):
         """
         Initialize SqliteAccountInfo.
 
@@ -73,8 +96,12 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
 
         :param str file_name: The sqlite file to use; overrides the default.
         :param int last_upgrade_to_run: For testing only, override the auto-update on the db.
+        :param bool share_upload_urls: Keep the upload URLs of buckets in the database, to share them with other processes.
         """
         self.thread_local = threading.local()
+        self.share_upload_urls = share_upload_urls
+        self._upload_url_expiration_lock = threading.Lock()
+        self._upload_url_expiration: dict[str, float] = {}
 
         self.filename = self.get_user_account_info_path(file_name=file_name, profile=profile)
         logger.debug('%s file path to use: %s', self.__class__.__name__, self.filename)
@@ -213,7 +240,10 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
             return self.thread_local.connection
 
     def _connect(self):
-        return sqlite3.connect(self.filename, isolation_level='EXCLUSIVE')
+        conn = sqlite3.connect(self.filename, isolation_level='EXCLUSIVE')
+        if self.JOURNAL_MODE is not None:
+            conn.execute(f'PRAGMA journal_mode={self.JOURNAL_MODE};')
+        return conn
 
     @contextmanager
     def _temp_connection(self):
@@ -232,6 +262,7 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
 
         connection.close()
         del self.thread_local.connection
+        self._invalidate_account_row()
 
     def _create_database(self, last_upgrade_to_run):
         """
@@ -285,9 +316,8 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
            );
         """
         )
-        # This table is not used any more.  We may use it again
-        # someday if we save upload URLs across invocations of
-        # the command-line tool.
+        # Upload URLs of buckets are shared by processes using the database
+        # since update 7, which added their expiration time.
         conn.execute(
             """
            CREATE TABLE IF NOT EXISTS
@@ -299,7 +329,7 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
         """
         )
         # By default, we run all the upgrades
-        last_upgrade_to_run = 6 if last_upgrade_to_run is None else last_upgrade_to_run
+        last_upgrade_to_run = 7 if last_upgrade_to_run is None else last_upgrade_to_run
         # Add the 'allowed' column if it hasn't been yet.
         if 1 <= last_upgrade_to_run:
             self._ensure_update(1, ['ALTER TABLE account ADD COLUMN allowed TEXT;'])
@@ -409,6 +439,15 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
         # There were reported cases of users with db schema upgraded to version 5 and still containing old single-bucket style allowed dict. This was possible because users of sdk apiver <= v2 still received old-styled allowed dicts (from v3 remote API) and there was no proper transformation mechanism when setting the auth data. The bug has now been addressed, but we need an additional migration to address aforementioned cases.
         if 6 <= last_upgrade_to_run:
             self._migrate_allowed_to_multi_bucket(version=6)
+        # Add the expiration time (in seconds since epoch) of upload URLs; rows of older versions are expired
+        if 7 <= last_upgrade_to_run:
+            self._ensure_update(
+                7,
+                [
+                    'DELETE FROM bucket_upload_url;',
+                    'ALTER TABLE bucket_upload_url ADD COLUMN expires_at REAL NOT NULL DEFAULT 0;',
+                ],
+            )
 
     def _migrate_allowed_to_multi_bucket(self, *, version: int):
         """
@@ -467,6 +506,7 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
             return cursor.fetchone()[0]
 
     def _perform_update(self, update_number, update_commands: list[str]):
+        self._invalidate_account_row()
         with self._get_connection() as conn:
             conn.execute('BEGIN')
             for command in update_commands:
@@ -477,6 +517,7 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
         """
         Remove all info about accounts and buckets.
         """
+        self._invalidate_account_row()
         with self._get_connection() as conn:
             conn.execute('DELETE FROM account;')
             conn.execute('DELETE FROM bucket;')
@@ -496,6 +537,7 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
         allowed,
         application_key_id,
     ):
+        self._invalidate_account_row()
         with self._get_connection() as conn:
             conn.execute('DELETE FROM account;')
             conn.execute('DELETE FROM bucket;')
@@ -524,6 +566,12 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
                 ),
             )
 
+    def update_auth_token(self, auth_token: str) -> bool:
+        self._invalidate_account_row()
+        with self._get_connection() as conn:
+            cursor = conn.execute('UPDATE account SET account_auth_token = ?;', (auth_token,))
+        return cursor.rowcount > 0
+
     def set_auth_data_with_schema_0_for_test(
         self,
         account_id,
@@ -545,6 +593,7 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
         :param str application_key: an application key
         :param str realm: a realm to authorize account in
         """
+        self._invalidate_account_row()
         with self._get_connection() as conn:
             conn.execute('DELETE FROM account;')
             conn.execute('DELETE FROM bucket;')
@@ -645,10 +694,10 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
 
     def _get_account_info_or_raise(self, column_name):
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(f'SELECT {column_name} FROM account;')
-                value = cursor.fetchone()[0]
-                return value
+            row = self._get_account_row()
+            if row is None:
+                raise LookupError('no account data')
+            return row[column_name]
         except Exception as e:
             logger.exception(
                 '_get_account_info_or_raise encountered a problem while trying to retrieve "%s"',
@@ -656,6 +705,33 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
             )
             raise MissingAccountData(str(e))
 
+    def _get_account_row(self) -> dict | None:
+        """
+        Return the account row (as a dict of columns) or None if there is none, reading it
+        from the database only if it changed since it was last read by this thread.
+        """
+        conn = self._get_connection()
+        data_version = conn.execute('PRAGMA data_version;').fetchone()[0]
+        local = self.thread_local
+        row = getattr(local, 'account_row', _NOT_CACHED)
+        if row is _NOT_CACHED or local.account_data_version != data_version:
+            with conn:
+                cursor = conn.execute('SELECT * FROM account;')
+                values = cursor.fetchone()
+            row = None
+            if values is not None:
+                row = dict(zip((column[0] for column in cursor.description), values))
+            local.account_row = row
+            local.account_data_version = data_version
+        return row
+
+    def _invalidate_account_row(self):
+        """
+        Forget the account row read by this thread; changes made by this thread's connection
+        are not reported by ``PRAGMA data_version``.
+        """
+        self.thread_local.account_row = _NOT_CACHED
+
     def refresh_entire_bucket_name_cache(self, name_id_iterable):
         with self._get_connection() as conn:
             conn.execute('DELETE FROM bucket;')
@@ -699,3 +775,69 @@ class SqliteAccountInfo(UrlPoolAccountInfo):
             return None
         except sqlite3.Error:
             return None
+
+    # with share_upload_urls, bucket upload urls are checked out of the database, so that processes sharing it reuse them
+    def put_bucket_upload_url(self, bucket_id, upload_url, upload_auth_token):
+        if not self.share_upload_urls:
+            return super().put_bucket_upload_url(bucket_id, upload_url, upload_auth_token)
+        with self._upload_url_expiration_lock:
+            expires_at = self._upload_url_expiration.pop(upload_url, None)
+        if expires_at is None:
+            expires_at = time.time() + self.BUCKET_UPLOAD_URL_TTL
+        with self._get_connection() as conn:
+            conn.execute(
+                'INSERT INTO bucket_upload_url (bucket_id, upload_url, upload_auth_token, expires_at) '
+                'VALUES (?, ?, ?, ?);',
+                (bucket_id, upload_url, upload_auth_token, expires_at),
+            )
+
+    def take_bucket_upload_url(self, bucket_id):
+        if not self.share_upload_urls:
+            return super().take_bucket_upload_url(bucket_id)
+        now = time.time()
+        with self._get_connection() as conn:
+            # the DELETE starts an exclusive transaction, so no other process can take the same url
+            conn.execute('DELETE FROM bucket_upload_url WHERE expires_at <= ?;', (now,))
+            rows = conn.execute(
+                'SELECT rowid, upload_url, upload_auth_token, expires_at FROM bucket_upload_url '
+                'WHERE bucket_id = ? ORDER BY rowid DESC;',
+                (bucket_id,),
+            ).fetchall()
+            if not rows:
+                return (None, None)
+            # the most recently returned url of the healthiest pod
+            rowid, upload_url, upload_auth_token, expires_at = min(
+                rows, key=lambda row: self._bucket_uploads.get_score(row[1])
+            )
+            conn.execute('DELETE FROM bucket_upload_url WHERE rowid = ?;', (rowid,))
+        with self._upload_url_expiration_lock:
+            # urls which were taken and never returned (as their upload failed) are forgotten once they expire
+            for expired_url in [
+                url
+                for url, url_expires_at in self._upload_url_expiration.items()
+                if url_expires_at <= now
+            ]:
+                del self._upload_url_expiration[expired_url]
+            self._upload_url_expiration[upload_url] = expires_at
+        return (upload_url, upload_auth_token)
+
+    def count_bucket_upload_urls(self, bucket_id):
+        if not self.share_upload_urls:
+            return super().count_bucket_upload_urls(bucket_id)
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                'SELECT COUNT(*) FROM bucket_upload_url WHERE bucket_id = ? AND expires_at > ?;',
+                (bucket_id, time.time()),
+            )
+            return cursor.fetchone()[0]
+
+    def clear_bucket_upload_data(self, bucket_id):
+        if not self.share_upload_urls:
+            return super().clear_bucket_upload_data(bucket_id)
+        with self._get_connection() as conn:
+            conn.execute('DELETE FROM bucket_upload_url WHERE bucket_id = ?;', (bucket_id,))
+
+    def record_upload_url_failure(self, upload_url):
+        super().record_upload_url_failure(upload_url)
+        with self._upload_url_expiration_lock:
+            self._upload_url_expiration.pop(upload_url, None)
@@ -67,6 +67,12 @@ class StubAccountInfo(AbstractAccountInfo):
         self.allowed = allowed
         self.application_key_id = application_key_id
 
+    def update_auth_token(self, auth_token: str) -> bool:
+        if self.account_id is None:
+            return False
+        self.auth_token = auth_token
+        return True
+
     def refresh_entire_bucket_name_cache(self, name_id_iterable):
         self.buckets = {}
 
@@ -11,23 +11,65 @@ from __future__ import annotations
 
 import collections
 import threading
+import time
 from abc import abstractmethod
+from urllib.parse import urlsplit
 
 from .abstract import AbstractAccountInfo
 
 
+class _PooledUrl:
+    __slots__ = ('url', 'auth_token', 'expires_at')
+
+    def __init__(self, url, auth_token, expires_at):
+        self.url = url
+        self.auth_token = auth_token
+        self.expires_at = expires_at
+
+
+class _HostHealth:
+    __slots__ = ('error_rate', 'upload_time', 'reported_at')
+
+    def __init__(self, reported_at):
+        self.error_rate = 0.0
+        self.upload_time = 0.0
+        self.reported_at = reported_at
+
+
 class UploadUrlPool:
     """
     For each key (either a bucket id or large file id), hold a pool
     of (url, auth_token) pairs.
 
+    Upload URLs are handed out healthiest pod first: the pool tracks the moving averages
+    of the error rate and of the upload time per megabyte of every pod (host), as reported by
+    :meth:`record_success` and :meth:`record_failure`. Pods without reports are scored
+    as a pod with the average upload time and no errors, and pods are forgotten ``host_max_age``
+    seconds after their last report.
+    Between pods with the same score, the most recently returned URL is handed out first.
+    URLs are dropped ``max_age`` seconds after they were first put in the pool, before their
+    auth tokens expire.
+
     .. note:
         This class is thread-safe.
     """
 
-    def __init__(self):
+    MAX_AGE = 23 * 60 * 60  # upload URLs and their auth tokens are valid for 24 hours
+    HOST_MAX_AGE = 60 * 60
+    PRUNE_INTERVAL = 60
+    ERROR_PENALTY = 10
+    SMOOTHING = 0.2
+    # the time of smaller uploads is mostly the latency, so they are counted as this size
+    MIN_UPLOAD_SIZE = 1024 * 1024
+
+    def __init__(self, max_age: float = MAX_AGE, host_max_age: float = HOST_MAX_AGE):
+        self.max_age = max_age
+        self.host_max_age = host_max_age
         self._lock = threading.Lock()
         self._pool = collections.defaultdict(list)
+        self._expires_at: dict[str, float] = {}
+        self._health: dict[str, _HostHealth] = {}
+        self._pruned_at = time.monotonic()
 
     def put(self, key, url, auth_token):
         """
@@ -37,9 +79,11 @@ class UploadUrlPool:
         :param str url: bucket or file URL
         :param str auth_token: authentication token
         """
+        now = time.monotonic()
         with self._lock:
-            pair = (url, auth_token)
-            self._pool[key].append(pair)
+            self._prune(now)
+            expires_at = self._expires_at.setdefault(url, now + self.max_age)
+            self._pool[key].append(_PooledUrl(url, auth_token, expires_at))
 
     def take(self, key):
         """
@@ -48,12 +92,40 @@ class UploadUrlPool:
         :param str key: bucket ID or large file ID
         :rtype: tuple
         """
+        now = time.monotonic()
         with self._lock:
-            pair_list = self._pool[key]
-            if pair_list:
-                return pair_list.pop()
-            else:
+            pooled_urls = self._pool.get(key)
+            if not pooled_urls:
+                return (None, None)
+            self._drop_expired(pooled_urls, now)
+            default_score = self._get_default_score()
+            best_index = None
+            best_score = None
+            for index in range(len(pooled_urls) - 1, -1, -1):
+                score = self._get_score(pooled_urls[index].url, default_score)
+                if best_score is None or score < best_score:
+                    best_index, best_score = index, score
+            if best_index is None:
+                del self._pool[key]
                 return (None, None)
+            pooled_url = pooled_urls.pop(best_index)
+            if not pooled_urls:
+                del self._pool[key]
+            return (pooled_url.url, pooled_url.auth_token)
+
+    def count(self, key) -> int:
+        """
+        Return the number of URLs pooled for the given key which did not age out.
+
+        :param str key: bucket ID or large file ID
+        """
+        now = time.monotonic()
+        with self._lock:
+            pooled_urls = self._pool.get(key)
+            if not pooled_urls:
+                return 0
+            self._drop_expired(pooled_urls, now)
+            return len(pooled_urls)
 
     def clear_for_key(self, key):
         """
@@ -63,7 +135,94 @@ class UploadUrlPool:
         """
         with self._lock:
             if key in self._pool:
-                del self._pool[key]
+                for pooled_url in self._pool.pop(key):
+                    self._expires_at.pop(pooled_url.url, None)
+
+    def record_success(self, url: str, duration: float, size: int) -> None:
+        """
+        Record that an upload of ``size`` bytes to the URL succeeded, taking ``duration`` seconds.
+        """
+        upload_time = duration * self.MIN_UPLOAD_SIZE / max(size, self.MIN_UPLOAD_SIZE)
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            health = self._get_health(url, now)
+            health.error_rate -= self.SMOOTHING * health.error_rate
+            health.upload_time += self.SMOOTHING * (upload_time - health.upload_time)
+
+    def record_failure(self, url: str) -> None:
+        """
+        Record that an upload to the URL failed. The URL should not be put in the pool again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            health = self._get_health(url, now)
+            health.error_rate += self.SMOOTHING * (1 - health.error_rate)
+            self._expires_at.pop(url, None)
+
+    def _drop_expired(self, pooled_urls: list[_PooledUrl], now: float) -> None:
+        if any(pooled_url.expires_at <= now for pooled_url in pooled_urls):
+            for pooled_url in pooled_urls:
+                if pooled_url.expires_at <= now:
+                    self._expires_at.pop(pooled_url.url, None)
+            pooled_urls[:] = [
+                pooled_url for pooled_url in pooled_urls if pooled_url.expires_at > now
+            ]
+
+    def _prune(self, now: float) -> None:
+        # forget the urls which were taken and never returned and the pods which are not used anymore
+        if now - self._pruned_at < self.PRUNE_INTERVAL:
+            return
+        self._pruned_at = now
+        for url in [url for url, expires_at in self._expires_at.items() if expires_at <= now]:
+            del self._expires_at[url]
+        for host in [
+            host
+            for host, health in self._health.items()
+            if health.reported_at + self.host_max_age <= now
+        ]:
+            del self._health[host]
+
+    def get_score(self, url: str) -> float:
+        """
+        Return the score of the pod of the URL, based on its error rate and upload time; lower is better.
+        """
+        with self._lock:
+            return self._get_score(url, self._get_default_score())
+
+    def _get_score(self, url: str, default_score: float) -> float:
+        health = self._health.get(self._get_host(url))
+        if health is None:
+            return default_score
+        return self._get_health_score(health)
+
+    def _get_default_score(self) -> float:
+        # pods without reports are scored as a pod with the average upload time and no errors,
+        # so that they are neither always preferred over nor always avoided in favour of the known ones
+        upload_times = [
+            health.upload_time for health in self._health.values() if health.upload_time
+        ]
+        if not upload_times:
+            return 0.0
+        return sum(upload_times) / len(upload_times)
+
+    @classmethod
+    def _get_health_score(cls, health: _HostHealth) -> float:
+        return health.upload_time * (1 + cls.ERROR_PENALTY * health.error_rate) + health.error_rate
+
+    def _get_health(self, url: str, now: float) -> _HostHealth:
+        host = self._get_host(url)
+        health = self._health.get(host)
+        if health is None:
+            health = self._health[host] = _HostHealth(now)
+        else:
+            health.reported_at = now
+        return health
+
+    @classmethod
+    def _get_host(cls, url: str) -> str:
+        return urlsplit(url).netloc
 
 
 class UrlPoolAccountInfo(AbstractAccountInfo):
@@ -103,6 +262,9 @@ class UrlPoolAccountInfo(AbstractAccountInfo):
     def take_bucket_upload_url(self, bucket_id):
         return self._bucket_uploads.take(bucket_id)
 
+    def count_bucket_upload_urls(self, bucket_id):
+        return self._bucket_uploads.count(bucket_id)
+
     # large file upload url
     def put_large_file_upload_url(self, file_id, upload_url, upload_auth_token):
         self._large_file_uploads.put(file_id, upload_url, upload_auth_token)
@@ -112,3 +274,14 @@ class UrlPoolAccountInfo(AbstractAccountInfo):
 
     def clear_large_file_upload_urls(self, file_id):
         self._large_file_uploads.clear_for_key(file_id)
+
+    def count_large_file_upload_urls(self, file_id):
+        return self._large_file_uploads.count(file_id)
+
+    def record_upload_url_success(self, upload_url, duration, size):
+        self._bucket_uploads.record_success(upload_url, duration, size)
+        self._large_file_uploads.record_success(upload_url, duration, size)
+
+    def record_upload_url_failure(self, upload_url):
+        self._bucket_uploads.record_failure(upload_url)
+        self._large_file_uploads.record_failure(upload_url)
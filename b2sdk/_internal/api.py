@@ -14,6 +14,8 @@ from collections.abc import Sequence
 from contextlib import suppress
 from typing import Generator
 
+from requests.adapters import DEFAULT_POOLSIZE
+
 from .account_info.abstract import AbstractAccountInfo
 from .account_info.exception import MissingAccountData
 from .api_config import DEFAULT_HTTP_API_CONFIG, B2HttpApiConfig
@@ -35,6 +37,7 @@ from .file_version import (
     FileVersion,
     FileVersionFactory,
 )
+from .http_stats import HttpCallStats, HttpTimingCallback
 from .large_file.services import LargeFileServices
 from .progress import AbstractProgressListener
 from .raw_api import API_VERSION as RAW_API_VERSION
@@ -131,6 +134,7 @@ class B2Api(metaclass=B2TraceMeta):
     FULL_APPLICATION_KEY_CLASS = FullApplicationKey
     DEFAULT_LIST_KEY_COUNT = 1000
     API_VERSION = RAW_API_VERSION
+    http_timing_callback: HttpTimingCallback | None = None
 
     def __init__(
         self,
@@ -176,6 +180,55 @@ class B2Api(metaclass=B2TraceMeta):
             check_download_hash=check_download_hash,
             max_download_streams_per_file=max_download_streams_per_file,
         )
+        self._configure_connection_pool()
+        if api_config.collect_http_stats:
+            self._install_http_timing_callback()
+
+    def _configure_connection_pool(self) -> None:
+        """
+        Size HTTP connection pools so that transfer threads do not discard each other's connections.
+        Called again whenever the thread pool of a transfer manager is resized.
+
+        Uploads go to many different pod hosts, so every upload thread may need a pool of its own
+        (plus the API and download hosts); the API and download hosts may be used by all
+        upload, copy and download threads at once (streams of a parallel download run
+        in the download thread pool, plus the calling thread).
+        """
+        b2_http = getattr(self.session.raw_api, 'b2_http', None)
+        if b2_http is None:
+            return
+        upload_threads = self.services.upload_manager.get_thread_pool_size()
+        transfer_threads = (
+            upload_threads
+            + self.services.copy_manager.get_thread_pool_size()
+            + self.services.download_manager.get_thread_pool_size()
+        )
+        pool_connections = self.api_config.http_pool_connections
+        if pool_connections is None:
+            pool_connections = max(DEFAULT_POOLSIZE, upload_threads + 2)
+        pool_maxsize = self.api_config.http_pool_maxsize
+        if pool_maxsize is None:
+            pool_maxsize = max(DEFAULT_POOLSIZE, transfer_threads + 1)
+        b2_http.set_connection_pool_size(pool_connections, pool_maxsize)
+
+    def _install_http_timing_callback(self) -> None:
+        b2_http = getattr(self.session.raw_api, 'b2_http', None)
+        if b2_http is None:
+            return
+        self.http_timing_callback = HttpTimingCallback()
+        b2_http.add_callback(self.http_timing_callback)
+
+    def get_http_stats(self) -> dict[str, HttpCallStats]:
+        """
+        Return timing statistics of HTTP calls made so far, by B2 API name
+        (``b2_list_file_names``, ``b2_upload_part``, ``download_file_by_name``, ...).
+
+        Statistics are only collected if ``collect_http_stats`` is enabled in :class:`~b2sdk.v3.B2HttpApiConfig`,
+        otherwise an empty dict is returned.
+        """
+        if self.http_timing_callback is None:
+            return {}
+        return self.http_timing_callback.get_stats()
 
     @property
     def account_info(self):
@@ -336,6 +389,9 @@ class B2Api(metaclass=B2TraceMeta):
         self.check_bucket_id_restrictions(bucket_id)
 
         # First, try the cache.
+        bucket_dict = self.cache.get_bucket_dict_or_none_from_bucket_id(bucket_id)
+        if bucket_dict is not None:
+            return self.BUCKET_FACTORY_CLASS.from_api_bucket_dict(self, bucket_dict)
         bucket_name = self.cache.get_bucket_name_or_none_from_bucket_id(bucket_id)
         if bucket_name is not None:
             return self.BUCKET_CLASS(self, bucket_id, name=bucket_name)
@@ -362,9 +418,14 @@ class B2Api(metaclass=B2TraceMeta):
         self.check_bucket_name_restrictions(bucket_name)
 
         # First, try the cache.
+        bucket_dict = self.cache.get_bucket_dict_or_none_from_bucket_name(bucket_name)
+        if bucket_dict is not None:
+            return self.BUCKET_FACTORY_CLASS.from_api_bucket_dict(self, bucket_dict)
         id_ = self.cache.get_bucket_id_or_none_from_bucket_name(bucket_name)
         if id_ is not None:
             return self.BUCKET_CLASS(self, id_, name=bucket_name)
+        if self.cache.is_bucket_name_missing(bucket_name):
+            raise NonExistentBucket(bucket_name)
 
         # Second, ask the service
         for bucket in self.list_buckets(bucket_name=bucket_name):
@@ -372,6 +433,7 @@ class B2Api(metaclass=B2TraceMeta):
             return bucket
 
         # There is no such bucket.
+        self.cache.save_missing_bucket_name(bucket_name)
         raise NonExistentBucket(bucket_name)
 
     def delete_bucket(self, bucket):
@@ -383,6 +445,7 @@ class B2Api(metaclass=B2TraceMeta):
         """
         account_id = self.account_info.get_account_id()
         self.session.delete_bucket(account_id, bucket.id_)
+        self.cache.remove_bucket(bucket)
 
     def list_buckets(
         self, bucket_name=None, bucket_id=None, *, use_cache: bool = False
@@ -413,7 +476,7 @@ class B2Api(metaclass=B2TraceMeta):
         if use_cache:
             cached_list = self.cache.list_bucket_names_ids()
             buckets = [
-                self.BUCKET_CLASS(self, cache_b_id, name=cached_b_name)
+                self._get_cached_bucket(cache_b_id, cached_b_name)
                 for cached_b_name, cache_b_id in cached_list
                 if (
                     (bucket_name is None or bucket_name == cached_b_name)
@@ -442,17 +505,21 @@ class B2Api(metaclass=B2TraceMeta):
             self.cache.set_bucket_name_cache(buckets)
         return buckets
 
-    def list_parts(self, file_id, start_part_number=None, batch_size=None):
+    def list_parts(self, file_id, start_part_number=None, batch_size=None, read_ahead_pages=0):
         """
         Generator that yields a :py:class:`b2sdk.v2.Part` for each of the parts that have been uploaded.
 
         :param str file_id: the ID of the large file that is not finished
         :param int start_part_number: the first part number to return; defaults to the first part
         :param int batch_size: the number of parts to fetch at a time from the server
+        :param int read_ahead_pages: how many batches to fetch in the background while the current one is being consumed
         :rtype: generator
         """
         return self.services.large_file.list_parts(
-            file_id, start_part_number=start_part_number, batch_size=batch_size
+            file_id,
+            start_part_number=start_part_number,
+            batch_size=batch_size,
+            read_ahead_pages=read_ahead_pages,
         )
 
     # delete/cancel
@@ -663,6 +730,12 @@ class B2Api(metaclass=B2TraceMeta):
 
         raise RestrictedBucket(msg)
 
+    def _get_cached_bucket(self, bucket_id: str, bucket_name: str) -> Bucket:
+        bucket_dict = self.cache.get_bucket_dict_or_none_from_bucket_id(bucket_id)
+        if bucket_dict is not None:
+            return self.BUCKET_FACTORY_CLASS.from_api_bucket_dict(self, bucket_dict)
+        return self.BUCKET_CLASS(self, bucket_id, name=bucket_name)
+
     def _populate_bucket_cache_from_key(self):
         # If the key is restricted to the bucket, pre-populate the cache with it
         try:
@@ -13,6 +13,9 @@ from typing import Callable
 
 import requests
 
+from .http_retry import CircuitBreaker, RetryBudget
+from .http_timeout import AdaptiveTimeout
+from .http_transport import AbstractHttpTransport, RequestsTransport
 from .raw_api import AbstractRawApi, B2RawHTTPApi
 
 
@@ -26,6 +29,20 @@ class B2HttpApiConfig:
         user_agent_append: str | None = None,
         _raw_api_class: type[AbstractRawApi] | None = None,
         decode_content: bool = False,
+        clock_skew_check_interval: float = 0,
+        http_pool_connections: int | None = None,
+        http_pool_maxsize: int | None = None,
+        http_transport_factory: Callable[
+            [B2HttpApiConfig], AbstractHttpTransport
+        ] = RequestsTransport,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        decorrelated_jitter: bool = False,
+        collect_http_stats: bool = False,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+        coalesce_requests: bool = False,
+        auth_token_refresh_interval: float | None = None,
+        upload_url_prefetch_count: int = 0,
     ):
         """
         A structure with params to be passed to low level API.
@@ -36,12 +53,49 @@ class B2HttpApiConfig:
         :param _raw_api_class: AbstractRawApi-compliant class
         :param decode_content: If true, the underlying http backend will try to decode encoded files when downloading,
                                based on the response headers
+        :param clock_skew_check_interval: if greater than 0, the clock skew hook checks at most one response
+                                          per that many seconds instead of every response
+        :param http_pool_connections: number of hosts to keep HTTP connection pools for;
+                                      if ``None``, B2Api sizes it from the number of upload threads
+        :param http_pool_maxsize: maximum number of connections kept open to a single host;
+                                  if ``None``, B2Api sizes it from the number of transfer threads
+        :param http_transport_factory: a callable that takes this config and returns the transport sending HTTP requests,
+                                       e.g. :class:`~b2sdk._internal.http_transport.RequestsTransport` (default)
+                                       or :class:`~b2sdk._internal.http_transport.Urllib3Transport`
+        :param retry_budget: if provided, limits HTTP retries to a fraction of successful calls;
+                             share one object between configs to have a process-wide budget
+        :param circuit_breaker: if provided, requests to endpoints that keep failing are paused;
+                                share one object between configs to share endpoint state
+        :param decorrelated_jitter: if True, use decorrelated jitter instead of plain exponential backoff between retries
+        :param collect_http_stats: if True, B2Api collects timing statistics of HTTP calls, see :meth:`b2sdk.v3.B2Api.get_http_stats`
+        :param adaptive_timeout: if provided, read timeouts of requests (except server-side copies) are derived
+                                 from the payload size and the observed throughput, within its floor and ceiling,
+                                 instead of being fixed; downloads keep their fixed read timeout as the floor
+        :param coalesce_requests: if True, identical concurrent metadata calls without side effects
+                                  (e.g. listing buckets or getting file info) share a single HTTP request
+        :param auth_token_refresh_interval: if provided, the session re-authorizes in a background thread once
+                                            its auth token is that many seconds old (tokens are valid for 24 hours),
+                                            instead of waiting for a request to fail with an expired token
+        :param upload_url_prefetch_count: number of upload URLs to keep ready, fetched in the background,
+                                          for every bucket and large file being uploaded to
         """
         self.http_session_factory = http_session_factory
         self.install_clock_skew_hook = install_clock_skew_hook
         self.user_agent_append = user_agent_append
         self.raw_api_class = _raw_api_class or self.DEFAULT_RAW_API_CLASS
         self.decode_content = decode_content
+        self.clock_skew_check_interval = clock_skew_check_interval
+        self.http_pool_connections = http_pool_connections
+        self.http_pool_maxsize = http_pool_maxsize
+        self.http_transport_factory = http_transport_factory
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
+        self.decorrelated_jitter = decorrelated_jitter
+        self.collect_http_stats = collect_http_stats
+        self.adaptive_timeout = adaptive_timeout
+        self.coalesce_requests = coalesce_requests
+        self.auth_token_refresh_interval = auth_token_refresh_interval
+        self.upload_url_prefetch_count = upload_url_prefetch_count
 
 
 DEFAULT_HTTP_API_CONFIG = B2HttpApiConfig()
@@ -18,7 +18,7 @@ import socket
 import threading
 import time
 from contextlib import contextmanager
-from random import random
+from random import random, uniform
 from typing import Any, Callable
 
 try:
@@ -27,7 +27,6 @@ except ImportError:
     from typing import Literal
 
 import requests
-from requests.adapters import HTTPAdapter
 
 from b2sdk.version import USER_AGENT
 
@@ -38,6 +37,7 @@ from .exception import (
     B2RequestTimeout,
     BadDateFormat,
     BrokenPipe,
+    CircuitBreakerOpen,
     ClockSkew,
     ConnectionReset,
     PotentialS3EndpointPassedAsRealm,
@@ -45,7 +45,15 @@ from .exception import (
     UnknownHost,
     interpret_b2_error,
 )
-from .requests import NotDecompressingResponse
+from .http_retry import CircuitBreaker, RetryBudget
+from .http_timeout import AdaptiveTimeout
+from .http_transport import (
+    AbstractHttpTransport,
+    ConnectionPoolStats,
+    NotDecompressingHTTPAdapter,  # noqa: F401
+)
+from .utils import fast_json
+from .utils.http_date import parse_imf_fixdate
 from .utils.typing import JSON
 
 LOCALE_LOCK = threading.Lock()
@@ -81,13 +89,20 @@ class ResponseContextManager:
     A context manager that closes a requests.Response when done.
     """
 
-    def __init__(self, response):
+    def __init__(self, response, on_exit: Callable[[], None] | None = None):
+        """
+        :param response: the response
+        :param on_exit: called when the context is exited
+        """
         self.response = response
+        self.on_exit = on_exit
 
     def __enter__(self):
         return self.response
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.on_exit is not None:
+            self.on_exit()
         return None
 
 
@@ -124,8 +139,42 @@ class HttpCallback:
         :param response: a response object from the requests library
         """
 
+    def post_response_read(self, method, url, headers, response, bytes_read, read_time):
+        """
+        Called after the body of a successful response has been read.
+        For streamed responses (downloads), it is called when the context manager
+        returned by :meth:`B2Http.get_content` is exited.
+        Should not raise an exception.
+
+        :param str method: one of: 'POST', 'GET', etc.
+        :param str url: the URL that was used
+        :param dict headers: the header sent with the request
+        :param response: a response object from the requests library
+        :param int bytes_read: number of bytes of the body read
+        :param float read_time: number of seconds between receiving the response headers and finishing reading the body
+        """
+
 
 class ClockSkewHook(HttpCallback):
+    """
+    Verify that the clock of the server does not differ too much from the local clock.
+
+    By default every response is checked. If ``check_interval`` is set, the check is done
+    at most once per that many seconds, and all the other responses are let through untouched.
+    """
+
+    MAX_ALLOWED_SKEW_SECONDS = 10 * 60  # ten minutes
+
+    def __init__(self, check_interval: float = 0):
+        """
+        :param check_interval: minimum number of seconds between two checks; 0 means "check every response"
+        """
+        self.check_interval = check_interval
+        self._next_check_time = 0.0
+        # The Date header has a one second resolution, so under load many consecutive
+        # responses carry exactly the same value - remember the last one parsed.
+        self._last_date = (None, None)
+
     def post_request(self, method, url, headers, response):
         """
         Raise an exception if the clock in the server is too different from the
@@ -138,34 +187,41 @@ class ClockSkewHook(HttpCallback):
         :param dict headers: the header sent with the request
         :param response: a response object from the requests library
         """
-        # Make a string that uses month numbers instead of month names
-        server_date_str = response.headers['Date']
+        if self.check_interval:
+            now = time.monotonic()
+            if now < self._next_check_time:
+                return
+            self._next_check_time = now + self.check_interval
 
-        # Convert the server time to a datetime object
-        try:
-            with setlocale('C'):
-                # "%Z" always creates naive datetimes, even though the timezone
-                # is specified. https://github.com/python/cpython/issues/76678
-                # Anyway, thankfully, HTTP/1.1 spec requires the string
-                # to always say "GMT", and provide UTC time.
-                # https://datatracker.ietf.org/doc/html/rfc2616#section-3.3.1
-                server_time = datetime.datetime.strptime(
-                    server_date_str, '%a, %d %b %Y %H:%M:%S GMT'
-                ).replace(tzinfo=datetime.timezone.utc)
-        except ValueError:
-            logger.exception('server returned date in an inappropriate format')
-            raise BadDateFormat(server_date_str)
+        server_date_str = response.headers['Date']
+        server_time = self._parse_server_date(server_date_str)
 
         # Get the local time
         local_time = datetime.datetime.now(datetime.timezone.utc)
 
         # Check the difference.
-        max_allowed = 10 * 60  # ten minutes, in seconds
         skew = local_time - server_time
         skew_seconds = skew.total_seconds()
-        if max_allowed < abs(skew_seconds):
+        if self.MAX_ALLOWED_SKEW_SECONDS < abs(skew_seconds):
             raise ClockSkew(skew_seconds)
 
+    def _parse_server_date(self, server_date_str: str) -> datetime.datetime:
+        # a tuple is replaced atomically, so no lock is needed to share it between threads
+        last_date_str, last_server_time = self._last_date
+        if server_date_str == last_date_str:
+            return last_server_time
+
+        # HTTP/1.1 spec requires the string to always say "GMT", and provide UTC time.
+        # https://datatracker.ietf.org/doc/html/rfc2616#section-3.3.1
+        try:
+            server_time = parse_imf_fixdate(server_date_str)
+        except ValueError:
+            logger.exception('server returned date in an inappropriate format')
+            raise BadDateFormat(server_date_str)
+
+        self._last_date = (server_date_str, server_time)
+        return server_time
+
 
 class B2Http:
     """
@@ -198,6 +254,7 @@ class B2Http:
     TIMEOUT = 128
     TIMEOUT_FOR_COPY = 1200  # 20 minutes as server-side copy can take time
     TIMEOUT_FOR_UPLOAD = 128
+    COPY_ENDPOINTS = ('/b2_copy_file', '/b2_copy_part')
     TRY_COUNT_DATA = 20
     TRY_COUNT_DOWNLOAD = 20
     TRY_COUNT_HEAD = 5
@@ -209,13 +266,18 @@ class B2Http:
         it easy to mock for testing.
         """
         self.user_agent = self._get_user_agent(api_config.user_agent_append)
-        self.session = api_config.http_session_factory()
-        if not api_config.decode_content:
-            self.session.adapters.clear()
-            self.session.mount('', NotDecompressingHTTPAdapter())
+        self.transport: AbstractHttpTransport = api_config.http_transport_factory(api_config)
+        self.retry_budget: RetryBudget | None = api_config.retry_budget
+        self.circuit_breaker: CircuitBreaker | None = api_config.circuit_breaker
+        self.decorrelated_jitter = api_config.decorrelated_jitter
+        self.adaptive_timeout: AdaptiveTimeout | None = api_config.adaptive_timeout
+        if api_config.http_pool_connections or api_config.http_pool_maxsize:
+            self.set_connection_pool_size(
+                api_config.http_pool_connections, api_config.http_pool_maxsize
+            )
         self.callbacks = []
         if api_config.install_clock_skew_hook:
-            self.add_callback(ClockSkewHook())
+            self.add_callback(ClockSkewHook(api_config.clock_skew_check_interval))
 
     def add_callback(self, callback):
         """
@@ -226,6 +288,39 @@ class B2Http:
         """
         self.callbacks.append(callback)
 
+    @property
+    def session(self) -> requests.Session | None:
+        """
+        The :class:`requests.Session` used by the transport, if it is based on :mod:`requests`.
+        """
+        return getattr(self.transport, 'session', None)
+
+    def set_connection_pool_size(
+        self, pool_connections: int | None = None, pool_maxsize: int | None = None
+    ) -> None:
+        """
+        Resize the connection pools of the transport.
+
+        Unless the size does not change, connections kept in the current pools are closed,
+        so this is best called before any transfer starts.
+
+        :param pool_connections: number of hosts to keep connection pools for, or ``None`` to keep the current value
+        :param pool_maxsize: number of connections to keep in the pool of a single host, or ``None`` to keep the current value
+        """
+        self.transport.set_connection_pool_size(pool_connections, pool_maxsize)
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        """
+        Return the number of connections created and requests made through the connection pools.
+        """
+        return self.transport.get_connection_pool_stats()
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self.transport.close()
+
     def request(
         self,
         method: Literal['POST', 'GET', 'HEAD'],
@@ -262,13 +357,19 @@ class B2Http:
         """
         method = method.upper()
         request_headers = {**headers, 'User-Agent': self.user_agent}
+        adaptive_timeout = self.adaptive_timeout
+        payload_size = 0
+        if _timeout is None and adaptive_timeout is not None:
+            payload_size = self._get_payload_size(data, headers)
+            _timeout = adaptive_timeout.get_read_timeout(payload_size)
 
         def do_request():
             # This may retry, so each time we need to rewind the data back to the beginning.
             if data is not None and not isinstance(data, bytes):
                 data.seek(0)
             self._run_pre_request_hooks(method, url, request_headers)
-            response = self.session.request(
+            request_start = time.perf_counter()
+            response = self.transport.request(
                 method,
                 url,
                 headers=request_headers,
@@ -277,10 +378,12 @@ class B2Http:
                 timeout=(self.CONNECTION_TIMEOUT, _timeout or self.TIMEOUT_FOR_UPLOAD),
                 stream=stream,
             )
+            if payload_size and response.status_code == 200:
+                adaptive_timeout.record_transfer(payload_size, time.perf_counter() - request_start)
             self._run_post_request_hooks(method, url, request_headers, response)
             return response
 
-        return self._translate_and_retry(do_request, try_count, params)
+        return self._translate_and_retry(do_request, try_count, params, url)
 
     def request_content_return_json(
         self,
@@ -310,22 +413,33 @@ class B2Http:
         :param data: raw bytes or a file-like object to send
         :return: decoded JSON
         """
+        request_headers = {**headers, 'Accept': 'application/json'}
         response = self.request(
             method,
             url,
-            headers={**headers, 'Accept': 'application/json'},
+            headers=request_headers,
             data=data,
             try_count=try_count,
             params=params,
             _timeout=_timeout,
         )
+        headers_received = time.perf_counter()
 
         # Decode the JSON that came back.  If we've gotten this far,
         # we know we have a status of 200 OK.  In this case, the body
         # of the response is always JSON, so we don't need to handle
         # it being something else.
         try:
-            return json.loads(response.content.decode('utf-8'))
+            content = response.content
+            self._run_post_response_read_hooks(
+                method.upper(),
+                url,
+                {**request_headers, 'User-Agent': self.user_agent},
+                response,
+                len(content),
+                time.perf_counter() - headers_received,
+            )
+            return fast_json.loads(content)
         finally:
             response.close()
 
@@ -381,7 +495,10 @@ class B2Http:
         # be good to find out by analyzing the url.
         # In the future a more generic system between raw_api and b2http
         # to indicate the timeouts should be designed.
+        # Adaptive timeouts are opt-in, so they use the url to keep the long timeout for copies only.
         timeout = self.TIMEOUT_FOR_COPY
+        if self.adaptive_timeout is not None and not url.endswith(self.COPY_ENDPOINTS):
+            timeout = None
 
         data = json.dumps(params).encode()
         return self.post_content_return_json(
@@ -420,10 +537,30 @@ class B2Http:
         :param int try_count: a number of attempts
         :return: Context manager that returns an object that supports iter_content()
         """
+        # nothing is sent, so the adaptive timeout would be just its floor, which can be too short
+        # for the first byte of a download which the server has to prepare (e.g. decrypt)
+        timeout = self.TIMEOUT
+        if self.adaptive_timeout is not None:
+            timeout = max(timeout, self.adaptive_timeout.get_read_timeout(0))
         response = self.request(
-            'GET', url, headers=headers, try_count=try_count, stream=True, _timeout=self.TIMEOUT
+            'GET', url, headers=headers, try_count=try_count, stream=True, _timeout=timeout
         )
-        return ResponseContextManager(response)
+        if not self.callbacks:
+            return ResponseContextManager(response)
+        headers_received = time.perf_counter()
+
+        def on_exit():
+            raw = getattr(response, 'raw', None)
+            self._run_post_response_read_hooks(
+                'GET',
+                url,
+                {**headers, 'User-Agent': self.user_agent},
+                response,
+                raw.tell() if raw is not None else 0,
+                time.perf_counter() - headers_received,
+            )
+
+        return ResponseContextManager(response, on_exit)
 
     def head_content(
         self,
@@ -461,6 +598,14 @@ class B2Http:
             return f'{USER_AGENT} {user_agent_append}'
         return USER_AGENT
 
+    @classmethod
+    def _get_payload_size(cls, data, headers) -> int:
+        if data is None:
+            return 0
+        if isinstance(data, bytes):
+            return len(data)
+        return int(headers.get('Content-Length', 0))
+
     def _run_pre_request_hooks(self, method, url, headers):
         for callback in self.callbacks:
             callback.pre_request(method, url, headers)
@@ -469,6 +614,10 @@ class B2Http:
         for callback in self.callbacks:
             callback.post_request(method, url, headers, response)
 
+    def _run_post_response_read_hooks(self, method, url, headers, response, bytes_read, read_time):
+        for callback in self.callbacks:
+            callback.post_response_read(method, url, headers, response, bytes_read, read_time)
+
     @classmethod
     def _translate_errors(cls, fcn, post_params=None):
         """
@@ -571,9 +720,12 @@ class B2Http:
             logger.exception('_translate_errors has intercepted an unexpected exception')
             raise UnknownError(text)
 
-    @classmethod
     def _translate_and_retry(
-        cls, fcn: Callable, try_count: int, post_params: dict[str, Any] | None = None
+        self,
+        fcn: Callable,
+        try_count: int,
+        post_params: dict[str, Any] | None = None,
+        url: str | None = None,
     ):
         """
         Try calling fcn try_count times, retrying only if
@@ -582,6 +734,7 @@ class B2Http:
         :param fcn: request function to call
         :param try_count: a number of attempts
         :param post_params: request parameters
+        :param url: the URL that will be used, to track the health of its endpoint
         """
 
         if try_count < 1:
@@ -592,10 +745,19 @@ class B2Http:
         max_wait_time = 64
         for _ in range(try_count - 1):
             try:
-                return cls._translate_errors(fcn, post_params)
+                return self._translate_errors_and_track(fcn, post_params, url)
             except B2Error as e:
                 if not e.should_retry_http():
                     raise
+                # a request stopped by the circuit breaker did not reach the service,
+                # so retrying it does not use up the budget
+                if (
+                    self.retry_budget is not None
+                    and not isinstance(e, CircuitBreakerOpen)
+                    and not self.retry_budget.try_acquire()
+                ):
+                    logger.info('Not retrying because the retry budget is spent: %s', e)
+                    raise
                 logger.debug(str(e), exc_info=True)
                 if e.retry_after_seconds is not None:
                     sleep_duration = e.retry_after_seconds
@@ -612,21 +774,41 @@ class B2Http:
                 time.sleep(sleep_duration)
 
                 # Set up wait time for the next iteration
-                wait_time *= 1.5
-                if wait_time > max_wait_time:
-                    # avoid clients synchronizing and causing a wave
-                    # of requests when connectivity is restored
-                    wait_time = max_wait_time + random()
+                if self.decorrelated_jitter:
+                    # https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+                    wait_time = min(max_wait_time, uniform(1.0, wait_time * 3))
+                else:
+                    wait_time *= 1.5
+                    if wait_time > max_wait_time:
+                        # avoid clients synchronizing and causing a wave
+                        # of requests when connectivity is restored
+                        wait_time = max_wait_time + random()
 
         # If the last try gets an exception, it will be raised.
-        return cls._translate_errors(fcn, post_params)
-
+        return self._translate_errors_and_track(fcn, post_params, url)
 
-class NotDecompressingHTTPAdapter(HTTPAdapter):
-    """
-    HTTP adapter that uses :class:`b2sdk._internal.requests.NotDecompressingResponse` instead of the default
-    :code:`requests.Response` class.
-    """
-
-    def build_response(self, req, resp):
-        return NotDecompressingResponse.from_builtin_response(super().build_response(req, resp))
+    def _translate_errors_and_track(self, fcn, post_params=None, url=None):
+        """
+        Call :meth:`_translate_errors`, unless the circuit breaker says the endpoint is down,
+        and record the outcome in the circuit breaker and the retry budget.
+        """
+        if self.circuit_breaker is None or url is None:
+            response = self._translate_errors(fcn, post_params)
+        else:
+            endpoint = self.circuit_breaker.get_endpoint(url)
+            open_time_left = self.circuit_breaker.get_open_time_left(endpoint)
+            if open_time_left:
+                raise CircuitBreakerOpen(endpoint, open_time_left)
+            try:
+                response = self._translate_errors(fcn, post_params)
+            except B2Error as e:
+                if e.should_retry_http():
+                    self.circuit_breaker.record_failure(endpoint)
+                else:
+                    # the endpoint is fine, it is the request which is not
+                    self.circuit_breaker.record_success(endpoint)
+                raise
+            self.circuit_breaker.record_success(endpoint)
+        if self.retry_budget is not None:
+            self.retry_budget.record_success()
+        return response
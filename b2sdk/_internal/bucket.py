@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import datetime as dt
 import fnmatch
+import functools
 import itertools
 import logging
 import pathlib
@@ -40,6 +41,8 @@ from .file_lock import (
 from .file_version import DownloadVersion, FileIdAndName, FileVersion
 from .filter import Filter, FilterMatcher
 from .http_constants import LIST_FILE_NAMES_MAX_LIMIT
+from .listing_plan import get_excluded_prefixes, get_skip_point, plan_listing_prefixes
+from .parallel_listing import ParallelLister, iter_pages
 from .progress import AbstractProgressListener, DoNothingProgressListener
 from .raw_api import LifecycleRule, NotificationRule, NotificationRuleResponse
 from .replication.setting import ReplicationConfiguration, ReplicationConfigurationFactory
@@ -49,6 +52,7 @@ from .transfer.emerge.write_intent import WriteIntent
 from .transfer.inbound.downloaded_file import DownloadedFile
 from .transfer.outbound.copy_source import CopySource
 from .transfer.outbound.upload_source import UploadMode, UploadSourceBytes, UploadSourceLocalFile
+from .usage import UsageAggregator, UsageStats
 from .utils import (
     B2TraceMeta,
     Sha1HexDigest,
@@ -57,6 +61,7 @@ from .utils import (
     limit_trace_arguments,
     validate_b2_file_name,
 )
+from .utils.read_ahead import read_ahead
 
 logger = logging.getLogger(__name__)
 
@@ -216,7 +221,7 @@ class Bucket(metaclass=B2TraceMeta):
         :param bool is_file_lock_enabled: specifies whether bucket should get File Lock-enabled
         """
         account_id = self.api.account_info.get_account_id()
-        return self.api.BUCKET_FACTORY_CLASS.from_api_bucket_dict(
+        bucket = self.api.BUCKET_FACTORY_CLASS.from_api_bucket_dict(
             self.api,
             self.api.session.update_bucket(
                 account_id,
@@ -232,6 +237,8 @@ class Bucket(metaclass=B2TraceMeta):
                 is_file_lock_enabled=is_file_lock_enabled,
             ),
         )
+        self.api.cache.save_bucket(bucket)
+        return bucket
 
     def cancel_large_file(self, file_id):
         """
@@ -328,47 +335,56 @@ class Bucket(metaclass=B2TraceMeta):
         )
         return response['authorizationToken']
 
-    def list_parts(self, file_id, start_part_number=None, batch_size=None):
+    def list_parts(self, file_id, start_part_number=None, batch_size=None, read_ahead_pages=0):
         """
         Get a list of all parts that have been uploaded for a given file.
 
         :param str file_id: a file ID
         :param int start_part_number: the first part number to return.  defaults to the first part.
         :param int batch_size: the number of parts to fetch at a time from the server
+        :param int read_ahead_pages: how many batches to fetch in the background while the current one is being consumed
         """
-        return self.api.list_parts(file_id, start_part_number, batch_size)
+        return self.api.list_parts(file_id, start_part_number, batch_size, read_ahead_pages)
 
     def list_file_versions(
-        self, file_name: str, fetch_count: int | None = LIST_FILE_NAMES_MAX_LIMIT
+        self,
+        file_name: str,
+        fetch_count: int | None = LIST_FILE_NAMES_MAX_LIMIT,
+        read_ahead_pages: int = 0,
+        lazy_file_versions: bool = False,
     ) -> Iterable[FileVersion]:
         """
         Lists all of the versions for a single file.
 
         :param file_name: the name of the file to list.
         :param fetch_count: how many entries to list per API call or ``None`` to use the default. Acceptable values: 1 - 10000
+        :param read_ahead_pages: how many pages to fetch in the background while the current one is being consumed
+        :param lazy_file_versions: if ``True``, yield :py:class:`b2sdk.v2.LazyFileVersion` objects, which decode
+                                   most of their attributes on first access
         :rtype: generator[b2sdk.v2.FileVersion]
         """
         if fetch_count is not None and fetch_count <= 0:
             # fetch_count equal to 0 means "use API default", which we don't want to support here
             raise ValueError('unsupported fetch_count value')
-        start_file_name = file_name
-        start_file_id = None
         session = self.api.session
-        while 1:
+
+        def fetch_page(start_file_name, start_file_id):
             response = session.list_file_versions(
                 self.id_, start_file_name, start_file_id, fetch_count, file_name
             )
+            page = list(
+                self.api.file_version_factory.from_api_response_list(
+                    response['files'], lazy=lazy_file_versions
+                )
+            )
+            return page, response['nextFileName'], response['nextFileId']
 
-            for entry in response['files']:
-                file_version = self.api.file_version_factory.from_api_response(entry)
+        for page in read_ahead(iter_pages(fetch_page, file_name), read_ahead_pages):
+            for file_version in page:
                 if file_version.file_name != file_name:
                     # All versions for the requested file name have been listed.
                     return
                 yield file_version
-            start_file_name = response['nextFileName']
-            start_file_id = response['nextFileId']
-            if start_file_name is None:
-                return
 
     def ls(
         self,
@@ -378,6 +394,9 @@ class Bucket(metaclass=B2TraceMeta):
         fetch_count: int | None = LIST_FILE_NAMES_MAX_LIMIT,
         with_wildcard: bool = False,
         filters: Sequence[Filter] = (),
+        max_workers: int = 1,
+        read_ahead_pages: int = 0,
+        lazy_file_versions: bool = False,
     ) -> Iterable[tuple[FileVersion, str]]:
         """
         Pretend that folders exist and yields the information about the files in a folder.
@@ -402,6 +421,13 @@ class Bucket(metaclass=B2TraceMeta):
                               As of 1.19.0 it can only be enabled when recursive is also enabled.
                               Also, in this mode, folder_to_list is considered to be a filename or a pattern.
         :param filters: list of filters to apply to the files returned by the server.
+        :param max_workers: the number of threads listing different ranges of file names concurrently;
+                            used only with ``recursive`` (otherwise the listing skips over folders,
+                            which is sequential by nature).  The order of the results does not change.
+        :param read_ahead_pages: how many pages to fetch in the background while the current one is being consumed;
+                                 used only with ``recursive`` and a single worker (more workers read ahead anyway)
+        :param lazy_file_versions: if ``True``, yield :py:class:`b2sdk.v2.LazyFileVersion` objects, which decode
+                                   most of their attributes on first access
         :rtype: generator[tuple[b2sdk.v2.FileVersion, str]]
         :returns: generator of (file_version, folder_name) tuples
 
@@ -414,7 +440,9 @@ class Bucket(metaclass=B2TraceMeta):
 
         # check if path points to an object instead of a folder
         if path and not with_wildcard and not path.endswith('/'):
-            file_versions = self.list_file_versions(path, 1 if latest_only else fetch_count)
+            file_versions = self.list_file_versions(
+                path, 1 if latest_only else fetch_count, lazy_file_versions=lazy_file_versions
+            )
             if latest_only:
                 file_versions = itertools.islice(file_versions, 1)
             path_pointed_to_file = False
@@ -463,77 +491,233 @@ class Bucket(metaclass=B2TraceMeta):
                 if len(parent_path) < len(prefix):
                     prefix = parent_path
 
-        # Loop until all files in the named directory have been listed.
-        # The starting point of the first list_file_names request is the
-        # prefix we're looking for.  The prefix ends with '/', which is
-        # now allowed for file names, so no file name will match exactly,
-        # but the first one after that point is the first file in that
-        # "folder".   If the first search doesn't produce enough results,
-        # then we keep calling list_file_names until we get all of the
-        # names in this "folder".
+        # Narrow the listing down to the prefixes which the names matching the wildcard
+        # and the filters can start with, e.g. 'logs/2024-0[1-3]/*.gz' -> 'logs/2024-01/',
+        # 'logs/2024-02/' and 'logs/2024-03/', and skip over the names which are excluded
+        # by the filters as a whole, e.g. 'tmp/' with an exclude filter 'tmp/*'.
+        # The prefixes are disjoint and sorted, so listing them one after another
+        # yields the files in the same order as listing the whole prefix would.
+        list_prefixes = plan_listing_prefixes(
+            prefix, folder_to_list if with_wildcard else None, filters
+        )
+        excluded_prefixes = get_excluded_prefixes(filters)
         filter_matcher = FilterMatcher(filters)
         current_dir = None
-        start_file_name = prefix
-        start_file_id = None
         session = self.api.session
-        while True:
-            if latest_only:
-                response = session.list_file_names(self.id_, start_file_name, fetch_count, prefix)
+
+        if recursive and (max_workers > 1 or read_ahead_pages > 0):
+
+            def fetch_page(list_prefix, start_file_name, start_file_id):
+                if latest_only:
+                    response = session.list_file_names(
+                        self.id_, start_file_name, fetch_count, list_prefix
+                    )
+                else:
+                    response = session.list_file_versions(
+                        self.id_, start_file_name, start_file_id, fetch_count, list_prefix
+                    )
+                page = list(
+                    self.api.file_version_factory.from_api_response_list(
+                        response['files'], lazy=lazy_file_versions
+                    )
+                )
+                next_file_name = response['nextFileName']
+                next_file_id = response.get('nextFileId')
+                if next_file_name is not None:
+                    skip_point = get_skip_point(next_file_name, excluded_prefixes)
+                    if skip_point != next_file_name:
+                        next_file_name, next_file_id = skip_point, None
+                    if next_file_name is not None and not next_file_name.startswith(list_prefix):
+                        next_file_name = None
+                return page, next_file_name, next_file_id
+
+            if max_workers > 1:
+                file_versions = itertools.chain.from_iterable(
+                    ParallelLister(functools.partial(fetch_page, list_prefix), max_workers).list(
+                        list_prefix
+                    )
+                    for list_prefix in list_prefixes
+                )
             else:
-                response = session.list_file_versions(
-                    self.id_, start_file_name, start_file_id, fetch_count, prefix
+                pages = itertools.chain.from_iterable(
+                    iter_pages(functools.partial(fetch_page, list_prefix), list_prefix)
+                    for list_prefix in list_prefixes
                 )
-            for entry in response['files']:
-                file_version = self.api.file_version_factory.from_api_response(entry)
-                if not file_version.file_name.startswith(prefix):
-                    # We're past the files we care about
-                    return
+                file_versions = itertools.chain.from_iterable(read_ahead(pages, read_ahead_pages))
+            for file_version in file_versions:
                 if with_wildcard and not fnmatch.fnmatchcase(
                     file_version.file_name, folder_to_list
                 ):
-                    # File doesn't match our wildcard rules
                     continue
+                if filter_matcher.match(file_version.file_name):
+                    yield file_version, None
+            return
 
-                if not filter_matcher.match(file_version.file_name):
-                    continue
+        # Loop until all files in the named directory have been listed.
+        # The starting point of the first list_file_names request is the
+        # prefix we're looking for.  The prefix ends with '/', which is
+        # now allowed for file names, so no file name will match exactly,
+        # but the first one after that point is the first file in that
+        # "folder".   If the first search doesn't produce enough results,
+        # then we keep calling list_file_names until we get all of the
+        # names in this "folder".
+        for list_prefix in list_prefixes:
+            start_file_name = list_prefix
+            start_file_id = None
+            if current_dir is not None:
+                # The folder the previous prefix ended in has already been yielded.
+                start_file_name = max(start_file_name, prefix + current_dir[:-1] + '0')
+            start_file_name = get_skip_point(start_file_name, excluded_prefixes)
+
+            while start_file_name is not None and start_file_name.startswith(list_prefix):
+                if latest_only:
+                    response = session.list_file_names(
+                        self.id_, start_file_name, fetch_count, list_prefix
+                    )
+                else:
+                    response = session.list_file_versions(
+                        self.id_, start_file_name, start_file_id, fetch_count, list_prefix
+                    )
+                next_file_name = response['nextFileName']
+                for file_version in self.api.file_version_factory.from_api_response_list(
+                    response['files'], lazy=lazy_file_versions
+                ):
+                    if not file_version.file_name.startswith(list_prefix):
+                        # We're past the files we care about
+                        next_file_name = None
+                        break
+                    if with_wildcard and not fnmatch.fnmatchcase(
+                        file_version.file_name, folder_to_list
+                    ):
+                        # File doesn't match our wildcard rules
+                        continue
+
+                    if not filter_matcher.match(file_version.file_name):
+                        continue
+
+                    after_prefix = file_version.file_name[len(prefix) :]
+                    # In case of wildcards, we don't care about folders at all, and it's recursive by default.
+                    if '/' not in after_prefix or recursive:
+                        # This is not a folder, so we'll print it out and
+                        # continue on.
+                        yield file_version, None
+                        current_dir = None
+                    else:
+                        # This is a folder.  If it's different than the folder
+                        # we're already in, then we can print it.  This check
+                        # is needed, because all of the files in the folder
+                        # will be in the list.
+                        folder_with_slash = after_prefix.split('/')[0] + '/'
+                        if folder_with_slash != current_dir:
+                            folder_name = prefix + folder_with_slash
+                            yield file_version, folder_name
+                            current_dir = folder_with_slash
+                if next_file_name is None:
+                    # The response says there are no more files with the prefix,
+                    # so we can move on to the next one.
+                    break
 
-                after_prefix = file_version.file_name[len(prefix) :]
-                # In case of wildcards, we don't care about folders at all, and it's recursive by default.
-                if '/' not in after_prefix or recursive:
-                    # This is not a folder, so we'll print it out and
-                    # continue on.
-                    yield file_version, None
-                    current_dir = None
+                # Now we need to set up the next search.  The response from
+                # B2 has the starting point to continue with the next file,
+                # but if we're in the middle of a "folder", we can skip ahead
+                # to the end of the folder.  The character after '/' is '0',
+                # so we'll replace the '/' with a '0' and start there.
+                #
+                # When recursive is True, current_dir is always None.
+                if current_dir is None:
+                    start_file_name = next_file_name
+                    start_file_id = response.get('nextFileId')
                 else:
-                    # This is a folder.  If it's different than the folder
-                    # we're already in, then we can print it.  This check
-                    # is needed, because all of the files in the folder
-                    # will be in the list.
-                    folder_with_slash = after_prefix.split('/')[0] + '/'
-                    if folder_with_slash != current_dir:
-                        folder_name = prefix + folder_with_slash
-                        yield file_version, folder_name
-                        current_dir = folder_with_slash
-            if response['nextFileName'] is None:
-                # The response says there are no more files in the bucket,
-                # so we can stop.
-                return
+                    start_file_name = max(
+                        next_file_name,
+                        prefix + current_dir[:-1] + '0',
+                    )
+                # Skip over the names which the filters exclude as a whole.
+                skip_point = get_skip_point(start_file_name, excluded_prefixes)
+                if skip_point != start_file_name:
+                    start_file_name, start_file_id = skip_point, None
+
+    def get_usage(
+        self,
+        folder: str = '',
+        depth: int = 0,
+        latest_only: bool = True,
+        include_hidden: bool = False,
+        include_unfinished: bool = False,
+        fetch_count: int | None = LIST_FILE_NAMES_MAX_LIMIT,
+        max_workers: int = 1,
+    ) -> dict[str, UsageStats]:
+        """
+        Count the files in a folder and sum up their sizes, for the folder and for each folder under it
+        down to the given depth.
+
+        Only the statistics are kept while the folder is listed, so memory use does not depend
+        on the number of files.
+
+        :param folder: the name of the folder to walk; must not start with "/".
+                       Empty string means the whole bucket.
+        :param depth: how many levels of folders under ``folder`` to return the statistics of,
+                      ``0`` means just the ``folder``
+        :param latest_only: when ``False`` counts all versions of files (including the ones of hidden files),
+                            when ``True``, just the most recent versions
+        :param include_hidden: if ``True``, the most recent uploaded versions of hidden files are counted too;
+                               used only with ``latest_only``
+        :param include_unfinished: if ``True``, unfinished large files are counted too, with the size
+                                   of their uploaded parts (which costs an extra API call per file)
+        :param fetch_count: how many entries to list per API call or ``None`` to use the default. Acceptable values: 1 - 10000
+        :param max_workers: the number of threads listing different ranges of file names concurrently
+        :returns: the statistics by the folder name (ending with "/", except for the empty name of the whole bucket)
+        """
+        prefix = folder
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+        aggregator = UsageAggregator(prefix, depth)
+        # hide markers and unfinished large files are only listed with all the versions
+        list_versions = not latest_only or include_hidden or include_unfinished
+        # older apivers override `ls` with a different signature
+        file_versions = (
+            file_version
+            for file_version, _ in Bucket.ls(
+                self,
+                prefix,
+                latest_only=not list_versions,
+                recursive=True,
+                fetch_count=fetch_count,
+                max_workers=max_workers,
+                lazy_file_versions=True,
+            )
+        )
 
-            # Now we need to set up the next search.  The response from
-            # B2 has the starting point to continue with the next file,
-            # but if we're in the middle of a "folder", we can skip ahead
-            # to the end of the folder.  The character after '/' is '0',
-            # so we'll replace the '/' with a '0' and start there.
-            #
-            # When recursive is True, current_dir is always None.
-            if current_dir is None:
-                start_file_name = response.get('nextFileName')
-                start_file_id = response.get('nextFileId')
-            else:
-                start_file_name = max(
-                    response['nextFileName'],
-                    prefix + current_dir[:-1] + '0',
+        current_name = None
+        counted = False
+        for file_version in file_versions:
+            if file_version.action == 'start':
+                if include_unfinished:
+                    size = sum(part.content_length for part in self.list_parts(file_version.id_))
+                    aggregator.add(file_version.file_name, size, file_version.upload_timestamp)
+                continue
+            if file_version.action != 'upload' and file_version.action != 'hide':
+                continue
+            if not latest_only:
+                if file_version.action == 'upload':
+                    aggregator.add(
+                        file_version.file_name, file_version.size, file_version.upload_timestamp
+                    )
+                continue
+            if file_version.file_name != current_name:
+                current_name = file_version.file_name
+                counted = False
+            if counted:
+                # only the most recent version of a file is counted
+                continue
+            if file_version.action == 'upload':
+                aggregator.add(
+                    file_version.file_name, file_version.size, file_version.upload_timestamp
                 )
+                counted = True
+            elif not include_hidden:
+                counted = True
+        return aggregator.get_stats()
 
     def list_unfinished_large_files(self, start_file_id=None, batch_size=None, prefix=None):
         """
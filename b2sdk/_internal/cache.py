@@ -9,7 +9,10 @@
 ######################################################################
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -48,6 +51,34 @@ class AbstractCache(metaclass=ABCMeta):
     def set_bucket_name_cache(self, buckets):
         pass
 
+    def get_bucket_dict_or_none_from_bucket_name(self, name: str) -> dict | None:
+        """
+        Return the dictionary of the bucket, as returned by ``b2_list_buckets``, or ``None`` if it is not cached.
+        """
+        return None
+
+    def get_bucket_dict_or_none_from_bucket_id(self, bucket_id: str) -> dict | None:
+        """
+        Return the dictionary of the bucket, as returned by ``b2_list_buckets``, or ``None`` if it is not cached.
+        """
+        return None
+
+    def is_bucket_name_missing(self, name: str) -> bool:
+        """
+        Return ``True`` if the bucket was recently found not to exist.
+        """
+        return False
+
+    def save_missing_bucket_name(self, name: str) -> None:
+        """
+        Remember that the bucket does not exist.
+        """
+
+    def remove_bucket(self, bucket) -> None:
+        """
+        Forget the bucket, e.g. because it was deleted.
+        """
+
     def _name_id_iterator(self, buckets):
         return ((bucket.name, bucket.id_) for bucket in buckets)
 
@@ -132,3 +163,143 @@ class AuthInfoCache(AbstractCache):
 
     def set_bucket_name_cache(self, buckets):
         self.info.refresh_entire_bucket_name_cache(self._name_id_iterator(buckets))
+
+
+class _CachedBucket:
+    __slots__ = ('id_', 'bucket_dict', 'expires_at')
+
+    def __init__(self, id_: str, bucket_dict: dict | None, expires_at: float):
+        self.id_ = id_
+        self.bucket_dict = bucket_dict
+        self.expires_at = expires_at
+
+
+class TtlBucketCache(AbstractCache):
+    """
+    A cache that stores the information in memory for a limited time,
+    including the full bucket dictionaries, so that ``b2_list_buckets`` does not have to be called again
+    to get the type, encryption, retention or replication settings of a bucket.
+
+    Names of buckets which do not exist are remembered too, for ``negative_ttl`` seconds.
+    At most ``max_buckets`` buckets (and as many missing names) are kept, the least recently used are evicted.
+    """
+
+    def __init__(self, ttl: float = 300, negative_ttl: float = 30, max_buckets: int = 10000):
+        """
+        :param ttl: time, in seconds, for which a bucket is cached
+        :param negative_ttl: time, in seconds, for which a missing bucket name is cached; ``0`` disables it
+        :param max_buckets: the maximum number of buckets in the cache
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[str, _CachedBucket] = OrderedDict()
+        self._names_by_id: dict[str, str] = {}
+        self._missing_names: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_bucket_id_or_none_from_bucket_name(self, name):
+        with self._lock:
+            cached_bucket = self._get(name)
+            return cached_bucket and cached_bucket.id_
+
+    def get_bucket_name_or_none_from_bucket_id(self, bucket_id: str) -> str | None:
+        with self._lock:
+            name = self._names_by_id.get(bucket_id)
+            if name is None or self._get(name) is None:
+                return None
+            return name
+
+    def get_bucket_name_or_none_from_allowed(self):
+        return None
+
+    def get_bucket_dict_or_none_from_bucket_name(self, name: str) -> dict | None:
+        with self._lock:
+            cached_bucket = self._get(name)
+            return cached_bucket and cached_bucket.bucket_dict
+
+    def get_bucket_dict_or_none_from_bucket_id(self, bucket_id: str) -> dict | None:
+        with self._lock:
+            name = self._names_by_id.get(bucket_id)
+            if name is None:
+                return None
+            cached_bucket = self._get(name)
+            return cached_bucket and cached_bucket.bucket_dict
+
+    def list_bucket_names_ids(self) -> list[tuple[str, str]]:
+        with self._lock:
+            now = time.monotonic()
+            return sorted(
+                (name, cached_bucket.id_)
+                for name, cached_bucket in self._buckets.items()
+                if cached_bucket.expires_at > now
+            )
+
+    def is_bucket_name_missing(self, name: str) -> bool:
+        with self._lock:
+            expires_at = self._missing_names.get(name)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._missing_names[name]
+                return False
+            return True
+
+    def save_missing_bucket_name(self, name: str) -> None:
+        if self.negative_ttl <= 0:
+            return
+        with self._lock:
+            self._remove(name)
+            self._missing_names[name] = time.monotonic() + self.negative_ttl
+            self._missing_names.move_to_end(name)
+            while len(self._missing_names) > self.max_buckets:
+                self._missing_names.popitem(last=False)
+
+    def save_bucket(self, bucket):
+        with self._lock:
+            self._save(bucket, time.monotonic() + self.ttl)
+
+    def set_bucket_name_cache(self, buckets):
+        with self._lock:
+            self._buckets.clear()
+            self._names_by_id.clear()
+            expires_at = time.monotonic() + self.ttl
+            for bucket in buckets:
+                self._save(bucket, expires_at)
+
+    def remove_bucket(self, bucket) -> None:
+        with self._lock:
+            name = self._names_by_id.get(bucket.id_, bucket.name)
+            if name is not None:
+                self._remove(name)
+
+    def _get(self, name: str) -> _CachedBucket | None:
+        cached_bucket = self._buckets.get(name)
+        if cached_bucket is None:
+            return None
+        if cached_bucket.expires_at <= time.monotonic():
+            self._remove(name)
+            return None
+        self._buckets.move_to_end(name)
+        return cached_bucket
+
+    def _save(self, bucket, expires_at: float) -> None:
+        bucket_dict = getattr(bucket, 'bucket_dict', None) or None
+        cached_bucket = self._buckets.get(bucket.name)
+        if bucket_dict is None and cached_bucket is not None and cached_bucket.id_ == bucket.id_:
+            # do not lose the details of the bucket when only its name and id are saved
+            bucket_dict = cached_bucket.bucket_dict
+        self._remove(bucket.name)
+        old_name = self._names_by_id.get(bucket.id_)
+        if old_name is not None:
+            self._remove(old_name)
+        self._missing_names.pop(bucket.name, None)
+        self._buckets[bucket.name] = _CachedBucket(bucket.id_, bucket_dict, expires_at)
+        self._names_by_id[bucket.id_] = bucket.name
+        while len(self._buckets) > self.max_buckets:
+            self._remove(next(iter(self._buckets)))
+
+    def _remove(self, name: str) -> None:
+        cached_bucket = self._buckets.pop(name, None)
+        if cached_bucket is not None and self._names_by_id.get(cached_bucket.id_) == name:
+            del self._names_by_id[cached_bucket.id_]
@@ -160,6 +160,20 @@ class BucketNotAllowed(NotAllowedByAppKeyError):
     pass
 
 
+class CircuitBreakerOpen(TransientErrorMixin, B2Error):
+    """
+    Raised instead of sending a request to an endpoint which has been failing repeatedly.
+    """
+
+    def __init__(self, endpoint, retry_after_seconds):
+        super().__init__()
+        self.endpoint = endpoint
+        self.retry_after_seconds = retry_after_seconds
+
+    def __str__(self):
+        return f'Requests to {self.endpoint} are paused after repeated failures'
+
+
 class ClockSkew(B2HttpCallbackPostRequestException):
     """
     The clock on the server differs from the local clock by too much.
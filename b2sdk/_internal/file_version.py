@@ -12,7 +12,7 @@ from __future__ import annotations
 import datetime as dt
 import re
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from .encryption.setting import EncryptionSetting, EncryptionSettingFactory
 from .file_lock import NO_RETENTION_FILE_SETTING, FileRetentionSetting, LegalHold
@@ -403,6 +403,115 @@ class FileVersion(BaseFileVersion):
         return len(self._get_upload_headers()) > self.ADVANCED_HEADERS_LIMIT
 
 
+class _LazySlot:
+    """
+    A slot of a file version which is decoded from the API response on first access.
+    """
+
+    def __init__(self, slot, decode):
+        self.slot = slot
+        self.decode = decode
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.decode(instance._file_version_dict)
+            self.slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+def _get_mod_time_millis(file_version_dict: dict) -> int:
+    file_info = file_version_dict.get('fileInfo') or {}
+    if SRC_LAST_MODIFIED_MILLIS in file_info:
+        return int(file_info[SRC_LAST_MODIFIED_MILLIS])
+    return file_version_dict.get('uploadTimestamp')
+
+
+def _get_replication_status(file_version_dict: dict) -> ReplicationStatus | None:
+    value = file_version_dict.get('replicationStatus')
+    return value and ReplicationStatus[value.upper()]
+
+
+class LazyFileVersion(FileVersion):
+    """
+    A :py:class:`b2sdk.v2.FileVersion` which decodes the API response on demand.
+
+    The id, name, size, upload timestamp and action are set when it is created, other attributes
+    (including the file info and the encryption, retention, legal hold and replication settings)
+    are decoded when first accessed, so listing many files costs little more than their
+    raw dictionaries when only these attributes are used.
+    """
+
+    __slots__ = ['_file_version_dict']
+
+    def __init__(self, api: B2Api, file_version_dict: dict, force_action: str | None = None):
+        assert (
+            file_version_dict.get('action') is None or force_action is None
+        ), 'action was provided by both info_dict and function argument'
+        self.api = api
+        self._file_version_dict = file_version_dict
+        self.id_ = file_version_dict['fileId']
+        self.file_name = file_version_dict['fileName']
+        if 'size' in file_version_dict:
+            self.size = file_version_dict['size']
+        elif 'contentLength' in file_version_dict:
+            self.size = file_version_dict['contentLength']
+        else:
+            raise ValueError('no size or contentLength')
+        self.upload_timestamp = file_version_dict.get('uploadTimestamp')
+        self.action = file_version_dict.get('action') or force_action
+
+    content_type = _LazySlot(
+        BaseFileVersion.content_type, lambda file_version_dict: file_version_dict.get('contentType')
+    )
+    content_sha1 = _LazySlot(
+        BaseFileVersion.content_sha1,
+        lambda file_version_dict: BaseFileVersion._decode_content_sha1(
+            file_version_dict.get('contentSha1')
+        )[0],
+    )
+    content_sha1_verified = _LazySlot(
+        BaseFileVersion.content_sha1_verified,
+        lambda file_version_dict: BaseFileVersion._decode_content_sha1(
+            file_version_dict.get('contentSha1')
+        )[1],
+    )
+    file_info = _LazySlot(
+        BaseFileVersion.file_info,
+        lambda file_version_dict: file_version_dict.get('fileInfo') or {},
+    )
+    mod_time_millis = _LazySlot(BaseFileVersion.mod_time_millis, _get_mod_time_millis)
+    server_side_encryption = _LazySlot(
+        BaseFileVersion.server_side_encryption, EncryptionSettingFactory.from_file_version_dict
+    )
+    file_retention = _LazySlot(
+        BaseFileVersion.file_retention, FileRetentionSetting.from_file_version_dict
+    )
+    legal_hold = _LazySlot(BaseFileVersion.legal_hold, LegalHold.from_file_version_dict)
+    replication_status = _LazySlot(BaseFileVersion.replication_status, _get_replication_status)
+    account_id = _LazySlot(
+        FileVersion.account_id, lambda file_version_dict: file_version_dict['accountId']
+    )
+    bucket_id = _LazySlot(
+        FileVersion.bucket_id, lambda file_version_dict: file_version_dict['bucketId']
+    )
+    content_md5 = _LazySlot(
+        FileVersion.content_md5, lambda file_version_dict: file_version_dict.get('contentMd5')
+    )
+
+    def _clone(self, **new_attributes: Any):
+        return FileVersion(**{**self._get_args_for_clone(), **new_attributes})
+
+    def _all_slots(self):
+        return [slot for slot in super()._all_slots() if slot != '_file_version_dict']
+
+
 class DownloadVersion(BaseFileVersion):
     """
     A structure which represents metadata of an initialized download
@@ -507,6 +616,7 @@ class FileVersionFactory:
     """
 
     FILE_VERSION_CLASS = FileVersion
+    LAZY_FILE_VERSION_CLASS: type[LazyFileVersion] | None = LazyFileVersion
 
     def __init__(self, api: B2Api):
         self.api = api
@@ -546,6 +656,50 @@ class FileVersionFactory:
         into a :py:class:`b2sdk.v2.FileVersion` object.
 
         """
+        return self._from_api_response(file_version_dict, force_action)
+
+    def from_api_response_list(
+        self, file_version_dicts: Iterable[dict], force_action=None, lazy: bool = False
+    ) -> Iterator[FileVersion]:
+        """
+        Lazily turn the API responses of a listing page into :py:class:`b2sdk.v2.FileVersion` objects.
+
+        The result is the same as calling :meth:`from_api_response` for each of them, but
+        the encryption, retention and legal hold settings, which are usually shared by many files,
+        are decoded once per distinct value (and shared by the file versions, as the settings are immutable).
+
+        With ``lazy``, :py:class:`b2sdk.v2.LazyFileVersion` objects are returned instead
+        (unless :attr:`LAZY_FILE_VERSION_CLASS` is ``None``).
+        """
+        if lazy and self.LAZY_FILE_VERSION_CLASS is not None:
+            for file_version_dict in file_version_dicts:
+                yield self.LAZY_FILE_VERSION_CLASS(self.api, file_version_dict, force_action)
+            return
+        settings_cache: dict[tuple, tuple] = {}
+        for file_version_dict in file_version_dicts:
+            yield self._from_api_response(file_version_dict, force_action, settings_cache)
+
+    @classmethod
+    def _get_settings_key(cls, file_version_dict: dict) -> tuple | None:
+        sse = file_version_dict.get('serverSideEncryption')
+        if sse is not None:
+            if sse.get('mode') == 'SSE-C':
+                return None  # the key id comes from the file info
+            sse = (sse.get('mode'), sse.get('algorithm'))
+        retention = file_version_dict.get('fileRetention')
+        if retention is not None:
+            value = retention.get('value')
+            retention = (
+                retention.get('isClientAuthorizedToRead'),
+                value and (value.get('mode'), value.get('retainUntilTimestamp')),
+            )
+        legal_hold = file_version_dict.get('legalHold')
+        if legal_hold is not None:
+            legal_hold = (legal_hold.get('isClientAuthorizedToRead'), legal_hold.get('value'))
+        # action decides whether missing lock settings are an error
+        return file_version_dict.get('action'), sse, retention, legal_hold
+
+    def _from_api_response(self, file_version_dict, force_action=None, settings_cache=None):
         assert (
             file_version_dict.get('action') is None or force_action is None
         ), 'action was provided by both info_dict and function argument'
@@ -563,10 +717,19 @@ class FileVersionFactory:
         content_sha1 = file_version_dict.get('contentSha1')
         content_md5 = file_version_dict.get('contentMd5')
         file_info = file_version_dict.get('fileInfo')
-        server_side_encryption = EncryptionSettingFactory.from_file_version_dict(file_version_dict)
-        file_retention = FileRetentionSetting.from_file_version_dict(file_version_dict)
-
-        legal_hold = LegalHold.from_file_version_dict(file_version_dict)
+        settings_key = None
+        if settings_cache is not None:
+            settings_key = self._get_settings_key(file_version_dict)
+            settings = settings_cache.get(settings_key)
+        if settings_key is None or settings is None:
+            settings = (
+                EncryptionSettingFactory.from_file_version_dict(file_version_dict),
+                FileRetentionSetting.from_file_version_dict(file_version_dict),
+                LegalHold.from_file_version_dict(file_version_dict),
+            )
+            if settings_key is not None:
+                settings_cache[settings_key] = settings
+        server_side_encryption, file_retention, legal_hold = settings
         replication_status_value = file_version_dict.get('replicationStatus')
         replication_status = (
             replication_status_value and ReplicationStatus[replication_status_value.upper()]
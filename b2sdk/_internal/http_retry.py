@@ -0,0 +1,125 @@
+######################################################################
+#
+# File: b2sdk/_internal/http_retry.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class RetryBudget:
+    """
+    A token bucket limiting HTTP retries to a fraction of successful calls.
+
+    Every successful call deposits ``retry_ratio`` tokens and every retry withdraws one,
+    so when the service is failing most calls, threads stop retrying (and piling up
+    requests on the service) once the budget is spent, instead of each of them
+    retrying up to its own ``try_count``.
+
+    A single budget is meant to be shared by all threads (and all :class:`~b2sdk._internal.b2http.B2Http`
+    objects) of the process.
+    """
+
+    def __init__(
+        self, retry_ratio: float = 0.1, max_tokens: float = 100, initial_tokens: float | None = None
+    ):
+        """
+        :param retry_ratio: number of retries allowed per successful call
+        :param max_tokens: maximum number of retries that can be saved up
+        :param initial_tokens: number of retries allowed before any call succeeds; ``max_tokens`` by default
+        """
+        self.retry_ratio = retry_ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens if initial_tokens is None else initial_tokens
+        self._lock = threading.Lock()
+        self.retries_allowed = 0
+        self.retries_denied = 0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.retry_ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Withdraw a token for a single retry.
+
+        :return: False if the budget is spent and the call should not be retried
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self.retries_denied += 1
+                return False
+            self._tokens -= 1
+            self.retries_allowed += 1
+            return True
+
+
+class _EndpointState:
+    __slots__ = ('consecutive_failures', 'open_until')
+
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint (scheme + host + port) circuit breakers shared between threads.
+
+    After ``failure_threshold`` consecutive retryable failures, the endpoint is considered down
+    for ``reset_timeout`` seconds, and requests to it fail immediately with
+    :class:`~b2sdk._internal.exception.CircuitBreakerOpen` instead of being sent.
+    Then a single probe request is let through; if it succeeds, the endpoint is
+    used normally again, otherwise it stays down for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        """
+        :param failure_threshold: number of consecutive failures opening the circuit
+        :param reset_timeout: number of seconds for which requests are not sent to an endpoint that is down
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._endpoints: dict[str, _EndpointState] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_endpoint(cls, url: str) -> str:
+        parts = urlsplit(url)
+        return f'{parts.scheme}://{parts.netloc}'
+
+    def get_open_time_left(self, endpoint: str) -> float:
+        """
+        Return the number of seconds for which requests to the endpoint should not be sent,
+        or 0 if the request may proceed.
+
+        When an open circuit lets a probe request through, it stays open for others
+        until the probe finishes or ``reset_timeout`` passes.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is None or state.consecutive_failures < self.failure_threshold:
+                return 0
+            if now < state.open_until:
+                return state.open_until - now
+            state.open_until = now + self.reset_timeout  # half-open: let this probe through
+            return 0
+
+    def record_success(self, endpoint: str) -> None:
+        with self._lock:
+            self._endpoints.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            state = self._endpoints.setdefault(endpoint, _EndpointState())
+            state.consecutive_failures += 1
+            if state.consecutive_failures >= self.failure_threshold:
+                state.open_until = time.monotonic() + self.reset_timeout
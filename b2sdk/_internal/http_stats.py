@@ -0,0 +1,190 @@
+######################################################################
+#
+# File: b2sdk/_internal/http_stats.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+from .b2http import HttpCallback
+
+_API_NAME_RE = re.compile(r'/b2api/v\d+/(b2_\w+)')
+
+DOWNLOAD_BY_NAME = 'download_file_by_name'
+OTHER = 'other'
+
+
+def get_api_name(url: str) -> str:
+    """
+    Return the name of the B2 API called by the URL, e.g. ``b2_list_file_names`` or ``b2_upload_part``.
+
+    Downloads by name do not call a named API, they are reported as ``download_file_by_name``.
+    """
+    match = _API_NAME_RE.search(url)
+    if match is not None:
+        return match.group(1)
+    if '/file/' in url:
+        return DOWNLOAD_BY_NAME
+    return OTHER
+
+
+class Histogram:
+    """
+    Counts of values falling into buckets growing in powers of two.
+
+    Bucket ``0`` holds values lower than ``unit``, bucket ``i`` holds values
+    in ``[unit * 2 ** (i - 1), unit * 2 ** i)``.
+    """
+
+    __slots__ = ('unit', 'counts', 'count', 'total', 'max')
+
+    def __init__(self, unit: float = 1):
+        self.unit = unit
+        self.counts: list[int] = []
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value: float) -> None:
+        index = int(value / self.unit).bit_length()
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: Histogram) -> None:
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return an upper bound of the given percentile (the upper edge of its bucket, capped by the maximum).
+        """
+        if not self.count:
+            return 0
+        threshold = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return min(self.max, self.unit * 2**index)
+        return self.max
+
+
+@dataclass
+class HttpCallStats:
+    """
+    Statistics of the calls to a single B2 API.
+
+    Times are in seconds; ``time_to_first_byte`` is measured from sending the request
+    (including connecting) until the response headers arrive, ``body_read_time`` from then
+    until the body is read (for streamed downloads: until the response is closed).
+    ``failed_attempts`` counts attempts answered with an error status, ``bytes_sent``
+    is taken from the ``Content-Length`` of the attempts which got a response.
+    """
+
+    attempts: int = 0
+    retries: int = 0
+    failed_attempts: int = 0
+    time_to_first_byte: Histogram = field(default_factory=lambda: Histogram(unit=0.001))
+    body_read_time: Histogram = field(default_factory=lambda: Histogram(unit=0.001))
+    bytes_sent: Histogram = field(default_factory=Histogram)
+    bytes_read: Histogram = field(default_factory=Histogram)
+
+    def merge(self, other: HttpCallStats) -> None:
+        self.attempts += other.attempts
+        self.retries += other.retries
+        self.failed_attempts += other.failed_attempts
+        self.time_to_first_byte.merge(other.time_to_first_byte)
+        self.body_read_time.merge(other.body_read_time)
+        self.bytes_sent.merge(other.bytes_sent)
+        self.bytes_read.merge(other.bytes_read)
+
+
+class HttpTimingCallback(HttpCallback):
+    """
+    Collects per B2 API timing statistics of HTTP calls.
+
+    Every thread updates statistics of its own, so recording does not take any lock;
+    :meth:`get_stats` merges them.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: list[dict[str, HttpCallStats]] = []
+        self._shards_lock = threading.Lock()
+
+    def pre_request(self, method, url, headers):
+        local = self._local
+        stats = self._get_stats(get_api_name(url))
+        stats.attempts += 1
+        # a request which is sent again right after an attempt that did not succeed is a retry
+        if getattr(local, 'pending', None) == (method, url):
+            stats.retries += 1
+        local.pending = (method, url)
+        local.request_start = time.perf_counter()
+
+    def post_request(self, method, url, headers, response):
+        local = self._local
+        stats = self._get_stats(get_api_name(url))
+        stats.time_to_first_byte.add(time.perf_counter() - local.request_start)
+        # the transport may have added Content-Length to the headers it actually sent
+        request = getattr(response, 'request', None)
+        sent_headers = getattr(request, 'headers', None) or headers
+        content_length = sent_headers.get('Content-Length')
+        if content_length is not None:
+            stats.bytes_sent.add(int(content_length))
+        if response.status_code in (200, 206):
+            local.pending = None
+        else:
+            stats.failed_attempts += 1
+
+    def post_response_read(self, method, url, headers, response, bytes_read, read_time):
+        stats = self._get_stats(get_api_name(url))
+        stats.body_read_time.add(read_time)
+        stats.bytes_read.add(bytes_read)
+
+    def get_stats(self) -> dict[str, HttpCallStats]:
+        """
+        Return statistics of all threads, by B2 API name.
+        """
+        result: dict[str, HttpCallStats] = {}
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for api_name, stats in list(shard.items()):
+                result.setdefault(api_name, HttpCallStats()).merge(stats)
+        return result
+
+    def _get_stats(self, api_name: str) -> HttpCallStats:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        stats = shard.get(api_name)
+        if stats is None:
+            stats = shard[api_name] = HttpCallStats()
+        return stats
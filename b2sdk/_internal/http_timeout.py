@@ -0,0 +1,90 @@
+######################################################################
+#
+# File: b2sdk/_internal/http_timeout.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import threading
+
+
+class AdaptiveTimeout:
+    """
+    Read timeouts of HTTP requests derived from the size of the payload and the observed throughput.
+
+    The timeout is ``min_timeout`` plus the time the payload would take to be transferred
+    at ``1 / slowdown_factor`` of the average throughput measured so far (or at ``min_throughput``,
+    if that is higher or nothing was measured yet), capped at ``max_timeout``.
+
+    Like any read timeout, it is not a deadline for the whole request, but a bound on every single
+    wait for data from the server: mostly on the time between sending the last byte of the payload
+    and receiving the first byte of the response, during which the server stores the payload.
+    So a stalled metadata call is retried after ``min_timeout`` seconds, while the server is given
+    more time to store a large upload.  Downloads keep their fixed timeout as the floor,
+    as nothing is sent to derive it from.
+
+    The average is an exponential moving average of the throughput of requests sending
+    at least ``min_sample_size`` bytes; a single object may be shared by many
+    :class:`~b2sdk._internal.b2http.B2Http` objects.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = 20,
+        max_timeout: float = 600,
+        min_throughput: float = 100 * 1000,
+        slowdown_factor: float = 10,
+        smoothing: float = 0.2,
+        min_sample_size: int = 1024 * 1024,
+    ):
+        """
+        :param min_timeout: the floor of the timeout in seconds, used for requests without payload
+        :param max_timeout: the ceiling of the timeout in seconds
+        :param min_throughput: the lowest throughput (in bytes per second) the timeouts allow for
+        :param slowdown_factor: how many times slower than average a transfer may be before it times out
+        :param smoothing: weight of the most recent measurement in the moving average
+        :param min_sample_size: size of the smallest payload (in bytes) whose throughput is measured;
+                                the time of smaller requests is dominated by latency
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError('smoothing must be in (0, 1]')
+        if min_timeout > max_timeout:
+            raise ValueError('min_timeout must not be greater than max_timeout')
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_throughput = min_throughput
+        self.slowdown_factor = slowdown_factor
+        self.smoothing = smoothing
+        self.min_sample_size = min_sample_size
+        self.throughput: float | None = None
+        self._lock = threading.Lock()
+
+    def get_read_timeout(self, payload_size: int) -> float:
+        """
+        Return the read timeout, in seconds, for a request sending ``payload_size`` bytes.
+        """
+        throughput = self.min_throughput
+        if self.throughput is not None:
+            throughput = max(throughput, self.throughput / self.slowdown_factor)
+        return min(self.max_timeout, self.min_timeout + payload_size / throughput)
+
+    def record_transfer(self, payload_size: int, duration: float) -> None:
+        """
+        Update the average throughput with a request that sent ``payload_size`` bytes in ``duration`` seconds.
+
+        The duration is that of the whole request, until the response arrives, so it includes
+        the latency and the processing on the server; the throughput measured is therefore somewhat
+        lower than that of the connection, which only makes the timeouts more lenient.
+        """
+        if payload_size < self.min_sample_size or duration <= 0:
+            return
+        throughput = payload_size / duration
+        with self._lock:
+            if self.throughput is None:
+                self.throughput = throughput
+            else:
+                self.throughput += self.smoothing * (throughput - self.throughput)
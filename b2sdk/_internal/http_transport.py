@@ -0,0 +1,379 @@
+######################################################################
+#
+# File: b2sdk/_internal/http_transport.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import io
+import json
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.certs import where as default_ca_bundle
+from requests.exceptions import ChunkedEncodingError, ContentDecodingError
+
+from .requests import NotDecompressingResponse
+
+if TYPE_CHECKING:
+    from .api_config import B2HttpApiConfig
+
+# failures to establish a connection; NameResolutionError was only added in urllib3 2.0
+_NEW_CONNECTION_ERRORS = (
+    urllib3.exceptions.NewConnectionError,
+    getattr(urllib3.exceptions, 'NameResolutionError', urllib3.exceptions.NewConnectionError),
+)
+
+
+@dataclass
+class ConnectionPoolStats:
+    """
+    Counters of the HTTP connection pools of :class:`b2sdk._internal.b2http.B2Http`.
+    """
+
+    connections_created: int = 0
+    requests: int = 0
+
+    @property
+    def connections_reused_estimate(self) -> int:
+        """
+        The number of requests which reused a connection, estimated as the number of requests
+        beyond one per connection created; urllib3 does not report reuses, and connections
+        which failed to connect also count as created.
+        """
+        return max(0, self.requests - self.connections_created)
+
+    def add_pools_of(self, pool_manager: urllib3.PoolManager) -> None:
+        """
+        Add counters of the host pools currently held by the pool manager.
+
+        When more hosts are used than the pool manager keeps pools for,
+        counters of the evicted pools are lost.
+        """
+        pools = pool_manager.pools
+        for key in pools.keys():
+            pool = pools.get(key)  # may have been evicted in the meantime
+            if pool is None:
+                continue
+            self.connections_created += pool.num_connections
+            self.requests += pool.num_requests
+
+
+class AbstractHttpTransport(metaclass=ABCMeta):
+    """
+    Sends HTTP requests on behalf of :class:`b2sdk._internal.b2http.B2Http`.
+
+    The returned response has to provide the following subset of the :class:`requests.Response` interface:
+    ``status_code``, ``headers``, ``url``, ``content``, ``iter_content()``, ``close()``, ``raw.tell()``
+    and ``request.url`` / ``request.headers``.
+
+    Failures have to be raised as :mod:`requests` exceptions, so that B2Http can translate them
+    into :class:`b2sdk._internal.exception.B2Error` and decide whether to retry.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: io.IOBase | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: tuple[float, float] | None = None,
+        stream: bool = False,
+    ):
+        """
+        Send a request and return the response.
+
+        :param method: uppercase HTTP method name
+        :param url: a URL to call
+        :param headers: headers to send
+        :param data: raw bytes or a file-like object to send
+        :param params: a dict that will be converted to the query string
+        :param timeout: a tuple of connection and read timeouts, in seconds
+        :param stream: if True, the body is not read until the caller asks for it
+        """
+
+    def set_connection_pool_size(
+        self, pool_connections: int | None = None, pool_maxsize: int | None = None
+    ) -> None:
+        """
+        Resize the connection pools.
+
+        :param pool_connections: number of hosts to keep connection pools for, or ``None`` to keep the current value
+        :param pool_maxsize: number of connections to keep in the pool of a single host, or ``None`` to keep the current value
+        """
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        """
+        Return the number of connections created and requests made through the connection pools.
+        """
+        return ConnectionPoolStats()
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+
+
+class NotDecompressingHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that uses :class:`b2sdk._internal.requests.NotDecompressingResponse` instead of the default
+    :code:`requests.Response` class.
+    """
+
+    def build_response(self, req, resp):
+        return NotDecompressingResponse.from_builtin_response(super().build_response(req, resp))
+
+
+class RequestsTransport(AbstractHttpTransport):
+    """
+    Transport based on a :class:`requests.Session` (the default one).
+    """
+
+    def __init__(self, api_config: B2HttpApiConfig):
+        self.session = api_config.http_session_factory()
+        if not api_config.decode_content:
+            self.session.adapters.clear()
+            self.session.mount('', NotDecompressingHTTPAdapter())
+        self._pool_connections = DEFAULT_POOLSIZE
+        self._pool_maxsize = DEFAULT_POOLSIZE
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: io.IOBase | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: tuple[float, float] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+
+    def set_connection_pool_size(
+        self, pool_connections: int | None = None, pool_maxsize: int | None = None
+    ) -> None:
+        pool_connections = pool_connections or self._pool_connections
+        pool_maxsize = pool_maxsize or self._pool_maxsize
+        if (pool_connections, pool_maxsize) == (self._pool_connections, self._pool_maxsize):
+            return
+        self._pool_connections, self._pool_maxsize = pool_connections, pool_maxsize
+        # the adapters are replaced with new ones of the new size (adapters of other classes
+        # than the ones of requests and b2sdk, mounted by http_session_factory, are kept);
+        # connections kept in the pools of the old ones are closed
+        for prefix, adapter in list(self.session.adapters.items()):
+            if type(adapter) not in (HTTPAdapter, NotDecompressingHTTPAdapter):
+                continue
+            self.session.mount(
+                prefix,
+                type(adapter)(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    max_retries=adapter.max_retries,
+                ),
+            )
+            adapter.close()
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        stats = ConnectionPoolStats()
+        for adapter in self._get_http_adapters():
+            stats.add_pools_of(adapter.poolmanager)
+        return stats
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _get_http_adapters(self) -> list[HTTPAdapter]:
+        return [
+            adapter
+            for adapter in self.session.adapters.values()
+            if isinstance(adapter, HTTPAdapter)
+        ]
+
+
+class Urllib3Request:
+    """
+    The part of :class:`requests.PreparedRequest` that is available on responses of :class:`Urllib3Transport`.
+    """
+
+    def __init__(self, method: str, url: str, headers: dict[str, str]):
+        self.method = method
+        self.url = url
+        self.headers = headers
+
+
+class Urllib3Response:
+    """
+    A :class:`requests.Response` look-alike wrapping a :class:`urllib3.response.HTTPResponse`.
+    """
+
+    def __init__(
+        self,
+        raw: urllib3.response.BaseHTTPResponse,
+        request: Urllib3Request,
+        decode_content: bool,
+        stream: bool,
+    ):
+        self.raw = raw
+        self.request = request
+        self.url = request.url
+        self.status_code = raw.status
+        self.headers = raw.headers
+        self._decode_content = decode_content
+        self._content: bytes | None = None if stream else raw.data
+        self._content_consumed = not stream
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self.raw.read(decode_content=self._decode_content)
+            self._content_consumed = True
+        return self._content
+
+    def json(self, **kwargs):
+        return json.loads(self.content, **kwargs)
+
+    def iter_content(self, chunk_size: int = 1):
+        if self._content is not None:
+            return iter(
+                [
+                    self._content[i : i + chunk_size]
+                    for i in range(0, len(self._content), chunk_size)
+                ]
+            )
+        return self._stream(chunk_size)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """
+        Read the next part of the body into a buffer provided by the caller.
+
+        :return: number of bytes read, 0 at the end of the body
+        """
+        try:
+            size = self.raw.readinto(buffer)
+        except urllib3.exceptions.ProtocolError as e:
+            raise ChunkedEncodingError(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.ConnectionError(e)
+        if size == 0:
+            self._content_consumed = True
+        return size
+
+    def close(self) -> None:
+        if not self._content_consumed:
+            self.raw.close()
+        self.raw.release_conn()
+
+    def _stream(self, chunk_size: int):
+        try:
+            yield from self.raw.stream(chunk_size, decode_content=self._decode_content)
+        except urllib3.exceptions.ProtocolError as e:
+            raise ChunkedEncodingError(e)
+        except urllib3.exceptions.DecodeError as e:
+            raise ContentDecodingError(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.ConnectionError(e)
+        self._content_consumed = True
+
+
+class Urllib3Transport(AbstractHttpTransport):
+    """
+    Transport talking to :mod:`urllib3` directly, skipping the per-request overhead of :mod:`requests`.
+
+    Unlike the default transport, it does not use proxy settings from the environment,
+    does not follow redirects and ignores ``http_session_factory``.
+    Its responses also support ``readinto()``.
+    """
+
+    def __init__(self, api_config: B2HttpApiConfig):
+        self.decode_content = api_config.decode_content
+        self._pool_connections = DEFAULT_POOLSIZE
+        self._pool_maxsize = DEFAULT_POOLSIZE
+        self.pool_manager = self._make_pool_manager()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: io.IOBase | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: tuple[float, float] | None = None,
+        stream: bool = False,
+    ) -> Urllib3Response:
+        if params:
+            url += ('&' if '?' in url else '?') + urlencode(params, doseq=True)
+        if timeout is not None:
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        try:
+            raw = self.pool_manager.request(
+                method,
+                url,
+                body=data,
+                headers=headers,
+                timeout=timeout,
+                preload_content=not stream,
+                decode_content=self.decode_content,
+                redirect=False,
+                retries=False,
+            )
+        except urllib3.exceptions.ConnectTimeoutError as e:
+            raise requests.ConnectTimeout(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.ReadTimeout(e)
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+        except _NEW_CONNECTION_ERRORS as e:
+            # the same shape of exception as the one requests raises when retries are exhausted
+            raise requests.ConnectionError(urllib3.exceptions.MaxRetryError(None, url, e))
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(e)
+        return Urllib3Response(
+            raw, Urllib3Request(method, url, headers), self.decode_content, stream
+        )
+
+    def set_connection_pool_size(
+        self, pool_connections: int | None = None, pool_maxsize: int | None = None
+    ) -> None:
+        pool_connections = pool_connections or self._pool_connections
+        pool_maxsize = pool_maxsize or self._pool_maxsize
+        if (pool_connections, pool_maxsize) == (self._pool_connections, self._pool_maxsize):
+            return
+        self._pool_connections, self._pool_maxsize = pool_connections, pool_maxsize
+        old_pool_manager = self.pool_manager
+        self.pool_manager = self._make_pool_manager()
+        old_pool_manager.clear()
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        stats = ConnectionPoolStats()
+        stats.add_pools_of(self.pool_manager)
+        return stats
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+
+    def _make_pool_manager(self) -> urllib3.PoolManager:
+        return urllib3.PoolManager(
+            num_pools=self._pool_connections,
+            maxsize=self._pool_maxsize,
+            ca_certs=default_ca_bundle(),
+        )
@@ -14,6 +14,7 @@ from b2sdk._internal.file_lock import FileRetentionSetting, LegalHold
 from b2sdk._internal.file_version import FileIdAndName
 from b2sdk._internal.large_file.part import PartFactory
 from b2sdk._internal.large_file.unfinished_large_file import UnfinishedLargeFile
+from b2sdk._internal.utils.read_ahead import read_ahead
 
 
 class LargeFileServices:
@@ -22,20 +23,27 @@ class LargeFileServices:
     def __init__(self, services):
         self.services = services
 
-    def list_parts(self, file_id, start_part_number=None, batch_size=None):
+    def list_parts(self, file_id, start_part_number=None, batch_size=None, read_ahead_pages=0):
         """
         Generator that yields a :py:class:`b2sdk.v2.Part` for each of the parts that have been uploaded.
 
         :param str file_id: the ID of the large file that is not finished
         :param int start_part_number: the first part number to return; defaults to the first part
         :param int batch_size: the number of parts to fetch at a time from the server
+        :param int read_ahead_pages: how many batches to fetch in the background while the current one is being consumed
         :rtype: generator
         """
-        batch_size = batch_size or 100
-        while True:
-            response = self.services.session.list_parts(file_id, start_part_number, batch_size)
+        for response in read_ahead(
+            self._list_parts_responses(file_id, start_part_number, batch_size or 100),
+            read_ahead_pages,
+        ):
             for part_dict in response['parts']:
                 yield PartFactory.from_list_parts_dict(part_dict)
+
+    def _list_parts_responses(self, file_id, start_part_number, batch_size):
+        while True:
+            response = self.services.session.list_parts(file_id, start_part_number, batch_size)
+            yield response
             start_part_number = response.get('nextPartNumber')
             if start_part_number is None:
                 break
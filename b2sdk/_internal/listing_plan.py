@@ -0,0 +1,213 @@
+######################################################################
+#
+# File: b2sdk/_internal/listing_plan.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import fnmatch
+import os.path
+from typing import Sequence
+
+from .filter import Filter, FilterMatcher, FilterType
+from .parallel_listing import _MAX_CODE_POINT, _SURROGATES
+
+#: the maximum number of prefixes a listing is split into; each of them costs at least one API call
+MAX_LISTING_PREFIXES = 32
+
+# the widest character set (in code points between its lowest and highest character) which is expanded
+_MAX_SET_SPAN = 4096
+
+_WILDCARD_CHARACTERS = '*?['
+
+
+def get_prefix_end(prefix: str) -> str | None:
+    """
+    Return the lowest file name greater than all names starting with the ``prefix``,
+    or ``None`` if there is no such name.
+    """
+    while prefix:
+        code_point = ord(prefix[-1]) + 1
+        if code_point in _SURROGATES:
+            code_point = _SURROGATES.stop
+        if code_point <= _MAX_CODE_POINT:
+            return prefix[:-1] + chr(code_point)
+        prefix = prefix[:-1]
+    return None
+
+
+def get_pattern_prefixes(pattern: str, max_prefixes: int = MAX_LISTING_PREFIXES) -> list[str]:
+    """
+    Return sorted, disjoint prefixes such that every name matching the ``fnmatch`` ``pattern``
+    starts with one of them.
+
+    Character sets (like ``[1-3]``) are expanded into a prefix per character, as long as there are
+    at most ``max_prefixes`` prefixes.  The expansion stops at the first ``*``, ``?``
+    or a set which is negated or too large.
+
+    Examples:
+      'logs/*.gz' -> ['logs/']
+      'logs/2024-0[1-3]/*.gz' -> ['logs/2024-01/', 'logs/2024-02/', 'logs/2024-03/']
+    """
+    prefixes = ['']
+    index = 0
+    while prefixes and index < len(pattern):
+        character = pattern[index]
+        if character in '*?':
+            break
+        if character == '[':
+            end = _find_set_end(pattern, index)
+            if end is not None:
+                characters = _expand_set(pattern[index : end + 1], max_prefixes // len(prefixes))
+                if characters is None:
+                    break
+                prefixes = [prefix + character for prefix in prefixes for character in characters]
+                index = end + 1
+                continue
+            # an unterminated set is matched literally
+        prefixes = [prefix + character for prefix in prefixes]
+        index += 1
+    return prefixes
+
+
+def get_filter_prefixes(
+    filters: Sequence[Filter], max_prefixes: int = MAX_LISTING_PREFIXES
+) -> list[str]:
+    """
+    Return sorted, disjoint prefixes such that every name accepted by
+    :class:`~b2sdk._internal.filter.FilterMatcher` with the ``filters`` starts with one of them.
+
+    Only when names are excluded by default (the first filter excludes ``*``), the names can be narrowed down
+    to the prefixes of the include filters; otherwise, the only prefix is the empty one.
+    """
+    matcher_filters = FilterMatcher(filters).filters
+    if not matcher_filters or matcher_filters[0] != Filter.exclude('*'):
+        return ['']
+    prefixes = [
+        prefix
+        for filter_ in matcher_filters
+        if filter_.type == FilterType.INCLUDE
+        for prefix in get_pattern_prefixes(filter_.pattern, max_prefixes)
+    ]
+    return _merge_prefixes(prefixes, max_prefixes)
+
+
+def get_excluded_prefixes(filters: Sequence[Filter]) -> list[str]:
+    """
+    Return the prefixes all names starting with which are rejected by
+    :class:`~b2sdk._internal.filter.FilterMatcher` with the ``filters``.
+
+    These are the prefixes of exclude filters like ``tmp/*`` which are not followed by any include filter.
+    """
+    matcher_filters = FilterMatcher(filters).filters
+    excluded_prefixes = []
+    for index, filter_ in enumerate(matcher_filters):
+        if (
+            filter_.type == FilterType.EXCLUDE
+            and filter_.pattern.endswith('*')
+            and not any(character in _WILDCARD_CHARACTERS for character in filter_.pattern[:-1])
+            and all(later.type == FilterType.EXCLUDE for later in matcher_filters[index + 1 :])
+        ):
+            excluded_prefixes.append(filter_.pattern[:-1])
+    return excluded_prefixes
+
+
+def get_skip_point(file_name: str, excluded_prefixes: Sequence[str]) -> str | None:
+    """
+    Return the file name to continue a listing at instead of the ``file_name``, skipping over all names
+    starting with any of the ``excluded_prefixes`` (``None`` if there are no names left).
+    """
+    skipped = True
+    while skipped and file_name is not None:
+        skipped = False
+        for prefix in excluded_prefixes:
+            if file_name.startswith(prefix):
+                file_name = get_prefix_end(prefix)
+                skipped = True
+                break
+    return file_name
+
+
+def plan_listing_prefixes(
+    prefix: str,
+    pattern: str | None = None,
+    filters: Sequence[Filter] = (),
+    max_prefixes: int = MAX_LISTING_PREFIXES,
+) -> list[str]:
+    """
+    Return sorted, disjoint prefixes to list instead of the ``prefix``, so that all the names
+    starting with the ``prefix``, matching the ``fnmatch`` ``pattern`` (if given) and accepted by the ``filters``
+    are listed, but as few others as possible.
+
+    Listing the prefixes one after another yields the names in the same order as listing the ``prefix`` would.
+    """
+    prefixes = [prefix]
+    if pattern is not None:
+        prefixes = _intersect_prefixes(
+            prefixes, get_pattern_prefixes(pattern, max_prefixes), max_prefixes
+        )
+    if filters:
+        prefixes = _intersect_prefixes(
+            prefixes, get_filter_prefixes(filters, max_prefixes), max_prefixes
+        )
+    return prefixes
+
+
+def _find_set_end(pattern: str, start: int) -> int | None:
+    # the same as in fnmatch.translate: "]" right after "[" or "[!" is a part of the set
+    index = start + 1
+    if index < len(pattern) and pattern[index] == '!':
+        index += 1
+    if index < len(pattern) and pattern[index] == ']':
+        index += 1
+    while index < len(pattern) and pattern[index] != ']':
+        index += 1
+    if index >= len(pattern):
+        return None
+    return index
+
+
+def _expand_set(set_pattern: str, max_characters: int) -> list[str] | None:
+    content = set_pattern[1:-1]
+    if content.startswith('!'):
+        return None
+    # every character matching the set is between the lowest and the highest one of its content,
+    # the matching ones are found with fnmatch itself so that the expansion follows its syntax exactly
+    code_points = range(min(map(ord, content)), max(map(ord, content)) + 1)
+    if len(code_points) > _MAX_SET_SPAN:
+        return None
+    characters = []
+    for code_point in code_points:
+        if fnmatch.fnmatchcase(chr(code_point), set_pattern):
+            if len(characters) == max_characters:
+                return None
+            characters.append(chr(code_point))
+    return characters
+
+
+def _merge_prefixes(prefixes: list[str], max_prefixes: int) -> list[str]:
+    merged: list[str] = []
+    for prefix in sorted(prefixes):
+        # names starting with a prefix are next to each other when sorted
+        if not merged or not prefix.startswith(merged[-1]):
+            merged.append(prefix)
+    if len(merged) > max_prefixes:
+        return [os.path.commonprefix(merged)]
+    return merged
+
+
+def _intersect_prefixes(
+    prefixes: list[str], other_prefixes: list[str], max_prefixes: int
+) -> list[str]:
+    intersection = []
+    for prefix in prefixes:
+        for other_prefix in other_prefixes:
+            if prefix.startswith(other_prefix):
+                intersection.append(prefix)
+            elif other_prefix.startswith(prefix):
+                intersection.append(other_prefix)
+    return _merge_prefixes(intersection, max_prefixes)
@@ -0,0 +1,220 @@
+######################################################################
+#
+# File: b2sdk/_internal/parallel_listing.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Iterator
+
+from .file_version import BaseFileVersion
+
+#: ``(start_file_name, start_file_id) -> (file_versions, next_file_name, next_file_id)``
+PageFetcher = Callable[[str, str | None], tuple[list[BaseFileVersion], str | None, str | None]]
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+
+def get_split_point(start: str, end: str | None, prefix: str = '') -> str | None:
+    """
+    Return a file name splitting the names in ``[start, end)`` into two non-empty ranges,
+    at the shallowest possible character, or ``None`` if there is no such name.
+
+    ``start`` and ``end`` (``None`` means past the last name with the ``prefix``) start with the ``prefix``.
+    """
+    if end is None:
+        index = len(prefix)
+    else:
+        index = 0
+        while index < len(start) and index < len(end) and start[index] == end[index]:
+            index += 1
+    while index < len(start):
+        code_point = ord(start[index]) + 1
+        if code_point in _SURROGATES:
+            code_point = _SURROGATES.stop
+        if code_point <= _MAX_CODE_POINT:
+            split_point = start[:index] + chr(code_point)
+            if end is None or split_point < end:
+                return split_point
+        index += 1
+    return None
+
+
+def iter_pages(
+    fetch_page: PageFetcher, start_file_name: str, start_file_id: str | None = None
+) -> Iterator[list[BaseFileVersion]]:
+    """
+    Yield the pages of a listing, one after another.
+    """
+    while True:
+        page, start_file_name, start_file_id = fetch_page(start_file_name, start_file_id)
+        yield page
+        if start_file_name is None:
+            return
+
+
+class _Range:
+    __slots__ = ('start_file_name', 'start_file_id', 'end', 'pages', 'fetching', 'done', 'next')
+
+    def __init__(self, start_file_name: str, start_file_id: str | None, end: str | None):
+        self.start_file_name = start_file_name
+        self.start_file_id = start_file_id
+        self.end = end
+        self.pages: deque[list[BaseFileVersion]] = deque()
+        self.fetching = False
+        self.done = False
+        self.next: _Range | None = None
+
+
+class ParallelLister:
+    """
+    Lists file versions with a number of threads, each fetching pages of a different range of file names,
+    and yields them in the same order as a sequential listing would.
+
+    Ranges are not planned upfront: when a thread is idle, a range being listed is split
+    after its latest page at the shallowest character which gives two non-empty ranges, so the work spreads
+    over the threads even if the names are unevenly distributed.
+    Threads fetch one page at a time, always the next page of the earliest range which has fewer than
+    :attr:`MAX_BUFFERED_PAGES` pages waiting to be consumed, so memory use stays bounded
+    and the range being consumed is never starved.
+    """
+
+    MAX_BUFFERED_PAGES = 2
+    MAX_RANGES_PER_WORKER = 4
+
+    def __init__(self, fetch_page: PageFetcher, max_workers: int):
+        """
+        :param fetch_page: a function fetching a page of file versions, starting at the given file name and id;
+                           it returns the page and the file name and id to start the next page at
+                           (``None`` if there are no more pages)
+        :param max_workers: the number of listing threads
+        """
+        self.fetch_page = fetch_page
+        self.max_workers = max_workers
+        self.max_ranges = max_workers * self.MAX_RANGES_PER_WORKER
+        self._condition = threading.Condition()
+        self._prefix = ''
+        self._head: _Range | None = None
+        self._ranges = 0
+        self._idle = 0
+        self._stopped = False
+        self._exception: BaseException | None = None
+
+    def list(
+        self, prefix: str = '', start_file_name: str | None = None
+    ) -> Iterator[BaseFileVersion]:
+        """
+        Yield file versions with names starting with the ``prefix``.
+
+        May be called only once.
+        """
+        self._head = _Range(start_file_name or prefix, None, None)
+        self._ranges = 1
+        self._prefix = prefix
+        for index in range(self.max_workers):
+            threading.Thread(target=self._work, name=f'b2sdk-list-{index}', daemon=True).start()
+        try:
+            while True:
+                page = self._get_page()
+                if page is None:
+                    return
+                yield from page
+        finally:
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+
+    def _get_page(self) -> list[BaseFileVersion] | None:
+        with self._condition:
+            while True:
+                if self._exception is not None:
+                    raise self._exception
+                range_ = self._head
+                if range_.pages:
+                    page = range_.pages.popleft()
+                    self._condition.notify_all()
+                    return page
+                if range_.done:
+                    self._head = range_.next
+                    self._ranges -= 1
+                    if self._head is None:
+                        return None
+                    continue
+                self._condition.wait()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._idle += 1
+                while not self._stopped and (range_ := self._get_range_to_fetch()) is None:
+                    if self._head is None:
+                        break
+                    self._condition.wait()
+                self._idle -= 1
+                if self._stopped or self._head is None:
+                    return
+                range_.fetching = True
+                start_file_name, start_file_id = range_.start_file_name, range_.start_file_id
+            try:
+                page, next_file_name, next_file_id = self.fetch_page(start_file_name, start_file_id)
+            except BaseException as e:
+                with self._condition:
+                    self._exception = e
+                    self._stopped = True
+                    self._condition.notify_all()
+                return
+            with self._condition:
+                self._add_page(range_, page, next_file_name, next_file_id)
+                self._condition.notify_all()
+
+    def _get_range_to_fetch(self) -> _Range | None:
+        range_ = self._head
+        while range_ is not None:
+            if (
+                not range_.done
+                and not range_.fetching
+                and len(range_.pages) < self.MAX_BUFFERED_PAGES
+            ):
+                return range_
+            range_ = range_.next
+        return None
+
+    def _add_page(
+        self,
+        range_: _Range,
+        page: list[BaseFileVersion],
+        next_file_name: str | None,
+        next_file_id: str | None,
+    ) -> None:
+        range_.fetching = False
+        end = range_.end
+        if end is not None:
+            for index, file_version in enumerate(page):
+                if file_version.file_name >= end:
+                    del page[index:]
+                    next_file_name = None
+                    break
+            if next_file_name is not None and next_file_name >= end:
+                next_file_name = None
+        if page:
+            range_.pages.append(page)
+        if next_file_name is None:
+            range_.done = True
+            return
+        range_.start_file_name = next_file_name
+        range_.start_file_id = next_file_id
+        if self._idle and self._ranges < self.max_ranges:
+            split_point = get_split_point(next_file_name, end, self._prefix)
+            if split_point is not None:
+                new_range = _Range(split_point, None, end)
+                new_range.next = range_.next
+                range_.next = new_range
+                range_.end = split_point
+                self._ranges += 1
@@ -9,7 +9,9 @@
 ######################################################################
 from __future__ import annotations
 
+import itertools
 import logging
+import operator
 import os
 import stat
 import sys
@@ -17,6 +19,7 @@ from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from typing import Iterator
 
+from ..file_version import FileVersion
 from ..utils import fix_windows_path_limit, get_file_mtime, validate_b2_file_name
 from ..utils.filesystem import validate_b2_file_name_as_path
 from .exception import (
@@ -26,7 +29,8 @@ from .exception import (
     UnableToCreateDirectory,
     UnsupportedFilename,
 )
-from .path import AbstractPath, B2Path, LocalPath
+from .listing_snapshot import ListingSnapshot
+from .path import AbstractPath, B2Path, LocalPath, StreamedFileVersions
 from .policies import DEFAULT_SCAN_MANAGER, ScanPoliciesManager
 from .report import ProgressReport
 
@@ -340,7 +344,14 @@ class B2Folder(AbstractFolder):
     Folder interface to b2.
     """
 
-    def __init__(self, bucket_name, folder_name, api):
+    def __init__(
+        self,
+        bucket_name,
+        folder_name,
+        api,
+        listing_snapshot: ListingSnapshot | None = None,
+        stream_versions: bool = False,
+    ):
         """
         :param bucket_name: a name of the bucket
         :type bucket_name: str
@@ -348,11 +359,19 @@ class B2Folder(AbstractFolder):
         :type folder_name: str
         :param api: an API object
         :type api: b2sdk._internal.api.B2Api
+        :param listing_snapshot: a store of listings to read the files from instead of listing the folder in full
+        :param stream_versions: if ``True``, the versions of each file yielded by :meth:`all_files`
+                                are read from the listing while they are being iterated over, instead
+                                of being gathered in a list first, so memory use does not grow
+                                with the number of versions of a file;
+                                they can be iterated over only once, before the next file is requested
         """
         self.bucket_name = bucket_name
         self.folder_name = folder_name
         self.bucket = api.get_bucket_by_name(bucket_name)
         self.api = api
+        self.listing_snapshot = listing_snapshot
+        self.stream_versions = stream_versions
         self.prefix = self.folder_name
         if self.prefix and self.prefix[-1] != '/':
             self.prefix += '/'
@@ -365,14 +384,27 @@ class B2Folder(AbstractFolder):
         """
         Yield all files.
         """
-        current_name = None
+        file_versions = self._get_included_file_versions(policies_manager)
+        # the versions of a file are next to each other in the listing, newest first
+        for file_name, group in itertools.groupby(file_versions, key=operator.itemgetter(0)):
+            versions = (file_version for _, file_version in group)
+            if self.stream_versions:
+                selected_version = next(versions)
+                all_versions = StreamedFileVersions(itertools.chain([selected_version], versions))
+            else:
+                all_versions = list(versions)
+                selected_version = all_versions[0]
+            yield B2Path(
+                relative_path=file_name,
+                selected_version=selected_version,
+                all_versions=all_versions,
+            )
+
+    def _get_included_file_versions(
+        self, policies_manager: ScanPoliciesManager
+    ) -> Iterator[tuple[str, FileVersion]]:
         last_ignored_dir = None
-        current_versions = []
-        current_file_version = None
         for file_version in self.get_file_versions():
-            if current_file_version is None:
-                current_file_version = file_version
-
             assert file_version.file_name.startswith(self.prefix)
             if file_version.action == 'start':
                 continue
@@ -393,29 +425,17 @@ class B2Folder(AbstractFolder):
 
             self._validate_file_name(file_name)
 
-            if current_name != file_name and current_name is not None and current_versions:
-                yield B2Path(
-                    relative_path=current_name,
-                    selected_version=current_versions[0],
-                    all_versions=current_versions,
-                )
-                current_versions = []
-
-            current_name = file_name
-            current_versions.append(file_version)
-
-        if current_name is not None and current_versions:
-            yield B2Path(
-                relative_path=current_name,
-                selected_version=current_versions[0],
-                all_versions=current_versions,
-            )
+            yield file_name, file_version
 
     def get_file_versions(self):
+        if self.listing_snapshot is not None:
+            yield from self.listing_snapshot.list_file_versions(self.bucket, self.prefix)
+            return
         for file_version, _ in self.bucket.ls(
             self.folder_name,
             latest_only=False,
             recursive=True,
+            lazy_file_versions=True,
         ):
             yield file_version
 
@@ -0,0 +1,271 @@
+######################################################################
+#
+# File: b2sdk/_internal/scan/listing_snapshot.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Iterator
+
+from ..file_version import FileVersion
+from ..http_constants import LIST_FILE_NAMES_MAX_LIMIT
+from ..listing_plan import get_prefix_end
+from ..utils import fast_json
+
+if TYPE_CHECKING:
+    from ..bucket import Bucket
+
+logger = logging.getLogger(__name__)
+
+
+class ListingSnapshot:
+    """
+    Store the listings of all file versions under prefixes of buckets in an `sqlite3 <https://www.sqlite.org>`_
+    database, so that scanning a mostly unchanged bucket again does not list it all over again.
+
+    A snapshot is listed in full when it is first used and when it gets older than ``max_age``.
+    In between, only the ranges of names which were invalidated (see :meth:`invalidate`) are listed again.
+    :class:`~b2sdk.v3.Synchronizer` invalidates the names it changes in a destination
+    :class:`~b2sdk.v3.B2Folder` which uses a snapshot.  Changes made by anyone else are not seen
+    until the snapshot expires, so ``max_age`` should be chosen according to how the bucket is used.
+    """
+
+    JOURNAL_MODE = 'WAL'
+    DEFAULT_MAX_AGE = 60 * 60
+    READ_BATCH_SIZE = 1000
+
+    def __init__(self, file_name: str, max_age: float | None = DEFAULT_MAX_AGE):
+        """
+        :param file_name: the sqlite file to use
+        :param max_age: how many seconds a snapshot is used for before it is listed in full again,
+                        ``None`` means that only the invalidated ranges are ever listed again
+        """
+        self.filename = file_name
+        self.max_age = max_age
+        self.thread_local = threading.local()
+        with self._get_connection() as conn:
+            self._create_tables(conn)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Connections to sqlite cannot be shared across threads.
+        """
+        try:
+            return self.thread_local.connection
+        except AttributeError:
+            self.thread_local.connection = self._connect()
+            return self.thread_local.connection
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.filename, isolation_level='EXCLUSIVE')
+        if self.JOURNAL_MODE is not None:
+            conn.execute(f'PRAGMA journal_mode={self.JOURNAL_MODE};')
+        return conn
+
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS
+            snapshot (
+                snapshot_id INTEGER PRIMARY KEY,
+                bucket_id TEXT NOT NULL,
+                prefix TEXT NOT NULL,
+                listed_at REAL NOT NULL,
+                UNIQUE (bucket_id, prefix)
+            );
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS
+            snapshot_file (
+                snapshot_id INTEGER NOT NULL,
+                file_name TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                file_version TEXT NOT NULL,
+                PRIMARY KEY (snapshot_id, file_name, position)
+            ) WITHOUT ROWID;
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS
+            snapshot_invalid_prefix (
+                snapshot_id INTEGER NOT NULL,
+                prefix TEXT NOT NULL,
+                PRIMARY KEY (snapshot_id, prefix)
+            );
+            """
+        )
+
+    def list_file_versions(self, bucket: Bucket, prefix: str = '') -> Iterator[FileVersion]:
+        """
+        Yield all versions of all files with names starting with the ``prefix``, in the order
+        in which :meth:`b2sdk.v3.Bucket.ls` yields them, refreshing the snapshot first.
+
+        :param bucket: the bucket to list
+        :param prefix: the prefix of the names of the files to list
+        """
+        snapshot_id = self._refresh(bucket, prefix)
+        conn = self._get_connection()
+        file_version_factory = bucket.api.file_version_factory
+        # the rows are read in batches, without keeping a read transaction open between them,
+        # so that the snapshot can be invalidated while its files are being consumed
+        file_name, position = '', -1
+        while True:
+            rows = conn.execute(
+                """
+                SELECT file_name, position, file_version FROM snapshot_file
+                WHERE snapshot_id = ? AND (file_name > ? OR (file_name = ? AND position > ?))
+                ORDER BY file_name, position
+                LIMIT ?;
+                """,
+                (snapshot_id, file_name, file_name, position, self.READ_BATCH_SIZE),
+            ).fetchall()
+            if not rows:
+                return
+            file_name, position, _ = rows[-1]
+            yield from file_version_factory.from_api_response_list(
+                (fast_json.loads(row[2]) for row in rows), lazy=True
+            )
+
+    def invalidate(self, bucket_id: str, file_name: str) -> None:
+        """
+        Make the snapshots of the bucket list the files with names starting with ``file_name`` again when used next.
+
+        :param bucket_id: the id of the bucket
+        :param file_name: the name of a file which was changed
+        """
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO snapshot_invalid_prefix (snapshot_id, prefix)
+                SELECT snapshot_id, ? FROM snapshot
+                WHERE bucket_id = ? AND substr(?, 1, length(prefix)) = prefix;
+                """,
+                (file_name, bucket_id, file_name),
+            )
+
+    def clear(self) -> None:
+        """
+        Remove all snapshots.
+        """
+        with self._get_connection() as conn:
+            conn.execute('DELETE FROM snapshot_invalid_prefix;')
+            conn.execute('DELETE FROM snapshot_file;')
+            conn.execute('DELETE FROM snapshot;')
+
+    def _refresh(self, bucket: Bucket, prefix: str) -> int:
+        conn = self._get_connection()
+        with conn:
+            # the write lock is taken right away, so that no other process creates the same snapshot meanwhile
+            conn.execute('BEGIN IMMEDIATE;')
+            row = conn.execute(
+                'SELECT snapshot_id, listed_at FROM snapshot WHERE bucket_id = ? AND prefix = ?;',
+                (bucket.id_, prefix),
+            ).fetchone()
+            now = time.time()
+            if row is None:
+                snapshot_id = conn.execute(
+                    'INSERT INTO snapshot (bucket_id, prefix, listed_at) VALUES (?, ?, ?);',
+                    (bucket.id_, prefix, now),
+                ).lastrowid
+                invalid_prefixes = [prefix]
+            elif self.max_age is not None and row[1] + self.max_age < now:
+                snapshot_id = row[0]
+                conn.execute(
+                    'UPDATE snapshot SET listed_at = ? WHERE snapshot_id = ?;', (now, snapshot_id)
+                )
+                invalid_prefixes = [prefix]
+            else:
+                snapshot_id = row[0]
+                invalid_prefixes = self._get_invalid_prefixes(conn, snapshot_id)
+            conn.execute(
+                'DELETE FROM snapshot_invalid_prefix WHERE snapshot_id = ?;', (snapshot_id,)
+            )
+        # listing can take long, so it is not done in a transaction, which would lock out everyone else
+        for index, invalid_prefix in enumerate(invalid_prefixes):
+            logger.debug('listing %r in bucket %s again', invalid_prefix, bucket.id_)
+            try:
+                self._list(bucket, snapshot_id, invalid_prefix)
+            except BaseException:
+                # whatever was not listed is listed when the snapshot is used next
+                with conn:
+                    conn.executemany(
+                        'INSERT OR IGNORE INTO snapshot_invalid_prefix (snapshot_id, prefix) VALUES (?, ?);',
+                        ((snapshot_id, prefix_) for prefix_ in invalid_prefixes[index:]),
+                    )
+                raise
+        return snapshot_id
+
+    @classmethod
+    def _get_invalid_prefixes(cls, conn: sqlite3.Connection, snapshot_id: int) -> list[str]:
+        invalid_prefixes: list[str] = []
+        for (prefix,) in conn.execute(
+            'SELECT prefix FROM snapshot_invalid_prefix WHERE snapshot_id = ? ORDER BY prefix;',
+            (snapshot_id,),
+        ):
+            # names starting with a prefix are next to each other when sorted
+            if not invalid_prefixes or not prefix.startswith(invalid_prefixes[-1]):
+                invalid_prefixes.append(prefix)
+        return invalid_prefixes
+
+    def _list(self, bucket: Bucket, snapshot_id: int, prefix: str) -> None:
+        """
+        List the files with names starting with the ``prefix`` again, replacing their rows a page at a time,
+        each in a short transaction of its own.
+        """
+        conn = self._get_connection()
+        end = get_prefix_end(prefix)
+        # the new rows get positions after the ones of all the old rows, so that the old rows can be told apart
+        # (and deleted) even when versions of a file are split between pages
+        (max_position,) = conn.execute(
+            'SELECT MAX(position) FROM snapshot_file WHERE snapshot_id = ?;', (snapshot_id,)
+        ).fetchone()
+        first_position = position = 0 if max_position is None else max_position + 1
+        session = bucket.api.session
+        start_file_name, start_file_id = prefix, None
+        while True:
+            response = session.list_file_versions(
+                bucket.id_, start_file_name, start_file_id, LIST_FILE_NAMES_MAX_LIMIT, prefix
+            )
+            next_file_name, next_file_id = response['nextFileName'], response.get('nextFileId')
+            # the old rows of the names up to where the next page starts are replaced
+            end_file_name = end if next_file_name is None else next_file_name
+            with conn:
+                if end_file_name is None:
+                    conn.execute(
+                        'DELETE FROM snapshot_file WHERE snapshot_id = ? AND position < ? AND file_name >= ?;',
+                        (snapshot_id, first_position, start_file_name),
+                    )
+                else:
+                    conn.execute(
+                        'DELETE FROM snapshot_file '
+                        'WHERE snapshot_id = ? AND position < ? AND file_name >= ? AND file_name < ?;',
+                        (snapshot_id, first_position, start_file_name, end_file_name),
+                    )
+                conn.executemany(
+                    'INSERT INTO snapshot_file (snapshot_id, file_name, position, file_version) VALUES (?, ?, ?, ?);',
+                    (
+                        (
+                            snapshot_id,
+                            file_version_dict['fileName'],
+                            position,
+                            json.dumps(file_version_dict),
+                        )
+                        for position, file_version_dict in enumerate(response['files'], position)
+                    ),
+                )
+            position += len(response['files'])
+            start_file_name, start_file_id = next_file_name, next_file_id
+            if start_file_name is None:
+                return
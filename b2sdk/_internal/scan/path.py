@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from ..file_version import FileVersion
 
@@ -51,11 +52,32 @@ class LocalPath(AbstractPath):
         )
 
 
+class StreamedFileVersions:
+    """
+    The versions of a file, newest first, which are read from a listing while being iterated over,
+    so they can be iterated over only once.
+    """
+
+    __slots__ = ['_file_versions']
+
+    def __init__(self, file_versions: Iterator[FileVersion]):
+        self._file_versions = file_versions
+
+    def __iter__(self) -> Iterator[FileVersion]:
+        if self._file_versions is None:
+            raise RuntimeError('streamed file versions can be iterated over only once')
+        file_versions, self._file_versions = self._file_versions, None
+        return file_versions
+
+
 class B2Path(AbstractPath):
     __slots__ = ['relative_path', 'selected_version', 'all_versions']
 
     def __init__(
-        self, relative_path: str, selected_version: FileVersion, all_versions: list[FileVersion]
+        self,
+        relative_path: str,
+        selected_version: FileVersion,
+        all_versions: list[FileVersion] | StreamedFileVersions,
     ):
         self.selected_version = selected_version
         self.all_versions = all_versions
@@ -73,16 +95,30 @@ class B2Path(AbstractPath):
         return self.selected_version.size
 
     def __repr__(self):
-        return '{}({}, [{}])'.format(
+        # streamed versions would be consumed by iterating over them
+        if isinstance(self.all_versions, StreamedFileVersions):
+            versions, more = [self.selected_version], ', ...'
+        else:
+            versions, more = self.all_versions, ''
+        return '{}({}, [{}{}])'.format(
             self.__class__.__name__,
             self.relative_path,
             ', '.join(
                 f'({repr(fv.id_)}, {repr(fv.mod_time_millis)}, {repr(fv.action)})'
-                for fv in self.all_versions
+                for fv in versions
             ),
+            more,
         )
 
     def __eq__(self, other):
+        if isinstance(self.all_versions, StreamedFileVersions) or isinstance(
+            other.all_versions, StreamedFileVersions
+        ):
+            # streamed versions would be consumed by comparing them, so only the selected ones are compared
+            return (
+                self.relative_path == other.relative_path
+                and self.selected_version == other.selected_version
+            )
         return (
             self.relative_path == other.relative_path
             and self.selected_version == other.selected_version
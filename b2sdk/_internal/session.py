@@ -9,7 +9,11 @@
 ######################################################################
 from __future__ import annotations
 
+import collections
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, unique
 from functools import partial
 from typing import Any
@@ -21,10 +25,11 @@ from b2sdk._internal.api_config import DEFAULT_HTTP_API_CONFIG, B2HttpApiConfig
 from b2sdk._internal.b2http import B2Http
 from b2sdk._internal.cache import AbstractCache, AuthInfoCache, DummyCache
 from b2sdk._internal.encryption.setting import EncryptionSetting
-from b2sdk._internal.exception import InvalidAuthToken, Unauthorized
+from b2sdk._internal.exception import B2Error, InvalidAuthToken, Unauthorized
 from b2sdk._internal.file_lock import BucketRetentionSetting, FileRetentionSetting, LegalHold
 from b2sdk._internal.raw_api import ALL_CAPABILITIES, REALM_URLS, LifecycleRule
 from b2sdk._internal.replication.setting import ReplicationConfiguration
+from b2sdk._internal.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +50,8 @@ class B2Session:
 
     SQLITE_ACCOUNT_INFO_CLASS = staticmethod(SqliteAccountInfo)
     B2HTTP_CLASS = staticmethod(B2Http)
+    AUTH_REFRESH_RETRY_DELAY = 60
+    UPLOAD_URL_PREFETCH_THREADS = 2
 
     def __init__(
         self,
@@ -82,6 +89,19 @@ class B2Session:
 
         self.account_info = account_info
         self.cache = cache
+        self.single_flight = SingleFlight() if api_config.coalesce_requests else None
+        self.auth_token_refresh_interval = api_config.auth_token_refresh_interval
+        self._auth_time: float | None = None
+        self._auth_lock = threading.Lock()
+        self._auth_refresh_thread: threading.Thread | None = None
+        self._reauthorization = SingleFlight()
+        self.proactive_auth_refreshes = 0
+        self.reactive_auth_refreshes = 0
+        self.upload_url_prefetch_count = api_config.upload_url_prefetch_count
+        self._upload_url_prefetch_lock = threading.Lock()
+        self._upload_urls_prefetching: collections.Counter = collections.Counter()
+        self._upload_urls_cleared: set[str] = set()
+        self._upload_url_prefetch_executor: ThreadPoolExecutor | None = None
         self._token_callbacks = {
             TokenType.API: self._api_token_callback,
             TokenType.API_TOKEN_ONLY: self._api_token_only_callback,
@@ -94,11 +114,15 @@ class B2Session:
         Perform automatic account authorization, retrieving all account data
         from account info object passed during initialization.
         """
+        return self._authorize_automatically()
+
+    def _authorize_automatically(self, refresh: bool = False) -> bool:
         try:
-            self.authorize_account(
+            self._authorize_account(
                 self.account_info.get_realm(),
                 self.account_info.get_application_key_id(),
                 self.account_info.get_application_key(),
+                refresh=refresh,
             )
         except MissingAccountData:
             return False
@@ -112,9 +136,28 @@ class B2Session:
         :param str application_key_id: :term:`application key ID`
         :param str application_key: user's :term:`application key`
         """
+        self._authorize_account(realm, application_key_id, application_key)
+
+    def _authorize_account(self, realm, application_key_id, application_key, refresh=False):
+        """
+        :param refresh: whether the authorization only renews the auth token; if the rest of
+                        the auth data is unchanged, only the token is replaced, so that the cached
+                        buckets and upload URLs are kept
+        """
         # Authorize
+        auth_time = time.monotonic()
         realm_url = REALM_URLS.get(realm, realm)
         response = self.raw_api.authorize_account(realm_url, application_key_id, application_key)
+
+        if not (
+            refresh
+            and self._is_same_auth_data(response, realm, application_key_id)
+            and self.account_info.update_auth_token(response['authorizationToken'])
+        ):
+            self._store_auth_data(response, realm, application_key_id, application_key)
+        self._auth_time = auth_time
+
+    def _store_auth_data(self, response, realm, application_key_id, application_key):
         account_id = response['accountId']
         storage_api_info = response['apiInfo']['storageApi']
 
@@ -139,14 +182,42 @@ class B2Session:
             application_key_id=application_key_id,
         )
 
+    def _is_same_auth_data(self, response, realm, application_key_id) -> bool:
+        account_info = self.account_info
+        storage_api_info = response['apiInfo']['storageApi']
+        try:
+            return (
+                account_info.is_same_account(response['accountId'], realm)
+                and account_info.get_application_key_id() == application_key_id
+                and account_info.get_api_url() == storage_api_info['apiUrl']
+                and account_info.get_download_url() == storage_api_info['downloadUrl']
+                and account_info.get_s3_api_url() == storage_api_info['s3ApiUrl']
+            )
+        except MissingAccountData:
+            return False
+
     def _construct_allowed_dict(self, storage_api_info):
         # `allowed` object has been deprecated in the v3 of the API, but we still
         # construct it artificially to avoid changes in all the reliant parts.
 
         return storage_api_info['allowed']
 
+    def close(self) -> None:
+        """
+        Shut down the threads prefetching upload URLs, without waiting for the prefetches
+        already started.
+
+        Upload URLs are prefetched again by the next uploads.
+        """
+        with self._upload_url_prefetch_lock:
+            executor, self._upload_url_prefetch_executor = self._upload_url_prefetch_executor, None
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def cancel_large_file(self, file_id):
-        return self._wrap_default_token(self.raw_api.cancel_large_file, file_id)
+        response = self._wrap_default_token(self.raw_api.cancel_large_file, file_id)
+        self._clear_large_file_upload_urls(file_id)
+        return response
 
     def create_bucket(
         self,
@@ -212,7 +283,11 @@ class B2Session:
         )
 
     def finish_large_file(self, file_id, part_sha1_array):
-        return self._wrap_default_token(self.raw_api.finish_large_file, file_id, part_sha1_array)
+        response = self._wrap_default_token(
+            self.raw_api.finish_large_file, file_id, part_sha1_array
+        )
+        self._clear_large_file_upload_urls(file_id)
+        return response
 
     def get_download_authorization(self, bucket_id, file_name_prefix, valid_duration_in_seconds):
         return self._wrap_default_token(
@@ -223,10 +298,10 @@ class B2Session:
         )
 
     def get_file_info_by_id(self, file_id: str) -> dict[str, Any]:
-        return self._wrap_default_token(self.raw_api.get_file_info_by_id, file_id)
+        return self._wrap_idempotent(self.raw_api.get_file_info_by_id, file_id)
 
     def get_file_info_by_name(self, bucket_name: str, file_name: str) -> dict[str, Any]:
-        return self._wrap_default_token(self.raw_api.get_file_info_by_name, bucket_name, file_name)
+        return self._wrap_idempotent(self.raw_api.get_file_info_by_name, bucket_name, file_name)
 
     def get_upload_url(self, bucket_id):
         return self._wrap_default_token(self.raw_api.get_upload_url, bucket_id)
@@ -238,7 +313,7 @@ class B2Session:
         return self._wrap_default_token(self.raw_api.hide_file, bucket_id, file_name)
 
     def list_buckets(self, account_id, bucket_id=None, bucket_name=None):
-        return self._wrap_default_token(
+        return self._wrap_idempotent(
             self.raw_api.list_buckets,
             account_id,
             bucket_id=bucket_id,
@@ -466,6 +541,18 @@ class B2Session:
     def _wrap_default_token(self, raw_api_method, *args, **kwargs):
         return self._wrap_token(raw_api_method, TokenType.API, *args, **kwargs)
 
+    def _wrap_idempotent(self, raw_api_method, *args, **kwargs):
+        """
+        Like :meth:`_wrap_default_token`, but for calls without side effects, which
+        (if enabled in the api config) are coalesced with identical calls in flight.
+        """
+        if self.single_flight is None:
+            return self._wrap_default_token(raw_api_method, *args, **kwargs)
+        key = (raw_api_method, args, tuple(sorted(kwargs.items())))
+        return self.single_flight.do(
+            key, partial(self._wrap_default_token, raw_api_method, *args, **kwargs)
+        )
+
     def _wrap_token(self, raw_api_method, token_type, *args, **kwargs):
         callback = self._token_callbacks[token_type]
         partial_callback = partial(callback, raw_api_method, *args, **kwargs)
@@ -482,10 +569,12 @@ class B2Session:
         return raw_api_method(account_auth_token, *args, **kwargs)
 
     def _execute_with_auth_retry(self, callback, first_attempt: bool = True):
+        if first_attempt and self.auth_token_refresh_interval is not None:
+            self._refresh_auth_token_if_old()
         try:
             return callback()
         except InvalidAuthToken:
-            if first_attempt and self.authorize_automatically():
+            if first_attempt and self._reauthorize():
                 return self._execute_with_auth_retry(callback, first_attempt=False)
             raise
         except Unauthorized as exc:
@@ -493,10 +582,65 @@ class B2Session:
             # with a 401 status code, which may or may not be related to expired
             # token, thus we also try to re-authorize if explicit `unauthorized`
             # code is missing
-            if not exc.code and first_attempt and self.authorize_automatically():
+            if not exc.code and first_attempt and self._reauthorize():
                 return self._execute_with_auth_retry(callback, first_attempt=False)
             raise self._add_app_key_info_to_unauthorized(exc)
 
+    def _reauthorize(self) -> bool:
+        """
+        Re-authorize after a request failed because of the auth token.
+
+        Threads failing at the same time share a single authorization.
+        """
+        return self._reauthorization.do('authorize', self._reauthorize_after_failure)
+
+    def _reauthorize_after_failure(self) -> bool:
+        # only the thread which actually re-authorizes gets here
+        with self._auth_lock:
+            self.reactive_auth_refreshes += 1
+        return self._authorize_automatically(refresh=True)
+
+    def _refresh_auth_token_if_old(self):
+        """
+        Start re-authorizing in a background thread if the auth token is older than
+        ``auth_token_refresh_interval``; meanwhile, requests keep using the current token.
+
+        The age of a token restored from the account info is not known, so it is
+        only refreshed after the session gets a new one.
+        """
+        auth_time = self._auth_time
+        if auth_time is None or time.monotonic() - auth_time < self.auth_token_refresh_interval:
+            return
+        with self._auth_lock:
+            if self._auth_refresh_thread is not None:
+                return
+            self._auth_refresh_thread = threading.Thread(
+                target=self._refresh_auth_token, name='b2sdk-auth-refresh', daemon=True
+            )
+            self._auth_refresh_thread.start()
+
+    def _refresh_auth_token(self):
+        try:
+            if not self._reauthorization.do('authorize', self._refresh_auth_token_in_advance):
+                self._auth_time = None  # cannot re-authorize without the application key
+        except Exception:
+            logger.warning('failed to refresh the auth token', exc_info=True)
+            # the current token is likely still valid, try again later
+            self._auth_time = (
+                time.monotonic() - self.auth_token_refresh_interval + self.AUTH_REFRESH_RETRY_DELAY
+            )
+        finally:
+            with self._auth_lock:
+                self._auth_refresh_thread = None
+
+    def _refresh_auth_token_in_advance(self) -> bool:
+        # not run if the refresh joined a re-authorization which was already in progress
+        if not self._authorize_automatically(refresh=True):
+            return False
+        with self._auth_lock:
+            self.proactive_auth_refreshes += 1
+        return True
+
     def _add_app_key_info_to_unauthorized(self, unauthorized):
         """
         Take an Unauthorized error and adds information from the application key
@@ -543,6 +687,12 @@ class B2Session:
         """
         account_info = self.account_info
         upload_url, upload_auth_token = account_info.take_bucket_upload_url(bucket_id)
+        self._prefetch_upload_urls(
+            bucket_id,
+            account_info.count_bucket_upload_urls,
+            self.get_upload_url,
+            account_info.put_bucket_upload_url,
+        )
         if None not in (upload_url, upload_auth_token):
             return upload_url, upload_auth_token
 
@@ -556,24 +706,96 @@ class B2Session:
         """
         account_info = self.account_info
         upload_url, upload_auth_token = account_info.take_large_file_upload_url(file_id)
+        self._prefetch_upload_urls(
+            file_id,
+            account_info.count_large_file_upload_urls,
+            self.get_upload_part_url,
+            account_info.put_large_file_upload_url,
+        )
         if None not in (upload_url, upload_auth_token):
             return upload_url, upload_auth_token
 
         response = self.get_upload_part_url(file_id)
         return response['uploadUrl'], response['authorizationToken']
 
+    def _prefetch_upload_urls(self, key, count_urls, get_upload_url, put_upload_url):
+        """
+        Top up the pool of upload URLs for the bucket or large file to ``upload_url_prefetch_count``
+        in the background, so that uploads do not wait for ``get_upload_url``.
+        """
+        if not self.upload_url_prefetch_count:
+            return
+        pooled_count = count_urls(key)
+        if pooled_count is None:
+            return
+        with self._upload_url_prefetch_lock:
+            missing = (
+                self.upload_url_prefetch_count - pooled_count - self._upload_urls_prefetching[key]
+            )
+            if missing <= 0:
+                return
+            self._upload_urls_prefetching[key] += missing
+            if self._upload_url_prefetch_executor is None:
+                self._upload_url_prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self.UPLOAD_URL_PREFETCH_THREADS,
+                    thread_name_prefix='b2sdk-upload-url-prefetch',
+                )
+            for _ in range(missing):
+                self._upload_url_prefetch_executor.submit(
+                    self._prefetch_upload_url, key, get_upload_url, put_upload_url
+                )
+
+    def _prefetch_upload_url(self, key, get_upload_url, put_upload_url):
+        try:
+            response = get_upload_url(key)
+            with self._upload_url_prefetch_lock:
+                # the large file may have been finished or cancelled meanwhile
+                if key not in self._upload_urls_cleared:
+                    put_upload_url(key, response['uploadUrl'], response['authorizationToken'])
+        except B2Error as e:
+            # the URL will be fetched when it is needed
+            logger.debug('failed to prefetch an upload URL for %s: %s', key, e)
+        finally:
+            with self._upload_url_prefetch_lock:
+                self._upload_urls_prefetching[key] -= 1
+                if not self._upload_urls_prefetching[key]:
+                    del self._upload_urls_prefetching[key]
+                    self._upload_urls_cleared.discard(key)
+
+    def _clear_large_file_upload_urls(self, file_id):
+        with self._upload_url_prefetch_lock:
+            # the urls being prefetched are not put in the pool, see _prefetch_upload_url
+            if file_id in self._upload_urls_prefetching:
+                self._upload_urls_cleared.add(file_id)
+        self.account_info.clear_large_file_upload_urls(file_id)
+
     def _upload_small(self, f, bucket_id, *args, **kwargs):
         upload_url, upload_auth_token = self._get_upload_data(bucket_id)
-        response = f(upload_url, upload_auth_token, *args, **kwargs)
+        response = self._upload_to_url(f, upload_url, upload_auth_token, *args, **kwargs)
         self.account_info.put_bucket_upload_url(bucket_id, upload_url, upload_auth_token)
         return response
 
     def _upload_part(self, f, file_id, *args, **kwargs):
         upload_url, upload_auth_token = self._get_upload_part_data(file_id)
-        response = f(upload_url, upload_auth_token, *args, **kwargs)
+        response = self._upload_to_url(f, upload_url, upload_auth_token, *args, **kwargs)
         self.account_info.put_large_file_upload_url(file_id, upload_url, upload_auth_token)
         return response
 
+    def _upload_to_url(self, f, upload_url, upload_auth_token, *args, **kwargs):
+        # the content length follows the file name or the part number
+        content_length = args[1]
+        upload_start = time.monotonic()
+        try:
+            response = f(upload_url, upload_auth_token, *args, **kwargs)
+        except B2Error as e:
+            if e.should_retry_upload():
+                self.account_info.record_upload_url_failure(upload_url)
+            raise
+        self.account_info.record_upload_url_success(
+            upload_url, time.monotonic() - upload_start, content_length
+        )
+        return response
+
     def update_file_retention(
         self,
         file_id,
@@ -603,7 +825,7 @@ class B2Session:
         )
 
     def get_bucket_notification_rules(self, bucket_id):
-        return self._wrap_default_token(self.raw_api.get_bucket_notification_rules, bucket_id)
+        return self._wrap_idempotent(self.raw_api.get_bucket_notification_rules, bucket_id)
 
     def set_bucket_notification_rules(self, bucket_id, rules):
         return self._wrap_default_token(
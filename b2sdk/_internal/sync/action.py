@@ -66,6 +66,12 @@ class AbstractAction(metaclass=ABCMeta):
         Return the number of bytes to transfer for this action.
         """
 
+    def get_changed_b2_file_name(self) -> str | None:
+        """
+        Return the name of the remote file which this action changes, if any.
+        """
+        return None
+
     @abstractmethod
     def do_action(self, bucket: Bucket, reporter: ProgressReport) -> None:
         """
@@ -121,6 +127,12 @@ class B2UploadAction(AbstractAction):
         """
         return self.size
 
+    def get_changed_b2_file_name(self) -> str | None:
+        """
+        Return the name of the remote file which this action changes.
+        """
+        return self.b2_file_name
+
     @functools.cached_property
     def _upload_source(self) -> UploadSourceLocalFile:
         """Upload source if the file was to be uploaded in full"""
@@ -239,6 +251,12 @@ class B2HideAction(AbstractAction):
         """
         return 0
 
+    def get_changed_b2_file_name(self) -> str | None:
+        """
+        Return the name of the remote file which this action changes.
+        """
+        return self.b2_file_name
+
     def do_action(self, bucket: Bucket, reporter: ProgressReport) -> None:
         """
         Perform the hiding action, returning only after the action is completed.
@@ -386,6 +404,12 @@ class B2CopyAction(AbstractAction):
         """
         return self.source_path.size
 
+    def get_changed_b2_file_name(self) -> str | None:
+        """
+        Return the name of the remote file which this action changes.
+        """
+        return self.dest_b2_file_name
+
     def do_action(self, bucket: Bucket, reporter: ProgressReport) -> None:
         """
         Perform the copying action, returning only after the action is completed.
@@ -462,6 +486,12 @@ class B2DeleteAction(AbstractAction):
         """
         return 0
 
+    def get_changed_b2_file_name(self) -> str | None:
+        """
+        Return the name of the remote file which this action changes.
+        """
+        return self.b2_file_name
+
     def do_action(self, bucket: Bucket, reporter: ProgressReport):
         """
         Perform the deleting action, returning only after the action is completed.
@@ -215,6 +215,12 @@ class Synchronizer:
         elif source_type == 'b2':
             action_bucket = cast(B2Folder, source_folder).bucket
 
+        # The snapshot of the destination has to list the files which are changed again.
+        listing_snapshot = None
+        if dest_type == 'b2' and not self.dry_run:
+            # folders of other classes (like the ones of older apivers) may not have a snapshot
+            listing_snapshot = getattr(dest_folder, 'listing_snapshot', None)
+
         # Schedule each of the actions.
         for action in self._make_folder_sync_actions(
             source_folder,
@@ -224,6 +230,10 @@ class Synchronizer:
             self.policies_manager,
             encryption_settings_provider,
         ):
+            if listing_snapshot is not None:
+                changed_b2_file_name = action.get_changed_b2_file_name()
+                if changed_b2_file_name is not None:
+                    listing_snapshot.invalidate(action_bucket.id_, changed_b2_file_name)
             logging.debug('scheduling action %s on bucket %s', action, action_bucket)
             sync_executor.submit(action.run, action_bucket, reporter, self.dry_run)
 
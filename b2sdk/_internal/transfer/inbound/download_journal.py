@@ -0,0 +1,159 @@
+######################################################################
+#
+# File: b2sdk/_internal/transfer/inbound/download_journal.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from typing import Callable
+
+from b2sdk._internal.file_version import DownloadVersion
+from b2sdk._internal.utils.range_ import Range
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadJournal:
+    """
+    A file next to the destination of a download, recording which ranges of the destination were written,
+    so that an interrupted download can be resumed by downloading only the missing ranges.
+
+    The journal is only valid for the same version of the same file (and the same range of it):
+    its id, length and SHA1 checksum are recorded along with the ranges.
+
+    Ranges are recorded as they are written and the journal is saved every ``SAVE_INTERVAL`` seconds,
+    after the written data is synced to the disk (see :attr:`sync`), so it never lists data which could be lost.
+    """
+
+    SUFFIX = '.b2journal'
+    SAVE_INTERVAL = 2.0
+
+    def __init__(
+        self,
+        path_: str | pathlib.Path,
+        download_version: DownloadVersion,
+        range_: tuple[int, int] | None = None,
+    ):
+        """
+        :param path_: path of the journal, see :meth:`get_path`
+        :param download_version: the version of the file being downloaded
+        :param range_: the range of the file being downloaded, if not all of it
+        """
+        self.path = pathlib.Path(path_)
+        self.header = {
+            'fileId': download_version.id_,
+            'fileName': download_version.file_name,
+            'contentLength': download_version.content_length,
+            'contentSha1': download_version.content_sha1,
+            'range': list(range_) if range_ is not None else None,
+        }
+        #: called before the journal is saved, to make sure the written data is on the disk
+        self.sync: Callable[[], None] | None = None
+        self._ranges: list[list[int]] = []
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    @classmethod
+    def get_path(cls, path_: str | pathlib.Path) -> pathlib.Path:
+        """
+        Return the path of the journal of a download to the given path.
+        """
+        path_ = pathlib.Path(path_)
+        return path_.with_name(path_.name + cls.SUFFIX)
+
+    @property
+    def written_ranges(self) -> list[Range]:
+        with self._lock:
+            return [Range(start, end) for start, end in self._ranges]
+
+    def load(self) -> bool:
+        """
+        Load the ranges written by an earlier download of the same version of the file.
+
+        :return: whether a journal of the same download was found
+        """
+        try:
+            with open(self.path) as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning('ignoring unreadable download journal %s: %s', self.path, e)
+            return False
+        if content.get('header') != self.header:
+            logger.info('ignoring download journal %s of a different download', self.path)
+            return False
+        with self._lock:
+            self._ranges = []
+            for start, end in content['ranges']:
+                self._add(start, end)
+        return True
+
+    def add(self, offset: int, size: int) -> None:
+        """
+        Record that ``size`` bytes were written at the ``offset``, saving the journal if it is due.
+        """
+        if not size:
+            return
+        with self._lock:
+            self._add(offset, offset + size - 1)
+            if time.monotonic() - self._saved_at < self.SAVE_INTERVAL:
+                return
+            ranges = self._get_ranges_to_save()
+        self._save(ranges)
+
+    def save(self) -> None:
+        """
+        Sync the written data to the disk and save the journal.
+        """
+        with self._lock:
+            ranges = self._get_ranges_to_save()
+        self._save(ranges)
+
+    def remove(self) -> None:
+        """
+        Remove the journal, once the download is complete.
+        """
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _add(self, start: int, end: int) -> None:
+        # ranges are kept sorted and merged, written chunks never overlap
+        ranges = self._ranges
+        index = bisect.bisect_left(ranges, start, key=lambda range_: range_[0])
+        if index > 0 and ranges[index - 1][1] + 1 >= start:
+            index -= 1
+            ranges[index][1] = max(ranges[index][1], end)
+        else:
+            ranges.insert(index, [start, end])
+        while index + 1 < len(ranges) and ranges[index][1] + 1 >= ranges[index + 1][0]:
+            ranges[index][1] = max(ranges[index][1], ranges.pop(index + 1)[1])
+
+    def _get_ranges_to_save(self) -> list[list[int]]:
+        # the lock has to be held; the ranges recorded so far are on the disk once the data is synced
+        self._saved_at = time.monotonic()
+        return [list(range_) for range_ in self._ranges]
+
+    def _save(self, ranges: list[list[int]]) -> None:
+        # syncing can take a while, so it is done without blocking the threads recording the ranges
+        with self._save_lock:
+            if self.sync is not None:
+                self.sync()
+            temporary_path = self.path.with_name(self.path.name + '.tmp')
+            with open(temporary_path, 'w') as f:
+                json.dump({'header': self.header, 'ranges': ranges}, f)
+            os.replace(temporary_path, self.path)
@@ -21,7 +21,7 @@ from b2sdk._internal.utils import B2TraceMetaAbstract
 from ...utils.thread_pool import ThreadPoolMixin
 from ..transfer_manager import TransferManager
 from .downloaded_file import DownloadedFile
-from .downloader.parallel import ParallelDownloader
+from .downloader.parallel import ParallelDownloader, StreamingParallelDownloader
 from .downloader.simple import SimpleDownloader
 
 logger = logging.getLogger(__name__)
@@ -35,12 +35,18 @@ class DownloadManager(TransferManager, ThreadPoolMixin, metaclass=B2TraceMetaAbs
     # minimum size of a download chunk
     DEFAULT_MIN_PART_SIZE = 100 * 1024 * 1024
 
+    # minimum size of a download chunk to a file which cannot seek and the maximum size of the data kept in memory
+    # until its turn to be written comes
+    DEFAULT_MIN_STREAMING_PART_SIZE = 8 * 1024 * 1024
+    DEFAULT_STREAMING_BUFFER_SIZE = 64 * 1024 * 1024
+
     # block size used when downloading file. If it is set to a high value,
     # progress reporting will be jumpy, if it's too low, it impacts CPU
     MIN_CHUNK_SIZE = 8192  # ~1MB file will show ~1% progress increment
     MAX_CHUNK_SIZE = 1024**2
 
     PARALLEL_DOWNLOADER_CLASS = staticmethod(ParallelDownloader)
+    STREAMING_PARALLEL_DOWNLOADER_CLASS = staticmethod(StreamingParallelDownloader)
     SIMPLE_DOWNLOADER_CLASS = staticmethod(SimpleDownloader)
 
     def __init__(
@@ -65,6 +71,16 @@ class DownloadManager(TransferManager, ThreadPoolMixin, metaclass=B2TraceMetaAbs
                 check_hash=check_hash,
                 max_streams=max_download_streams_per_file,
             ),
+            self.STREAMING_PARALLEL_DOWNLOADER_CLASS(
+                min_part_size=self.DEFAULT_MIN_STREAMING_PART_SIZE,
+                max_buffer_size=self.DEFAULT_STREAMING_BUFFER_SIZE,
+                min_chunk_size=self.MIN_CHUNK_SIZE,
+                max_chunk_size=max(self.MAX_CHUNK_SIZE, write_buffer_size or 0),
+                align_factor=write_buffer_size,
+                thread_pool=self._thread_pool,
+                check_hash=check_hash,
+                max_streams=max_download_streams_per_file,
+            ),
             self.SIMPLE_DOWNLOADER_CLASS(
                 min_chunk_size=self.MIN_CHUNK_SIZE,
                 max_chunk_size=max(self.MAX_CHUNK_SIZE, write_buffer_size or 0),
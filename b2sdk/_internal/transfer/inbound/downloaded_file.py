@@ -39,6 +39,7 @@ from ...encryption.setting import EncryptionSetting
 from ...file_version import DownloadVersion
 from ...progress import AbstractProgressListener
 from ...stream.progress import WritingStreamWithProgress
+from .download_journal import DownloadJournal
 
 if TYPE_CHECKING:
     from .download_manager import DownloadManager
@@ -66,7 +67,7 @@ class MtimeUpdatedFile(io.IOBase):
         self,
         path_: str | pathlib.Path,
         mod_time_millis: int,
-        mode: Literal['wb', 'wb+'] = 'wb+',
+        mode: Literal['wb', 'wb+', 'rb+'] = 'wb+',
         buffering: int | None = None,
     ):
         self.path = pathlib.Path(path_) if isinstance(path_, str) else path_
@@ -104,6 +105,13 @@ class MtimeUpdatedFile(io.IOBase):
     def tell(self):
         return self.file.tell()
 
+    def fileno(self):
+        return self.file.fileno()
+
+    def flush(self):
+        if self.file is not None and not self.file.closed:
+            self.file.flush()
+
     def __enter__(self):
         try:
             path = self.path
@@ -169,6 +177,20 @@ class DownloadedFile:
         self.write_buffer_size = write_buffer_size
         self.check_hash = check_hash
 
+    def _is_hash_verified(self) -> bool:
+        """
+        Whether the checksum of the whole file is going to be verified once it is saved.
+        """
+        return (
+            self.check_hash
+            and self.range_ is None
+            and self.download_version.content_sha1 not in (None, 'none')
+            and not (
+                self.download_version.content_encoding is not None
+                and self.download_version.api.api_config.decode_content
+            )
+        )
+
     def _validate_download(self, bytes_read, actual_sha1):
         if (
             self.download_version.content_encoding is not None
@@ -194,13 +216,20 @@ class DownloadedFile:
             if bytes_read != desired_length:
                 raise TruncatedOutput(bytes_read, desired_length)
 
-    def save(self, file: BinaryIO, allow_seeking: bool | None = None) -> None:
+    def save(
+        self,
+        file: BinaryIO,
+        allow_seeking: bool | None = None,
+        journal: DownloadJournal | None = None,
+    ) -> None:
         """
         Read data from B2 cloud and write it to a file-like object
 
         :param file: a file-like object
         :param allow_seeking: if False, download strategies that rely on seeking to write data
                               (parallel strategies) will be discarded.
+        :param journal: journal of the ranges of the file which were already written;
+                        the strategies which support resuming skip them and record the ranges they write
         """
         if allow_seeking is None:
             allow_seeking = file.seekable()
@@ -230,12 +259,16 @@ class DownloadedFile:
         else:
             raise ValueError('no strategy suitable for download was found!')
         self.download_strategy = strategy
+        kwargs = {}
+        if journal is not None and strategy.SUPPORTS_RESUMING:
+            kwargs['journal'] = journal
         bytes_read, actual_sha1 = strategy.download(
             file,
             response=self.response,
             download_version=self.download_version,
             session=self.download_manager.services.session,
             encryption=self.encryption,
+            **kwargs,
         )
         self._validate_download(bytes_read, actual_sha1)
 
@@ -244,6 +277,7 @@ class DownloadedFile:
         path_: str | pathlib.Path,
         mode: Literal['wb', 'wb+'] | None = None,
         allow_seeking: bool | None = None,
+        resumable: bool = False,
     ) -> None:
         """
         Open a local file and write data from B2 cloud to it, also update the mod_time.
@@ -252,6 +286,13 @@ class DownloadedFile:
         :param mode: mode in which the file should be opened
         :param allow_seeking: if False, download strategies that rely on seeking to write data
                               (parallel strategies) will be discarded.
+        :param resumable: if True, the ranges written are recorded in a journal next to the file
+                          (see :class:`~b2sdk._internal.transfer.inbound.download_journal.DownloadJournal`),
+                          so that if the download is interrupted, saving the same version of the file
+                          to the same path again only downloads the missing ranges;
+                          ignored for the standard output and FIFOs, and whenever the data written before
+                          could not be verified: for ranges of files, files without a known SHA1 checksum
+                          and with ``check_hash`` disabled
         """
         path_ = pathlib.Path(path_)
         is_stdout = points_to_stdout(path_)
@@ -278,10 +319,29 @@ class DownloadedFile:
                 if not is_stdout:
                     set_file_mtime(path_, self.download_version.mod_time_millis)
 
-        with MtimeUpdatedFile(
-            path_,
-            mod_time_millis=self.download_version.mod_time_millis,
-            mode=mode or 'wb+',
-            buffering=self.write_buffer_size,
-        ) as file:
-            return self.save(file, allow_seeking=allow_seeking)
+        journal = None
+        if resumable and not self._is_hash_verified():
+            logger.info('download to %s cannot be verified, so it will not be resumable', path_)
+        elif resumable:
+            journal = DownloadJournal(
+                DownloadJournal.get_path(path_), self.download_version, self.range_
+            )
+            if path_.is_file() and journal.load():
+                # the data written before is kept
+                mode = 'rb+'
+
+        try:
+            with MtimeUpdatedFile(
+                path_,
+                mod_time_millis=self.download_version.mod_time_millis,
+                mode=mode or 'wb+',
+                buffering=self.write_buffer_size,
+            ) as file:
+                self.save(file, allow_seeking=allow_seeking, journal=journal)
+        except (ChecksumMismatch, TruncatedOutput):
+            if journal is not None:
+                # the data on the disk cannot be trusted, the next attempt has to start over
+                journal.remove()
+            raise
+        if journal is not None:
+            journal.remove()
@@ -49,10 +49,13 @@ class AbstractDownloader(metaclass=B2TraceMetaAbstract):
         In practice, this means that the downloader can handle HTTP responses which already
         have the content decoded per Content-Encoding and, more likely than not, of a different
         length than requested.
+    :var SUPPORTS_RESUMING: if True, the downloader accepts a ``journal`` of the ranges already written
+        (see :class:`~b2sdk._internal.transfer.inbound.download_journal.DownloadJournal`) and only downloads the rest.
     """
 
     REQUIRES_SEEKING = True
     SUPPORTS_DECODE_CONTENT = True
+    SUPPORTS_RESUMING = False
     DEFAULT_THREAD_POOL_CLASS = staticmethod(ThreadPoolExecutor)
     DEFAULT_ALIGN_FACTOR = 4096
 
@@ -9,13 +9,20 @@
 ######################################################################
 from __future__ import annotations
 
+import collections
+import errno
+import io
 import logging
+import math
+import os
 import platform
 import queue
+import stat
 import threading
 from concurrent import futures
 from io import IOBase
 from time import perf_counter_ns
+from typing import Callable, Iterable
 
 from requests import RequestException
 from requests.models import Response
@@ -24,11 +31,18 @@ from b2sdk._internal.encryption.setting import EncryptionSetting
 from b2sdk._internal.exception import B2Error, TruncatedOutput
 from b2sdk._internal.file_version import DownloadVersion
 from b2sdk._internal.session import B2Session
+from b2sdk._internal.stream.progress import WritingStreamWithProgress
+from b2sdk._internal.transfer.inbound.download_journal import DownloadJournal
 from b2sdk._internal.utils.range_ import Range
 
 from .abstract import AbstractDownloader
 from .stats_collector import StatsCollector
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +50,10 @@ class ParallelDownloader(AbstractDownloader):
     """
     Downloader using threads to download&write multiple parts of an object in parallel.
 
-    Each part is downloaded by its own thread, while all writes are done by additional dedicated thread.
+    The object is split into parts which a few threads (streams) take from a shared queue (see :class:`PartScheduler`),
+    and a stream which runs out of parts takes over a half of what is left of the slowest stream's part,
+    while all writes are done by additional dedicated thread (see :class:`WriterThread`) - or, if the data goes
+    to an OS file, directly by the streams, at their offsets (see :class:`PositionalWriter`).
     This can increase performance even for a small file, as fetching & writing can be done in parallel.
     """
 
@@ -59,17 +76,36 @@ class ParallelDownloader(AbstractDownloader):
     #      |                                                                     |
     #      cloud file start                                         cloud file end
     #
-    FINISH_HASHING_BUFFER_SIZE = 1024**2
+    # the data is hashed in order while it is being written, and the chunks written ahead of what was hashed
+    # are kept in memory up to this size (the ones which do not fit are read back from the file later)
+    HASHING_BUFFER_SIZE = 32 * 1024**2
     SUPPORTS_DECODE_CONTENT = False
+    SUPPORTS_RESUMING = True
+    # the object is split into a few parts per stream, so that the streams which are done early
+    # can take over the parts which were not started yet instead of waiting for the slowest stream
+    PARTS_PER_STREAM = 4
 
-    def __init__(self, min_part_size: int, max_streams: int | None = None, **kwargs):
+    def __init__(
+        self,
+        min_part_size: int,
+        max_streams: int | None = None,
+        positional_writes: bool = True,
+        preallocate: bool = False,
+        **kwargs,
+    ):
         """
         :param max_streams: maximum number of simultaneous streams
         :param min_part_size: minimum amount of data a single stream will retrieve, in bytes
+        :param positional_writes: whether the streams should write the data to an OS file directly,
+                                  without a writer thread
+        :param preallocate: whether to allocate the disk space for the data before a download
+                            with positional writes starts, where the filesystem supports it
         """
         super().__init__(**kwargs)
         self.max_streams = max_streams
         self.min_part_size = min_part_size
+        self.positional_writes = positional_writes
+        self.preallocate = preallocate
 
     def _get_number_of_streams(self, content_length: int) -> int:
         num_streams = content_length // self.min_part_size
@@ -81,6 +117,10 @@ class ParallelDownloader(AbstractDownloader):
                 num_streams = min(num_streams, max_threadpool_workers)
         return max(num_streams, 1)
 
+    def _get_number_of_parts(self, num_streams: int, size: int) -> int:
+        num_parts = min(num_streams * self.PARTS_PER_STREAM, size // self.min_part_size)
+        return min(max(num_parts, num_streams), size)
+
     def download(
         self,
         file: IOBase,
@@ -88,9 +128,12 @@ class ParallelDownloader(AbstractDownloader):
         download_version: DownloadVersion,
         session: B2Session,
         encryption: EncryptionSetting | None = None,
+        journal: DownloadJournal | None = None,
     ):
         """
         Download a file from given url using parallel download sessions and stores it in the given download_destination.
+
+        :param journal: journal to record the written ranges in; the ranges it already lists are not downloaded again
         """
         remote_range = self._get_remote_range(response, download_version)
         hasher = self._get_hasher()
@@ -99,98 +142,172 @@ class ParallelDownloader(AbstractDownloader):
             return 0, hasher.hexdigest()
 
         actual_size = remote_range.size()
-        start_file_position = file.tell()
-        parts_to_download = list(
-            gen_parts(
+        start_file_position = self._get_file_position(file)
+        local_range = Range(start_file_position, start_file_position + actual_size - 1)
+        written_ranges = self._get_written_ranges(journal, local_range)
+        num_streams = self._get_number_of_streams(download_version.content_length)
+        if written_ranges:
+            # the original response starts with data which is already there
+            response.close()
+            parts = self._gen_missing_parts(remote_range, local_range, written_ranges, num_streams)
+        else:
+            parts = gen_parts(
                 remote_range,
-                Range(start_file_position, start_file_position + actual_size - 1),
-                part_count=self._get_number_of_streams(download_version.content_length),
-            )
-        )
-
-        first_part = parts_to_download[0]
-        with WriterThread(file, max_queue_depth=len(parts_to_download) * 2) as writer:
-            self._get_parts(
-                response,
-                session,
-                writer,
-                hasher,
-                first_part,
-                parts_to_download[1:],
-                self._get_chunk_size(actual_size),
-                encryption=encryption,
+                local_range,
+                part_count=self._get_number_of_parts(num_streams, actual_size),
             )
-        bytes_written = writer.total
+        scheduler = PartScheduler(parts, min_part_size=self.min_part_size)
 
-        # At this point the hasher already consumed the data until the end of first stream.
-        # Consume the rest of the file to complete the hashing process
+        first_part = None if written_ranges else scheduler.get_part()
+        writer = self._get_writer(file, local_range, max_queue_depth=num_streams * 2)
         if self._check_hash:
             # we skip hashing if we would not check it - hasher object is actually a EmptyHasher instance
-            # but we avoid here reading whole file (except for the first part) from disk again
-            before_hash = perf_counter_ns()
-            self._finish_hashing(first_part, file, hasher, download_version.content_length)
-            after_hash = perf_counter_ns()
-            logger.info(
-                'download stats | %s | %s total: %.3f ms',
-                file,
-                'finish_hash',
-                (after_hash - before_hash) / 1000000,
+            writer.ordered_hasher = OrderedHasher(
+                hasher,
+                local_range,
+                read=writer.read_at,
+                max_buffer_size=self.HASHING_BUFFER_SIZE,
+                name=str(file),
             )
+        resumed_size = 0
+        for written_range in written_ranges:
+            resumed_size += written_range.size()
+            if writer.ordered_hasher is not None:
+                writer.ordered_hasher.add_written(written_range.start, written_range.size())
+        if resumed_size:
+            logger.info('resuming download of %s, %i bytes already written', file, resumed_size)
+            if isinstance(file, WritingStreamWithProgress):
+                file._progress_update(resumed_size)
+            if writer.ordered_hasher is not None:
+                # hash the data written before, up to the first missing range, so that hashing can go on with the download
+                writer.ordered_hasher.finish()
+        if journal is not None:
+            writer.journal = journal
+            journal.sync = writer.sync
+        try:
+            with writer:
+                self._get_parts(
+                    response,
+                    session,
+                    writer,
+                    scheduler,
+                    first_part,
+                    num_streams,
+                    self._get_chunk_size(actual_size),
+                    encryption=encryption,
+                )
+        finally:
+            if journal is not None:
+                journal.save()
+        bytes_written = writer.total + resumed_size
+        if writer.ordered_hasher is not None:
+            writer.ordered_hasher.finish()
+            writer.ordered_hasher.report()
+        self._set_file_position(file, local_range.end + 1)
 
         return bytes_written, hasher.hexdigest()
 
-    def _finish_hashing(self, first_part, file, hasher, content_length):
-        end_of_first_part = first_part.local_range.end + 1
-        file.seek(end_of_first_part)
-        file_read = file.read
-
-        last_offset = first_part.local_range.start + content_length
-        current_offset = end_of_first_part
-        stop = False
-        while 1:
-            data = file_read(self.FINISH_HASHING_BUFFER_SIZE)
-            if not data:
-                break
-            if current_offset + len(data) >= last_offset:
-                to_hash = data[: last_offset - current_offset]
-                stop = True
+    def _get_written_ranges(
+        self, journal: DownloadJournal | None, local_range: Range
+    ) -> list[Range]:
+        if journal is None:
+            return []
+        written_ranges = []
+        for written_range in journal.written_ranges:
+            start = max(written_range.start, local_range.start)
+            end = min(written_range.end, local_range.end)
+            if start <= end:
+                written_ranges.append(Range(start, end))
+        return written_ranges
+
+    def _gen_missing_parts(
+        self,
+        remote_range: Range,
+        local_range: Range,
+        written_ranges: list[Range],
+        num_streams: int,
+    ) -> Iterable[PartToDownload]:
+        """
+        Generate the parts to download the ranges of the ``local_range`` which are not among the ``written_ranges``.
+        """
+        missing_ranges = []
+        offset = local_range.start
+        for written_range in [*written_ranges, Range(local_range.end + 1, local_range.end + 1)]:
+            if written_range.start > offset:
+                missing_ranges.append(Range(offset, written_range.start - 1))
+            offset = written_range.end + 1
+        for missing_range in missing_ranges:
+            relative_start = missing_range.start - local_range.start
+            relative_end = missing_range.end - local_range.start
+            # small gaps are not worth splitting, the parts are split anyway once there are no others left
+            part_count = min(
+                self._get_number_of_parts(num_streams, missing_range.size()),
+                max(missing_range.size() // self.min_part_size, 1),
+            )
+            yield from gen_parts(
+                remote_range.subrange(relative_start, relative_end),
+                missing_range,
+                part_count=part_count,
+            )
+
+    def _get_file_position(self, file: IOBase) -> int:
+        return file.tell()
+
+    def _set_file_position(self, file: IOBase, position: int) -> None:
+        # the writes do not move the position (or leave it anywhere), while it is expected to follow the data
+        file.seek(position)
+
+    def _get_writer(self, file: IOBase, local_range: Range, max_queue_depth: int):
+        """
+        Return a :class:`PositionalWriter` if positional writes are enabled and the data goes to an OS file
+        (possibly wrapped to report the progress), a :class:`WriterThread` otherwise.
+        """
+        if self.positional_writes:
+            if isinstance(file, WritingStreamWithProgress):
+                target, progress_stream = file.stream, file
             else:
-                to_hash = data
-            hasher.update(data)
-            current_offset += len(to_hash)
-            if stop:
-                break
+                target, progress_stream = file, None
+            fileno = PositionalWriter.get_fileno(target)
+            if fileno is not None:
+                return PositionalWriter(
+                    target,
+                    fileno,
+                    progress_stream=progress_stream,
+                    preallocate_range=local_range if self.preallocate else None,
+                )
+        return WriterThread(file, max_queue_depth=max_queue_depth)
 
     def _get_parts(
         self,
         response,
         session,
         writer,
-        hasher,
+        scheduler,
         first_part,
-        parts_to_download,
+        num_streams,
         chunk_size,
         encryption,
     ):
         stream = self._thread_pool.submit(
-            download_first_part,
-            response,
-            hasher,
+            download_parts,
+            response.request.url,
             session,
             writer,
-            first_part,
+            scheduler,
             chunk_size,
             encryption=encryption,
+            first_part=first_part,
+            response=response,
         )
         streams = {stream}
 
-        for part in parts_to_download:
+        for _ in range(num_streams - 1):
             stream = self._thread_pool.submit(
-                download_non_first_part,
+                download_parts,
                 response.request.url,
                 session,
                 writer,
-                part,
+                scheduler,
                 chunk_size,
                 encryption=encryption,
             )
@@ -220,6 +337,56 @@ class ParallelDownloader(AbstractDownloader):
             stream.result()
 
 
+class StreamingParallelDownloader(ParallelDownloader):
+    """
+    Downloader fetching multiple parts of an object in parallel, like :class:`ParallelDownloader`,
+    but writing them strictly in order (see :class:`OrderedWriter`), so that it can download to file-like objects
+    which cannot seek, like pipes or the standard output.
+
+    The parts are small enough for the ones being downloaded by all the streams to fit in the buffer of
+    the chunks waiting for their turn, which bounds the memory used by a download to ``max_buffer_size``.
+    """
+
+    REQUIRES_SEEKING = False
+    # what was written before cannot be skipped in a stream
+    SUPPORTS_RESUMING = False
+
+    def __init__(self, min_part_size: int, max_buffer_size: int, **kwargs):
+        """
+        :param min_part_size: minimum amount of data a single stream will retrieve, in bytes
+        :param max_buffer_size: maximum size of the data kept in memory until its turn to be written comes, in bytes
+        """
+        super().__init__(min_part_size=min_part_size, **kwargs)
+        self.max_buffer_size = max_buffer_size
+
+    def is_suitable(self, download_version: DownloadVersion, allow_seeking: bool):
+        # a single stream would not be any faster than SimpleDownloader
+        return (
+            super().is_suitable(download_version, allow_seeking)
+            and download_version.content_length >= 2 * self.min_part_size
+        )
+
+    def _get_number_of_streams(self, content_length: int) -> int:
+        # every stream needs room for a part in the buffer
+        num_streams = super()._get_number_of_streams(content_length)
+        return max(min(num_streams, self.max_buffer_size // self.min_part_size), 1)
+
+    def _get_number_of_parts(self, num_streams: int, size: int) -> int:
+        part_size = max(self.min_part_size, self.max_buffer_size // num_streams)
+        return min(max(-(-size // part_size), num_streams), size)
+
+    def _get_file_position(self, file: IOBase) -> int:
+        # the offsets are only used to put the chunks in order
+        return 0
+
+    def _set_file_position(self, file: IOBase, position: int) -> None:
+        # the chunks were written in order, so the position already follows them
+        pass
+
+    def _get_writer(self, file: IOBase, local_range: Range, max_queue_depth: int):
+        return OrderedWriter(file, local_range.start, max_buffer_size=self.max_buffer_size)
+
+
 class WriterThread(threading.Thread):
     """
     A thread responsible for keeping a queue of data chunks to write to a file-like object and for actually writing them down.
@@ -249,11 +416,17 @@ class WriterThread(threading.Thread):
         self.queue = queue.Queue(max_queue_depth)
         self.total = 0
         self.stats_collector = StatsCollector(str(self.file), 'writer', 'seek')
+        #: fed with every chunk right after it is written, if set before the thread is started
+        self.ordered_hasher: OrderedHasher | None = None
+        #: records every chunk right after it is written, if set before the thread is started
+        self.journal: DownloadJournal | None = None
         super().__init__()
 
     def run(self):
         file = self.file
         queue_get = self.queue.get
+        ordered_hasher = self.ordered_hasher
+        journal = self.journal
         stats_collector_read = self.stats_collector.read
         stats_collector_other = self.stats_collector.other
         stats_collector_write = self.stats_collector.write
@@ -272,6 +445,12 @@ class WriterThread(threading.Thread):
                 with stats_collector_write:
                     file.write(data)
 
+                if ordered_hasher is not None:
+                    ordered_hasher.update(offset, data)
+
+                if journal is not None:
+                    journal.add(offset, len(data))
+
                 self.total += len(data)
 
     def __enter__(self):
@@ -281,26 +460,401 @@ class WriterThread(threading.Thread):
     def queue_write(self, offset: int, data: bytes) -> None:
         self.queue.put((False, offset, data))
 
+    def abort(self) -> None:
+        """
+        Do nothing, the writes of the streams do not wait for each other.
+        """
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        """
+        Read back the data written at the offset; only to be called by the writer thread itself.
+        """
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def sync(self) -> None:
+        """
+        Flush the written data and, for an OS file, sync it to the disk; only to be called by the writer thread itself
+        (or once it is done).
+        """
+        file = self.file.stream if isinstance(self.file, WritingStreamWithProgress) else self.file
+        file.flush()
+        try:
+            fileno = file.fileno()
+        except (AttributeError, OSError, ValueError):
+            return
+        os.fsync(fileno)
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.queue.put((True, None, None))
         self.join()
         self.stats_collector.report()
 
 
+class PositionalWriter:
+    """
+    A writer of data chunks to an OS file, which writes every chunk at its offset with ``os.pwrite``,
+    right in the thread which downloaded it.
+
+    Positional writes do not use (or move) the position of the file, so they need no synchronization
+    and a download is not limited by how fast a single :class:`WriterThread` can write.
+    Since the writes bypass the file object, it is flushed before the first write, and the progress of
+    a :class:`~b2sdk._internal.stream.progress.WritingStreamWithProgress` which wrapped it is updated
+    by the writer.
+    """
+
+    def __init__(
+        self,
+        file,
+        fileno: int,
+        progress_stream: WritingStreamWithProgress | None = None,
+        preallocate_range: Range | None = None,
+    ):
+        """
+        :param file: OS file to write to
+        :param fileno: file descriptor of the ``file``, see :meth:`get_fileno`
+        :param progress_stream: stream to report the progress of writing to
+        :param preallocate_range: range of the file to allocate the disk space for before the first write
+        """
+        self.file = file
+        self.fileno = fileno
+        self.progress_stream = progress_stream
+        self.preallocate_range = preallocate_range
+        self.total = 0
+        self.stats_collector = StatsCollector(str(self.file), 'positional writer', 'preallocate')
+        #: fed with every chunk right after it is written
+        self.ordered_hasher: OrderedHasher | None = None
+        #: records every chunk right after it is written
+        self.journal: DownloadJournal | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_fileno(cls, file) -> int | None:
+        """
+        Return the file descriptor of the file, if it is a regular OS file which positional writes
+        can be done to, ``None`` otherwise.
+        """
+        if fcntl is None or not hasattr(os, 'pwrite'):
+            return None
+        try:
+            fileno = file.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        try:
+            if not stat.S_ISREG(os.fstat(fileno).st_mode):
+                return None
+            # positional writes to a file opened for appending go to its end on Linux
+            if fcntl.fcntl(fileno, fcntl.F_GETFL) & os.O_APPEND:
+                return None
+        except OSError:
+            return None
+        return fileno
+
+    def __enter__(self):
+        self.file.flush()
+        if self.preallocate_range is not None:
+            with self.stats_collector.other:
+                self._preallocate(self.preallocate_range)
+        return self
+
+    def _preallocate(self, range_: Range) -> None:
+        posix_fallocate = getattr(os, 'posix_fallocate', None)
+        if posix_fallocate is None:
+            return
+        try:
+            posix_fallocate(self.fileno, range_.start, range_.size())
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                raise
+            logger.debug('preallocation of %s for %s failed: %s', range_, self.file, e)
+
+    def queue_write(self, offset: int, data: bytes) -> None:
+        """
+        Write the data at the offset of the file, in the calling thread.
+        """
+        before_write = perf_counter_ns()
+        written = os.pwrite(self.fileno, data, offset)
+        while written < len(data):
+            written += os.pwrite(self.fileno, memoryview(data)[written:], offset + written)
+        write_time = perf_counter_ns() - before_write
+        with self._lock:
+            self.stats_collector.write.add_entry(write_time)
+            self.total += written
+            if self.progress_stream is not None:
+                self.progress_stream._progress_update(written)
+        if self.ordered_hasher is not None:
+            self.ordered_hasher.update(offset, data)
+        if self.journal is not None:
+            self.journal.add(offset, written)
+
+    def abort(self) -> None:
+        """
+        Do nothing, the writes of the streams do not wait for each other.
+        """
+
+    def sync(self) -> None:
+        """
+        Sync the written data to the disk.
+        """
+        os.fsync(self.fileno)
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        """
+        Read back the data written at the offset.
+        """
+        data = os.pread(self.fileno, size, offset)
+        while len(data) < size:
+            more_data = os.pread(self.fileno, size - len(data), offset + len(data))
+            if not more_data:
+                break
+            data += more_data
+        return data
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stats_collector.report()
+
+
+class OrderedWriter:
+    """
+    A writer of data chunks to a file-like object which can only be written sequentially (like a pipe
+    or the standard output), which writes the chunks in order.
+
+    The chunk which continues what was written so far is written right away, by the thread which downloaded it,
+    along with the chunks following it which arrived before.  Those are kept in memory, up to ``max_buffer_size``;
+    once the buffer is full, the threads with other chunks wait, which holds back the streams which are ahead.
+    The next chunk is never kept waiting, so the download goes on as long as the stream downloading it does.
+    """
+
+    def __init__(self, file, start_offset: int, max_buffer_size: int):
+        """
+        :param file: file-like object to write to
+        :param start_offset: offset of the first chunk
+        :param max_buffer_size: maximum size of the chunks kept in memory until their turn comes, in bytes
+        """
+        self.file = file
+        self.max_buffer_size = max_buffer_size
+        self.total = 0
+        self.stats_collector = StatsCollector(str(self.file), 'ordered writer', 'wait')
+        #: fed with every chunk right after it is written
+        self.ordered_hasher: OrderedHasher | None = None
+        self._offset = start_offset
+        self._buffer: dict[int, bytes] = {}
+        self._buffer_size = 0
+        self._writing = False
+        self._aborted = False
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def queue_write(self, offset: int, data: bytes) -> None:
+        """
+        Write the chunk if it is the next one, keep it for later or wait until it can be kept.
+        """
+        if not data:
+            return
+        with self._condition:
+            while True:
+                if self._aborted:
+                    return
+                if offset == self._offset and not self._writing:
+                    self._writing = True
+                    break
+                if offset != self._offset and self._buffer_size + len(data) <= self.max_buffer_size:
+                    self._buffer[offset] = data
+                    self._buffer_size += len(data)
+                    return
+                before_wait = perf_counter_ns()
+                self._condition.wait()
+                self.stats_collector.other.add_entry(perf_counter_ns() - before_wait)
+        file_write = self.file.write
+        stats_collector_write = self.stats_collector.write
+        ordered_hasher = self.ordered_hasher
+        while True:
+            try:
+                with stats_collector_write:
+                    file_write(data)
+                if ordered_hasher is not None:
+                    ordered_hasher.update(offset, data)
+            except BaseException:
+                self.abort()
+                raise
+            with self._condition:
+                self.total += len(data)
+                self._offset = offset = offset + len(data)
+                data = self._buffer.pop(offset, None)
+                if data is None:
+                    self._writing = False
+                else:
+                    self._buffer_size -= len(data)
+                self._condition.notify_all()
+                if data is None:
+                    return
+
+    def abort(self) -> None:
+        """
+        Stop writing and release the threads waiting to write, dropping their chunks.
+        """
+        with self._condition:
+            self._aborted = True
+            self._condition.notify_all()
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        """
+        Chunks are written in order, so they never have to be read back.
+        """
+        raise io.UnsupportedOperation('chunks written in order are never read back')
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stats_collector.report()
+
+
+class OrderedHasher:
+    """
+    Feed a hasher with the data of a range of a file, in order, while chunks of it are written in any order.
+
+    The chunk which continues what was hashed so far is hashed right away, along with the chunks
+    following it which were written before.  Those are kept in memory, up to ``max_buffer_size``;
+    the ones which do not fit are only remembered and read back from the file when their turn comes.
+    This way the data is hashed while it is being downloaded and, in the common case, it is never read back.
+
+    Chunks can be fed from many threads, but only one of them hashes at a time.
+    """
+
+    # the largest piece of data read back at once
+    READ_BACK_SIZE = 1024**2
+
+    def __init__(
+        self,
+        hasher,
+        range_: Range,
+        read: Callable[[int, int], bytes],
+        max_buffer_size: int,
+        name: str = '',
+    ):
+        """
+        :param hasher: hasher object to feed
+        :param range_: range of the file to hash
+        :param read: callable reading ``size`` bytes of the file at ``offset``, once they were written
+        :param max_buffer_size: maximum size of the chunks kept in memory, in bytes
+        :param name: name of the file, for the statistics
+        """
+        self.hasher = hasher
+        self.range_ = range_
+        self.read = read
+        self.max_buffer_size = max_buffer_size
+        self.stats_collector = StatsCollector(name, 'ordered hasher', 'hash')
+        self.bytes_read_back = 0
+        self._offset = range_.start
+        self._buffer: dict[int, bytes] = {}
+        self._buffer_size = 0
+        self._read_back: dict[int, int] = {}
+        self._hashing = False
+        self._lock = threading.Lock()
+
+    @property
+    def bytes_hashed(self) -> int:
+        return self._offset - self.range_.start
+
+    def add_written(self, offset: int, size: int) -> None:
+        """
+        Remember a range which was written before the hashing started, to read it back when its turn comes.
+        """
+        if size:
+            with self._lock:
+                self._read_back[offset] = size
+
+    def update(self, offset: int, data: bytes) -> None:
+        """
+        Hash the chunk written at the offset as soon as all the data before it is hashed.
+        """
+        if not data:
+            return
+        with self._lock:
+            if self._hashing or offset != self._offset:
+                if self._buffer_size + len(data) <= self.max_buffer_size:
+                    self._buffer[offset] = data
+                    self._buffer_size += len(data)
+                else:
+                    self._read_back[offset] = len(data)
+                return
+            self._hashing = True
+        self._hash_in_order(data)
+
+    def finish(self) -> None:
+        """
+        Hash whatever can be hashed and was not yet, like the ranges added with :meth:`add_written`.
+
+        To be called once all chunks were written.
+        """
+        with self._lock:
+            if self._hashing:
+                return
+            data = self._pop_next()
+            if data is None:
+                return
+            self._hashing = True
+        self._hash_in_order(data)
+
+    def _pop_next(self) -> bytes | int | None:
+        # the lock has to be held; returns the next chunk, or the size of the data to read back
+        data = self._buffer.pop(self._offset, None)
+        if data is not None:
+            self._buffer_size -= len(data)
+            return data
+        size = self._read_back.pop(self._offset, None)
+        if size is not None and size > self.READ_BACK_SIZE:
+            self._read_back[self._offset + self.READ_BACK_SIZE] = size - self.READ_BACK_SIZE
+            size = self.READ_BACK_SIZE
+        return size
+
+    def _hash_in_order(self, data: bytes | int) -> None:
+        hasher_update = self.hasher.update
+        stats_collector_other = self.stats_collector.other
+        while True:
+            if isinstance(data, int):
+                data = self.read(self._offset, data)
+                self.bytes_read_back += len(data)
+                if not data:
+                    # the file is shorter than expected, the hash is not going to match anyway
+                    with self._lock:
+                        self._hashing = False
+                    return
+            before_hash = perf_counter_ns()
+            hasher_update(data)
+            hash_time = perf_counter_ns() - before_hash
+            with self._lock:
+                stats_collector_other.add_entry(hash_time)
+                self._offset += len(data)
+                data = self._pop_next()
+                if data is None:
+                    self._hashing = False
+                    return
+
+    def report(self) -> None:
+        self.stats_collector.report()
+        if self.bytes_read_back:
+            logger.info(
+                'download stats | %s | read back for hashing: %i bytes',
+                self.stats_collector,
+                self.bytes_read_back,
+            )
+
+
 def download_first_part(
     response: Response,
-    hasher,
     session: B2Session,
-    writer: WriterThread,
+    writer: WriterThread | PositionalWriter | OrderedWriter,
+    scheduler: PartScheduler,
     part_to_download: PartToDownload,
     chunk_size: int,
     encryption: EncryptionSetting | None = None,
 ) -> None:
     """
     :param response: response of the original GET call
-    :param hasher: hasher object to feed to as the stream is written
     :param session: B2 API session
-    :param writer: thread responsible for writing downloaded data
+    :param writer: writer of the downloaded data
+    :param scheduler: scheduler which handed out the part and which may resize it
     :param part_to_download: definition of the part to be downloaded
     :param chunk_size: size (in bytes) of read data chunks
     :param encryption: encryption mode, algorithm and key
@@ -319,10 +873,8 @@ def download_first_part(
     # Basic tools to figure out where the time is being spent is a must for long-term
     # maintainability.
     writer_queue_put = writer.queue_write
-    hasher_update = hasher.update
+    scheduler_claim = scheduler.claim
     local_range_start = part_to_download.local_range.start
-    actual_part_size = part_to_download.local_range.size()
-    starting_cloud_range = part_to_download.cloud_range
 
     bytes_read = 0
     url = response.request.url
@@ -330,10 +882,9 @@ def download_first_part(
     attempt = 0
 
     stats_collector = StatsCollector(
-        response.url, f'{local_range_start}:{part_to_download.local_range.end}', 'hash'
+        response.url, f'{local_range_start}:{part_to_download.local_range.end}', 'none'
     )
     stats_collector_read = stats_collector.read
-    stats_collector_other = stats_collector.other
     stats_collector_write = stats_collector.write
 
     with stats_collector.total:
@@ -360,9 +911,11 @@ def download_first_part(
                     else:
                         raise
 
-            predicted_bytes_read = bytes_read + len(data)
-            if predicted_bytes_read > actual_part_size:
-                to_write = data[: actual_part_size - bytes_read]
+            # the original response goes on until the end of the object, so the part is extended
+            # for as long as nobody else downloads what comes right after it
+            to_write_size = scheduler_claim(part_to_download, len(data), True)
+            if to_write_size < len(data):
+                to_write = data[:to_write_size]
                 part_not_completed = False
             else:
                 to_write = data
@@ -370,17 +923,15 @@ def download_first_part(
             with stats_collector_write:
                 writer_queue_put(local_range_start + bytes_read, to_write)
 
-            with stats_collector_other:
-                hasher_update(to_write)
-
             bytes_read += len(to_write)
 
         # since we got everything we need from original response, close the socket and free the buffer
-        # to avoid a timeout exception during hashing and other trouble
+        # to avoid a timeout exception and other trouble
         response.close()
-        while attempt < max_attempts and bytes_read < actual_part_size:
+        while attempt < max_attempts and bytes_read < part_to_download.cloud_range.size():
             attempt += 1
-            cloud_range = starting_cloud_range.subrange(bytes_read, actual_part_size - 1)
+            cloud_range = part_to_download.cloud_range
+            cloud_range = cloud_range.subrange(bytes_read, cloud_range.size() - 1)
             logger.debug(
                 'download part %s %s attempt: %i, bytes read already: %i. Getting range %s now.',
                 url,
@@ -400,17 +951,20 @@ def download_first_part(
                     while True:
                         with stats_collector_read:
                             try:
-                                to_write = next(response_iterator)
+                                data = next(response_iterator)
                             except StopIteration:
                                 break
 
+                        # the part might have been shortened by another stream taking over its end
+                        to_write_size = scheduler_claim(part_to_download, len(data))
+                        to_write = data[:to_write_size] if to_write_size < len(data) else data
+
                         with stats_collector_write:
                             writer_queue_put(local_range_start + bytes_read, to_write)
 
-                        with stats_collector_other:
-                            hasher_update(to_write)
-
-                        bytes_read += len(to_write)
+                        bytes_read += to_write_size
+                        if to_write_size < len(data):
+                            break
             except (B2Error, RequestException) as e:
                 should_retry = e.should_retry_http() if isinstance(e, B2Error) else True
                 if should_retry and attempt < max_attempts:
@@ -426,6 +980,7 @@ def download_first_part(
 
     stats_collector.report()
 
+    actual_part_size = part_to_download.cloud_range.size()
     if bytes_read != actual_part_size:
         logger.error(
             'Failed to download %s %s; Downloaded %d/%d after %d attempts',
@@ -453,7 +1008,8 @@ def download_first_part(
 def download_non_first_part(
     url: str,
     session: B2Session,
-    writer: WriterThread,
+    writer: WriterThread | PositionalWriter | OrderedWriter,
+    scheduler: PartScheduler,
     part_to_download: PartToDownload,
     chunk_size: int,
     encryption: EncryptionSetting | None = None,
@@ -461,15 +1017,15 @@ def download_non_first_part(
     """
     :param url: download URL
     :param session: B2 API session
-    :param writer: thread responsible for writing downloaded data
+    :param writer: writer of the downloaded data
+    :param scheduler: scheduler which handed out the part and which may shorten it
     :param part_to_download: definition of the part to be downloaded
     :param chunk_size: size (in bytes) of read data chunks
     :param encryption: encryption mode, algorithm and key
     """
     writer_queue_put = writer.queue_write
+    scheduler_claim = scheduler.claim
     local_range_start = part_to_download.local_range.start
-    actual_part_size = part_to_download.local_range.size()
-    starting_cloud_range = part_to_download.cloud_range
 
     bytes_read = 0
     max_attempts = 15  # this is hardcoded because we are going to replace the entire retry interface soon, so we'll avoid deprecation here and keep it private
@@ -481,9 +1037,10 @@ def download_non_first_part(
     stats_collector_read = stats_collector.read
     stats_collector_write = stats_collector.write
 
-    while attempt < max_attempts and bytes_read < actual_part_size:
+    while attempt < max_attempts and bytes_read < part_to_download.cloud_range.size():
         attempt += 1
-        cloud_range = starting_cloud_range.subrange(bytes_read, actual_part_size - 1)
+        cloud_range = part_to_download.cloud_range
+        cloud_range = cloud_range.subrange(bytes_read, cloud_range.size() - 1)
         logger.debug(
             'download part %s %s attempt: %i, bytes read already: %i. Getting range %s now.',
             url,
@@ -505,14 +1062,20 @@ def download_non_first_part(
                     while True:
                         with stats_collector_read:
                             try:
-                                to_write = next(response_iterator)
+                                data = next(response_iterator)
                             except StopIteration:
                                 break
 
+                        # the part might have been shortened by another stream taking over its end
+                        to_write_size = scheduler_claim(part_to_download, len(data))
+                        to_write = data[:to_write_size] if to_write_size < len(data) else data
+
                         with stats_collector_write:
                             writer_queue_put(local_range_start + bytes_read, to_write)
 
-                        bytes_read += len(to_write)
+                        bytes_read += to_write_size
+                        if to_write_size < len(data):
+                            break
             except (B2Error, RequestException) as e:
                 should_retry = e.should_retry_http() if isinstance(e, B2Error) else True
                 if should_retry and attempt < max_attempts:
@@ -528,6 +1091,7 @@ def download_non_first_part(
 
     stats_collector.report()
 
+    actual_part_size = part_to_download.cloud_range.size()
     if bytes_read != actual_part_size:
         logger.error(
             'Failed to download %s %s; Downloaded %d/%d after %d attempts',
@@ -552,6 +1116,65 @@ def download_non_first_part(
         )
 
 
+def download_parts(
+    url: str,
+    session: B2Session,
+    writer: WriterThread | PositionalWriter | OrderedWriter,
+    scheduler: PartScheduler,
+    chunk_size: int,
+    encryption: EncryptionSetting | None = None,
+    first_part: PartToDownload | None = None,
+    response: Response | None = None,
+) -> None:
+    """
+    Download the parts handed out by the scheduler, one after another, until there are none left.
+
+    :param url: download URL
+    :param session: B2 API session
+    :param writer: writer of the downloaded data
+    :param scheduler: scheduler handing out the parts to download
+    :param chunk_size: size (in bytes) of read data chunks
+    :param encryption: encryption mode, algorithm and key
+    :param first_part: the part to download from the original response first, if any
+    :param response: response of the original GET call, required with ``first_part``
+    """
+    try:
+        if first_part is not None:
+            try:
+                download_first_part(
+                    response,
+                    session,
+                    writer,
+                    scheduler,
+                    first_part,
+                    chunk_size,
+                    encryption=encryption,
+                )
+            finally:
+                scheduler.finish(first_part)
+        while True:
+            part_to_download = scheduler.get_part()
+            if part_to_download is None:
+                break
+            try:
+                download_non_first_part(
+                    url,
+                    session,
+                    writer,
+                    scheduler,
+                    part_to_download,
+                    chunk_size,
+                    encryption=encryption,
+                )
+            finally:
+                scheduler.finish(part_to_download)
+    except BaseException:
+        # the download failed, the other streams should not start any more parts nor wait for this one
+        scheduler.abort()
+        writer.abort()
+        raise
+
+
 class PartToDownload:
     """
     Hold the range of a file to download, and the range of the
@@ -561,10 +1184,134 @@ class PartToDownload:
     def __init__(self, cloud_range, local_range):
         self.cloud_range = cloud_range
         self.local_range = local_range
+        # maintained by PartScheduler while the part is being downloaded
+        self.bytes_claimed = 0
+        self.started_ns = None
 
     def __repr__(self):
         return f'PartToDownload({self.cloud_range}, {self.local_range})'
 
+    def remaining_size(self) -> int:
+        return self.cloud_range.size() - self.bytes_claimed
+
+    def resize(self, size: int) -> None:
+        self.cloud_range = self.cloud_range.subrange(0, size - 1)
+        self.local_range = self.local_range.subrange(0, size - 1)
+
+
+class PartScheduler:
+    """
+    Hand out the parts of a download to the streams downloading it.
+
+    The parts are handed out in order, from a queue shared by all streams.  Once the queue is empty,
+    a stream asking for a part splits off the second half of what remains of the part which is expected
+    to be done last (the one of the slowest stream), so that no stream sits idle while
+    another one still has a lot to download.  A part is only split if both halves are at least
+    ``min_part_size`` long.
+
+    The stream downloading a part claims every chunk of data before writing it (see :meth:`claim`),
+    so that a part is never shortened below what was already written.
+    """
+
+    def __init__(self, parts: Iterable[PartToDownload], min_part_size: int):
+        """
+        :param parts: parts to download, in order
+        :param min_part_size: minimum size of a part split off another one, in bytes
+        """
+        self.min_part_size = max(min_part_size, 1)
+        self._queue = collections.deque(parts)
+        self._in_progress: set[PartToDownload] = set()
+        self._aborted = False
+        self._lock = threading.Lock()
+
+    def get_part(self) -> PartToDownload | None:
+        """
+        Return the next part to download, or ``None`` if there is nothing left for another stream to do.
+        """
+        with self._lock:
+            if self._aborted:
+                return None
+            if self._queue:
+                part = self._queue.popleft()
+            else:
+                part = self._split_slowest_part()
+                if part is None:
+                    return None
+            part.bytes_claimed = 0
+            part.started_ns = perf_counter_ns()
+            self._in_progress.add(part)
+            logger.debug('handing out part to download: %s', part)
+            return part
+
+    def claim(self, part: PartToDownload, size: int, extend: bool = False) -> int:
+        """
+        Claim the next ``size`` bytes of the part for writing.
+
+        :param part: part being downloaded
+        :param size: size of the chunk of data which was read
+        :param extend: whether the part may be extended by the next queued part, if it is the very next range
+                       (for a stream whose response goes on past the end of the part)
+        :return: how many bytes of the chunk belong to the part and should be written
+        """
+        with self._lock:
+            remaining_size = part.remaining_size()
+            while extend and remaining_size < size and self._extend(part):
+                remaining_size = part.remaining_size()
+            size = min(size, remaining_size)
+            part.bytes_claimed += size
+            return size
+
+    def finish(self, part: PartToDownload) -> None:
+        """
+        Mark the part as no longer being downloaded.
+        """
+        with self._lock:
+            self._in_progress.discard(part)
+
+    def abort(self) -> None:
+        """
+        Stop handing out parts.
+        """
+        with self._lock:
+            self._aborted = True
+
+    def _extend(self, part: PartToDownload) -> bool:
+        if not self._queue or self._queue[0].cloud_range.start != part.cloud_range.end + 1:
+            return False
+        next_part = self._queue.popleft()
+        part.cloud_range = Range(part.cloud_range.start, next_part.cloud_range.end)
+        part.local_range = Range(part.local_range.start, next_part.local_range.end)
+        logger.debug('extended part to download: %s', part)
+        return True
+
+    def _split_slowest_part(self) -> PartToDownload | None:
+        now = perf_counter_ns()
+        slowest_part = None
+        slowest_key = None
+        for part in self._in_progress:
+            remaining_size = part.remaining_size()
+            if remaining_size < 2 * self.min_part_size:
+                continue
+            # a part which has not received any data yet is expected to take the longest
+            if part.bytes_claimed:
+                expected_time = remaining_size * (now - part.started_ns) / part.bytes_claimed
+            else:
+                expected_time = math.inf
+            key = (expected_time, remaining_size)
+            if slowest_key is None or key > slowest_key:
+                slowest_part, slowest_key = part, key
+        if slowest_part is None:
+            return None
+        kept_size = slowest_part.bytes_claimed + slowest_part.remaining_size() // 2
+        split_size = slowest_part.cloud_range.size() - kept_size
+        part = PartToDownload(
+            slowest_part.cloud_range.subrange(kept_size, kept_size + split_size - 1),
+            slowest_part.local_range.subrange(kept_size, kept_size + split_size - 1),
+        )
+        slowest_part.resize(kept_size)
+        logger.debug('split part to download: %s off %s', part, slowest_part)
+        return part
+
 
 def gen_parts(cloud_range, local_range, part_count):
     """
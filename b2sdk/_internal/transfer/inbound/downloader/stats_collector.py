@@ -39,6 +39,13 @@ class SingleStatsCollector:
         self.sum_of_all_entries += time_diff
         self.started_perf_timer = None
 
+    def add_entry(self, time_diff: int) -> None:
+        """
+        Add an entry measured elsewhere, for example by one of many threads sharing the collector.
+        """
+        self.latest_entry = time_diff
+        self.sum_of_all_entries += time_diff
+
     @property
     def sum_ms(self) -> float:
         return self.sum_of_all_entries / self.TO_MS
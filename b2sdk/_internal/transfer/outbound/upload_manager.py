@@ -183,7 +183,6 @@ class UploadManager(TransferManager, ThreadPoolMixin):
                     if not e.should_retry_upload():
                         raise
                     exception_list.append(e)
-                    self.account_info.clear_bucket_upload_data(bucket_id)
 
         large_file_upload_state.set_error(str(exception_list[-1]))
         raise MaxRetriesExceeded(self.MAX_UPLOAD_ATTEMPTS, exception_list)
@@ -239,6 +238,5 @@ class UploadManager(TransferManager, ThreadPoolMixin):
                     if not e.should_retry_upload():
                         raise
                     exception_info_list.append(e)
-                    self.account_info.clear_bucket_upload_data(bucket_id)
 
         raise MaxRetriesExceeded(self.MAX_UPLOAD_ATTEMPTS, exception_info_list)
@@ -18,3 +18,8 @@ class TransferManager:
     def __init__(self, services, **kwargs):
         self.services = services
         super().__init__(**kwargs)
+
+    def set_thread_pool_size(self, max_workers: int) -> None:
+        super().set_thread_pool_size(max_workers)
+        # the HTTP connection pools are sized after the transfer threads
+        self.services.api._configure_connection_pool()
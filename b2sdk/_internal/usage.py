@@ -0,0 +1,74 @@
+######################################################################
+#
+# File: b2sdk/_internal/usage.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class UsageStats:
+    """
+    The number and the total size of the files (or file versions) under a prefix,
+    and the newest and the oldest of their upload timestamps (in milliseconds).
+    """
+
+    count: int = 0
+    size: int = 0
+    newest_upload_timestamp: int | None = None
+    oldest_upload_timestamp: int | None = None
+
+    def add(self, size: int, upload_timestamp: int | None) -> None:
+        self.count += 1
+        self.size += size
+        if upload_timestamp is None:
+            return
+        if self.newest_upload_timestamp is None or upload_timestamp > self.newest_upload_timestamp:
+            self.newest_upload_timestamp = upload_timestamp
+        if self.oldest_upload_timestamp is None or upload_timestamp < self.oldest_upload_timestamp:
+            self.oldest_upload_timestamp = upload_timestamp
+
+
+class UsageAggregator:
+    """
+    Rolls up the files under a prefix into :class:`UsageStats` of the prefix itself
+    and of the folders under it, down to the given depth.
+
+    Memory use depends only on the number of folders tracked, not on the number of files.
+    """
+
+    def __init__(self, prefix: str = '', depth: int = 0):
+        """
+        :param prefix: the prefix all the file names start with
+        :param depth: how many levels of folders under the ``prefix`` to keep statistics of
+        """
+        self.prefix = prefix
+        self.depth = depth
+        self.stats: dict[str, UsageStats] = {prefix: UsageStats()}
+
+    def add(self, file_name: str, size: int, upload_timestamp: int | None) -> None:
+        assert file_name.startswith(self.prefix)
+        self.stats[self.prefix].add(size, upload_timestamp)
+        start = len(self.prefix)
+        for _ in range(self.depth):
+            end = file_name.find('/', start)
+            if end == -1:
+                return
+            folder_name = file_name[: end + 1]
+            stats = self.stats.get(folder_name)
+            if stats is None:
+                stats = self.stats[folder_name] = UsageStats()
+            stats.add(size, upload_timestamp)
+            start = end + 1
+
+    def get_stats(self) -> dict[str, UsageStats]:
+        """
+        Return the statistics of the prefix and of the folders under it, sorted by name.
+        """
+        return dict(sorted(self.stats.items()))
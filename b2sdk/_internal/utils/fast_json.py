@@ -0,0 +1,50 @@
+######################################################################
+#
+# File: b2sdk/_internal/utils/fast_json.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+"""
+Decoding of JSON API responses with an accelerated decoder, if one is installed.
+
+``orjson`` is preferred over ``msgspec``; if neither is available, the standard library is used.
+All of them decode UTF-8 bytes directly and raise :class:`ValueError` on malformed input.
+"""
+
+from __future__ import annotations
+
+import json
+
+from .typing import JSON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _loads_msgspec(data: bytes | str) -> JSON:
+    try:
+        return _msgspec_decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+if orjson is not None:
+    JSON_DECODER = 'orjson'
+    loads = orjson.loads
+elif msgspec is not None:
+    JSON_DECODER = 'msgspec'
+    _msgspec_decode = msgspec.json.Decoder().decode
+    loads = _loads_msgspec
+else:
+    JSON_DECODER = 'json'
+    loads = json.loads
@@ -8,6 +8,53 @@
 #
 ######################################################################
 import datetime as dt
+import re
+
+_MONTHS = {
+    'Jan': 1,
+    'Feb': 2,
+    'Mar': 3,
+    'Apr': 4,
+    'May': 5,
+    'Jun': 6,
+    'Jul': 7,
+    'Aug': 8,
+    'Sep': 9,
+    'Oct': 10,
+    'Nov': 11,
+    'Dec': 12,
+}
+
+_IMF_FIXDATE_RE = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), (\d{1,2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT'
+)
+
+
+def parse_imf_fixdate(timestamp_str: str) -> dt.datetime:
+    """
+    Parse an IMF-fixdate, like "Fri, 16 Dec 2016 20:52:30 GMT", into an aware UTC datetime.
+
+    Unlike ``strptime``, this does not depend on the current locale, so it does not need
+    to switch the (process-global) locale in order to parse english month names.
+
+    :raises ValueError: if the value is not a valid IMF-fixdate
+    """
+    match = _IMF_FIXDATE_RE.fullmatch(timestamp_str)
+    if match is None:
+        raise ValueError(f'Value {timestamp_str} is not a valid IMF-fixdate')
+    day, month_name, year, hour, minute, second = match.groups()
+    month = _MONTHS.get(month_name)
+    if month is None:
+        raise ValueError(f'Value {timestamp_str} has an invalid month name')
+    return dt.datetime(
+        int(year),
+        month,
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        tzinfo=dt.timezone.utc,
+    )
 
 
 def parse_http_date(timestamp_str: str) -> dt.datetime:
@@ -0,0 +1,75 @@
+######################################################################
+#
+# File: b2sdk/_internal/utils/read_ahead.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+_END = object()
+_PUT_TIMEOUT = 0.1
+
+
+class _Failure:
+    __slots__ = ('exception',)
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def read_ahead(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    """
+    Yield the items of the iterable, while a background thread produces up to ``depth`` items ahead.
+
+    It lets producing the next items (e.g. fetching the next page of a listing) overlap
+    with processing the current one.  Exceptions raised by the iterable are raised
+    when the consumer gets to them.  Once the returned generator is closed, the thread stops
+    after producing at most one more item.
+    With ``depth`` lower than ``1``, the iterable is iterated directly.
+    """
+    if depth < 1:
+        yield from iterable
+        return
+
+    items: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+        else:
+            put(_END)
+
+    threading.Thread(target=produce, name='b2sdk-read-ahead', daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,72 @@
+######################################################################
+#
+# File: b2sdk/_internal/utils/singleflight.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    __slots__ = ('done', 'waiters', 'result', 'exception')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.exception: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls.
+
+    While a call for a key is in flight, other threads calling :meth:`do` with the same key
+    wait for it and get (a deep copy of) its result, or its exception, instead of making
+    a call of their own. Results are not cached: a call started after the previous one
+    finished is made again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.calls_coalesced = 0
+
+    def do(self, key: Hashable, fcn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.calls_coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fcn()
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters and call.exception is None:
+                # the caller may modify the result before the waiters copy it
+                call.result = copy.deepcopy(result)
+            call.done.set()
+        return result
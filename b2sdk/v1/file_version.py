@@ -152,7 +152,7 @@ def translate_single_file_version(func):
 
 # override to return old style FileVersionInfo
 class FileVersionInfoFactory(v2.FileVersionFactory):
-    from_api_response = translate_single_file_version(v2.FileVersionFactory.from_api_response)
+    _from_api_response = translate_single_file_version(v2.FileVersionFactory._from_api_response)
 
     def from_response_headers(self, headers):
         file_info = v2.DownloadVersionFactory.file_info_from_headers(headers)
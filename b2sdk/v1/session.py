@@ -37,17 +37,7 @@ class B2Session(v2.B2Session):
         if raw_api is not None:
             self.raw_api = raw_api
 
-    def authorize_account(self, realm, application_key_id, application_key):
-        """
-        Perform account authorization.
-
-        :param str realm: a realm to authorize account in (usually just "production")
-        :param str application_key_id: :term:`application key ID`
-        :param str application_key: user's :term:`application key`
-        """
-        # Authorize
-        realm_url = self.account_info.REALM_URLS.get(realm, realm)
-        response = self.raw_api.authorize_account(realm_url, application_key_id, application_key)
+    def _store_auth_data(self, response, realm, application_key_id, application_key):
         account_id = response['accountId']
         storage_api_info = response['apiInfo']['storageApi']
 
@@ -48,6 +48,9 @@ class B2Folder(v2.B2Folder, AbstractFolder):
         return super().all_files(reporter, wrap_if_necessary(policies_manager))
 
     def get_file_versions(self):
+        if self.listing_snapshot is not None:
+            yield from super().get_file_versions()
+            return
         for file_version, _ in self.bucket.ls(
             self.folder_name,
             show_versions=True,
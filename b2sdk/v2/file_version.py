@@ -89,3 +89,5 @@ class FileVersion(v3.FileVersion):
 
 class FileVersionFactory(v3.FileVersionFactory):
     FILE_VERSION_CLASS = FileVersion
+    # the lazy file version is not an instance of this apiver's FileVersion
+    LAZY_FILE_VERSION_CLASS = None
@@ -31,6 +31,7 @@ from b2sdk._internal.api import B2Api
 from b2sdk._internal.api import Services
 from b2sdk._internal.bucket import Bucket
 from b2sdk._internal.bucket import BucketFactory
+from b2sdk._internal.usage import UsageStats
 from b2sdk._internal.raw_api import ALL_CAPABILITIES, REALM_URLS, EVENT_TYPE
 
 # encryption
@@ -96,6 +97,7 @@ from b2sdk._internal.file_version import DownloadVersionFactory
 from b2sdk._internal.file_version import FileIdAndName
 from b2sdk._internal.file_version import FileVersion
 from b2sdk._internal.file_version import FileVersionFactory
+from b2sdk._internal.file_version import LazyFileVersion
 from b2sdk._internal.large_file.part import Part
 from b2sdk._internal.large_file.unfinished_large_file import UnfinishedLargeFile
 from b2sdk._internal.large_file.services import LargeFileServices
@@ -159,6 +161,7 @@ from b2sdk._internal.stream import WritingStreamWithProgress
 from b2sdk._internal.transfer.inbound.downloaded_file import DownloadedFile
 from b2sdk._internal.transfer.inbound.downloaded_file import MtimeUpdatedFile
 from b2sdk._internal.transfer.inbound.download_manager import DownloadManager
+from b2sdk._internal.transfer.inbound.download_journal import DownloadJournal
 
 from b2sdk._internal.transfer.outbound.outbound_source import OutboundTransferSource
 from b2sdk._internal.transfer.outbound.copy_source import CopySource
@@ -179,6 +182,7 @@ from b2sdk._internal.transfer.inbound.downloader.abstract import AbstractDownloa
 from b2sdk._internal.transfer.outbound.large_file_upload_state import LargeFileUploadState
 from b2sdk._internal.transfer.inbound.downloader.parallel import ParallelDownloader
 from b2sdk._internal.transfer.inbound.downloader.parallel import PartToDownload
+from b2sdk._internal.transfer.inbound.downloader.parallel import StreamingParallelDownloader
 from b2sdk._internal.transfer.inbound.downloader.parallel import WriterThread
 from b2sdk._internal.transfer.outbound.progress_reporter import PartProgressReporter
 from b2sdk._internal.transfer.inbound.downloader.simple import SimpleDownloader
@@ -228,6 +232,7 @@ from b2sdk._internal.scan.folder import AbstractFolder
 from b2sdk._internal.scan.folder import B2Folder
 from b2sdk._internal.scan.folder import LocalFolder
 from b2sdk._internal.scan.folder_parser import parse_folder
+from b2sdk._internal.scan.listing_snapshot import ListingSnapshot
 from b2sdk._internal.scan.path import AbstractPath, B2Path, LocalPath
 from b2sdk._internal.scan.policies import convert_dir_regex_to_dir_prefix_regex
 from b2sdk._internal.scan.policies import DEFAULT_SCAN_MANAGER
@@ -258,6 +263,16 @@ from b2sdk._internal.b2http import B2Http
 from b2sdk._internal.api_config import B2HttpApiConfig
 from b2sdk._internal.api_config import DEFAULT_HTTP_API_CONFIG
 from b2sdk._internal.b2http import ClockSkewHook
+from b2sdk._internal.http_retry import CircuitBreaker
+from b2sdk._internal.http_retry import RetryBudget
+from b2sdk._internal.http_stats import Histogram
+from b2sdk._internal.http_stats import HttpCallStats
+from b2sdk._internal.http_stats import HttpTimingCallback
+from b2sdk._internal.http_timeout import AdaptiveTimeout
+from b2sdk._internal.http_transport import AbstractHttpTransport
+from b2sdk._internal.http_transport import ConnectionPoolStats
+from b2sdk._internal.http_transport import RequestsTransport
+from b2sdk._internal.http_transport import Urllib3Transport
 from b2sdk._internal.b2http import HttpCallback
 from b2sdk._internal.b2http import ResponseContextManager
 from b2sdk._internal.bounded_queue_executor import BoundedQueueExecutor
@@ -265,6 +280,7 @@ from b2sdk._internal.cache import AbstractCache
 from b2sdk._internal.cache import AuthInfoCache
 from b2sdk._internal.cache import DummyCache
 from b2sdk._internal.cache import InMemoryCache
+from b2sdk._internal.cache import TtlBucketCache
 from b2sdk._internal.http_constants import (
     BUCKET_NAME_CHARS,
     BUCKET_NAME_CHARS_UNIQ,
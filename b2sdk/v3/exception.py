@@ -34,6 +34,7 @@ from b2sdk._internal.exception import (
     CapabilityNotAllowed,
     CapExceeded,
     ChecksumMismatch,
+    CircuitBreakerOpen,
     ClockSkew,
     Conflict,
     ConnectionReset,
@@ -117,6 +118,7 @@ __all__ = (
     'CapabilityNotAllowed',
     'CapExceeded',
     'ChecksumMismatch',
+    'CircuitBreakerOpen',
     'ClockSkew',
     'Conflict',
     'ConnectionReset',
@@ -143,6 +143,69 @@ class TestUploadUrlPool:
         assert ('url_b1', 'auth_token_b1') == self.pool.take('b')
         assert (None, None) == self.pool.take('b')
 
+    def test_expired_urls_dropped(self, mocker):
+        monotonic = mocker.patch('time.monotonic', return_value=1000)
+        pool = UploadUrlPool(max_age=100)
+        pool.put('a', 'url_a1', 'auth_token_a1')
+        monotonic.return_value = 1050
+        pool.put('a', 'url_a2', 'auth_token_a2')
+        assert pool.count('a') == 2
+
+        monotonic.return_value = 1100
+        assert pool.count('a') == 1
+        assert ('url_a2', 'auth_token_a2') == pool.take('a')
+        # the age is counted from the first time the url was put in the pool
+        pool.put('a', 'url_a2', 'auth_token_a2')
+        monotonic.return_value = 1150
+        assert (None, None) == pool.take('a')
+
+    def test_healthy_pods_preferred(self):
+        for pod in ['pod-1', 'pod-2', 'pod-3']:
+            self.pool.put('a', f'https://{pod}.backblaze.com/b2api/v3/b2_upload_file/a/1', 'token')
+        self.pool.record_success('https://pod-1.backblaze.com/b2api/v3/b2_upload_file/a/0', 0.5, 1)
+        self.pool.record_success('https://pod-2.backblaze.com/b2api/v3/b2_upload_file/a/0', 0.2, 1)
+        self.pool.record_success('https://pod-3.backblaze.com/b2api/v3/b2_upload_file/a/0', 0.1, 1)
+        self.pool.record_failure('https://pod-3.backblaze.com/b2api/v3/b2_upload_file/a/0')
+
+        assert self.pool.take('a')[0].startswith('https://pod-2.')
+        assert self.pool.take('a')[0].startswith('https://pod-1.')
+        assert self.pool.take('a')[0].startswith('https://pod-3.')
+
+    def test_upload_time_relative_to_size(self):
+        for pod in ['pod-1', 'pod-2']:
+            self.pool.put('a', f'https://{pod}.backblaze.com/b2api/v3/b2_upload_file/a/1', 'token')
+        # pod-1 is faster, even though its upload took longer
+        self.pool.record_success(
+            'https://pod-1.backblaze.com/b2api/v3/b2_upload_file/a/0', 10, 100 * 1024 * 1024
+        )
+        self.pool.record_success('https://pod-2.backblaze.com/b2api/v3/b2_upload_file/a/0', 1, 1000)
+
+        assert self.pool.take('a')[0].startswith('https://pod-1.')
+
+    def test_unknown_pods_scored_as_average(self):
+        for pod in ['pod-1', 'pod-2', 'pod-3']:
+            self.pool.put('a', f'https://{pod}.backblaze.com/b2api/v3/b2_upload_file/a/1', 'token')
+        self.pool.record_success('https://pod-1.backblaze.com/b2api/v3/b2_upload_file/a/0', 0.1, 1)
+        self.pool.record_success('https://pod-3.backblaze.com/b2api/v3/b2_upload_file/a/0', 0.5, 1)
+
+        assert self.pool.take('a')[0].startswith('https://pod-1.')
+        assert self.pool.take('a')[0].startswith('https://pod-2.')
+        assert self.pool.take('a')[0].startswith('https://pod-3.')
+
+    def test_stale_data_forgotten(self, mocker):
+        monotonic = mocker.patch('time.monotonic', return_value=1000)
+        pool = UploadUrlPool(max_age=100, host_max_age=200)
+        pool.put('a', 'https://pod-1.backblaze.com/b2api/v3/b2_upload_file/a/1', 'token')
+        pool.take('a')  # and never returned
+        pool.record_success('https://pod-1.backblaze.com/b2api/v3/b2_upload_file/a/1', 0.1, 1)
+        monotonic.return_value = 1150
+        pool.record_success('https://pod-2.backblaze.com/b2api/v3/b2_upload_file/a/1', 0.1, 1)
+        assert not pool._expires_at
+
+        monotonic.return_value = 1250
+        pool.put('a', 'https://pod-2.backblaze.com/b2api/v3/b2_upload_file/a/1', 'token')
+        assert list(pool._health) == ['pod-2.backblaze.com']
+
 
 class AccountInfoBase(metaclass=ABCMeta):
     # it is a mixin to avoid running the tests directly (without inheritance)
@@ -416,10 +479,116 @@ class TestSqliteAccountInfo(AccountInfoBase):
         account_info = self._make_info()
         assert 'auth_token' == account_info.get_account_auth_token()
 
+    def test_wal_journal_mode(self):
+        account_info = self._make_info()
+        conn = account_info._get_connection()
+        assert conn.execute('PRAGMA journal_mode;').fetchone()[0] == 'wal'
+
+    def test_account_row_cached(self, account_info_default_data):
+        account_info = self._make_info()
+        account_info.set_auth_data(**account_info_default_data)
+        statements = []
+        account_info._get_connection().set_trace_callback(statements.append)
+
+        for _ in range(3):
+            account_info.get_api_url()
+            account_info.get_account_auth_token()
+
+        assert [statement for statement in statements if 'SELECT' in statement] == [
+            'SELECT * FROM account;'
+        ]
+
+    def test_changes_of_other_connection_seen(self, account_info_default_data):
+        account_info = self._make_info()
+        other_account_info = self._make_info()
+        account_info.set_auth_data(**account_info_default_data)
+        assert other_account_info.get_account_auth_token() == 'account_auth'
+
+        account_info.set_auth_data(**{**account_info_default_data, 'auth_token': 'new_token'})
+        assert other_account_info.get_account_auth_token() == 'new_token'
+        assert account_info.get_account_auth_token() == 'new_token'
+
+        other_account_info.clear()
+        with pytest.raises(MissingAccountData):
+            account_info.get_account_auth_token()
+
+    def test_bucket_upload_urls_not_shared_by_default(self):
+        account_info = self._make_info()
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-1/upload', 'token_1')
+
+        assert self._make_info().take_bucket_upload_url('bucket_1') == (None, None)
+        assert account_info.take_bucket_upload_url('bucket_1') == ('http://pod-1/upload', 'token_1')
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_bucket_upload_urls_shared(self):
+        account_info = self._make_shared_info()
+        other_account_info = self._make_shared_info()
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-1/upload', 'token_1')
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-2/upload', 'token_2')
+        assert other_account_info.count_bucket_upload_urls('bucket_1') == 2
+
+        assert other_account_info.take_bucket_upload_url('bucket_1') == (
+            'http://pod-2/upload',
+            'token_2',
+        )
+        assert account_info.take_bucket_upload_url('bucket_1') == ('http://pod-1/upload', 'token_1')
+        assert account_info.take_bucket_upload_url('bucket_1') == (None, None)
+        assert other_account_info.take_bucket_upload_url('bucket_1') == (None, None)
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_bucket_upload_url_expires(self, mocker):
+        account_info = self._make_shared_info()
+        time_mock = mocker.patch('time.time', return_value=1000)
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-1/upload', 'token_1')
+        url = account_info.take_bucket_upload_url('bucket_1')
+        assert url == ('http://pod-1/upload', 'token_1')
+
+        # returning a url does not extend its life
+        time_mock.return_value = 1000 + account_info.BUCKET_UPLOAD_URL_TTL
+        account_info.put_bucket_upload_url('bucket_1', *url)
+        assert account_info.count_bucket_upload_urls('bucket_1') == 0
+        assert account_info.take_bucket_upload_url('bucket_1') == (None, None)
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_bucket_upload_url_of_healthy_pod_taken(self):
+        account_info = self._make_shared_info()
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-1/upload', 'token_1')
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-2/upload', 'token_2')
+        account_info.record_upload_url_failure('http://pod-2/upload')
+
+        assert account_info.take_bucket_upload_url('bucket_1') == ('http://pod-1/upload', 'token_1')
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_clear_bucket_upload_data_of_other_connection(self):
+        account_info = self._make_shared_info()
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-1/upload', 'token_1')
+        account_info.put_bucket_upload_url('bucket_2', 'http://pod-2/upload', 'token_2')
+        self._make_shared_info().clear_bucket_upload_data('bucket_1')
+
+        assert account_info.take_bucket_upload_url('bucket_1') == (None, None)
+        assert account_info.count_bucket_upload_urls('bucket_2') == 1
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_bucket_upload_url_not_returned_is_forgotten(self, mocker):
+        account_info = self._make_shared_info()
+        time_mock = mocker.patch('time.time', return_value=1000)
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-1/upload', 'token_1')
+        account_info.take_bucket_upload_url('bucket_1')
+        # the upload failed without the url being reported
+
+        time_mock.return_value = 1000 + account_info.BUCKET_UPLOAD_URL_TTL
+        account_info.put_bucket_upload_url('bucket_1', 'http://pod-2/upload', 'token_2')
+        account_info.take_bucket_upload_url('bucket_1')
+
+        assert list(account_info._upload_url_expiration) == ['http://pod-2/upload']
+
     def _make_info(self):
         return self._make_sqlite_account_info()
 
-    def _make_sqlite_account_info(self, env=None, last_upgrade_to_run=None):
+    def _make_shared_info(self):
+        return self._make_sqlite_account_info(share_upload_urls=True)
+
+    def _make_sqlite_account_info(self, env=None, last_upgrade_to_run=None, **kwargs):
         """
         Returns a new SqliteAccountInfo that has just read the data from the file.
 
@@ -430,6 +599,7 @@ class TestSqliteAccountInfo(AccountInfoBase):
             return self.sqlite_account_info_factory(
                 file_name=self.db_path if not env else None,
                 last_upgrade_to_run=last_upgrade_to_run,
+                **kwargs,
             )
 
     def test_uses_xdg_config_home(self, apiver):
@@ -58,6 +58,21 @@ class TestDatabseMigrations:
 
         assert '' == new_account_info.get_s3_api_url()
 
+    @pytest.mark.apiver(from_ver=2)
+    def test_upgrade_7_upload_urls_expired(self):
+        """Upload URLs saved without an expiration time should not be used."""
+        old_account_info = self.sqlite_account_info_factory(last_upgrade_to_run=6)
+        with old_account_info._get_connection() as conn:
+            conn.execute(
+                'INSERT INTO bucket_upload_url (bucket_id, upload_url, upload_auth_token) VALUES (?, ?, ?);',
+                ('bucket_1', 'http://pod-1/upload', 'token_1'),
+            )
+        new_account_info = self.sqlite_account_info_factory(
+            file_name=old_account_info.filename, share_upload_urls=True
+        )
+
+        assert new_account_info.take_bucket_upload_url('bucket_1') == (None, None)
+
     def test_migrate_to_4(self):
         old_account_info = self.sqlite_account_info_factory(last_upgrade_to_run=0)
         old_account_info.set_auth_data_with_schema_0_for_test(**self.account_info_default_data)
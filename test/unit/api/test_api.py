@@ -33,8 +33,15 @@ from apiver_deps import (
     LegalHold,
     RawSimulator,
     RetentionMode,
+    TtlBucketCache,
+)
+from apiver_deps_exception import (
+    AccessDenied,
+    FileNotPresent,
+    InvalidArgument,
+    NonExistentBucket,
+    RestrictedBucket,
 )
-from apiver_deps_exception import AccessDenied, FileNotPresent, InvalidArgument, RestrictedBucket
 
 from ..test_base import create_key, create_key_multibucket
 
@@ -276,6 +283,38 @@ class TestApi:
         assert list_buckets(bucket_id='ID-2', use_cache=True) == []
         assert self.api.list_buckets() == []
 
+    @pytest.mark.apiver(from_ver=2)
+    def test_get_bucket_from_ttl_bucket_cache(self, mocker):
+        self.api = B2Api(
+            self.account_info,
+            TtlBucketCache(),
+            api_config=B2HttpApiConfig(_raw_api_class=RawSimulator),
+        )
+        self.raw_api = self.api.session.raw_api
+        (self.application_key_id, self.master_key) = self.raw_api.create_account()
+        self._authorize_account()
+        created_bucket = self.api.create_bucket('bucket1', 'allPrivate')
+        list_buckets = mocker.spy(self.api.session, 'list_buckets')
+
+        bucket = self.api.get_bucket_by_name('bucket1')
+        assert bucket.type_ == 'allPrivate'
+        assert bucket.bucket_dict == created_bucket.bucket_dict
+        assert self.api.get_bucket_by_id(created_bucket.id_).type_ == 'allPrivate'
+
+        bucket.update(bucket_type='allPublic')
+        assert self.api.get_bucket_by_name('bucket1').type_ == 'allPublic'
+        assert list_buckets.call_count == 0
+
+        for _ in range(2):
+            with pytest.raises(NonExistentBucket):
+                self.api.get_bucket_by_name('bucket2')
+        assert list_buckets.call_count == 1
+
+        self.api.delete_bucket(bucket)
+        with pytest.raises(NonExistentBucket):
+            self.api.get_bucket_by_name('bucket1')
+        assert list_buckets.call_count == 2
+
     def test_buckets_with_encryption(self):
         self._authorize_account()
         sse_b2_aes = EncryptionSetting(
@@ -594,6 +633,43 @@ class TestApi:
                 api_config=B2HttpApiConfig(user_agent_append='test append'),
             )
 
+    @pytest.mark.apiver(from_ver=2)
+    def test_connection_pool_sized_from_transfer_threads(self):
+        api = B2Api(
+            InMemoryAccountInfo(),
+            max_upload_workers=40,
+            max_copy_workers=4,
+            max_download_workers=16,
+        )
+        for adapter in api.session.raw_api.b2_http.session.adapters.values():
+            assert adapter._pool_connections == 42
+            assert adapter._pool_maxsize == 61
+            assert adapter.poolmanager.connection_pool_kw['maxsize'] == 61
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_connection_pool_resized_with_transfer_threads(self):
+        api = B2Api(
+            InMemoryAccountInfo(),
+            max_upload_workers=40,
+            max_copy_workers=4,
+            max_download_workers=16,
+        )
+        api.services.upload_manager.set_thread_pool_size(60)
+        for adapter in api.session.raw_api.b2_http.session.adapters.values():
+            assert adapter._pool_connections == 62
+            assert adapter.poolmanager.connection_pool_kw['maxsize'] == 81
+
+    @pytest.mark.apiver(from_ver=2)
+    def test_connection_pool_size_from_config(self):
+        api = B2Api(
+            InMemoryAccountInfo(),
+            max_upload_workers=40,
+            api_config=B2HttpApiConfig(http_pool_connections=3, http_pool_maxsize=5),
+        )
+        for adapter in api.session.raw_api.b2_http.session.adapters.values():
+            assert adapter._pool_connections == 3
+            assert adapter._pool_maxsize == 5
+
     @pytest.mark.apiver(to_ver=1)
     def test_create_and_delete_key_v1(self):
         self._authorize_account()
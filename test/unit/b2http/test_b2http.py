@@ -9,15 +9,25 @@
 from __future__ import annotations
 
 import datetime
+import io
 import locale
 import sys
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import apiver_deps
 import pytest
 import requests
 import responses
-from apiver_deps import USER_AGENT, B2Http, B2HttpApiConfig, ClockSkewHook
+from apiver_deps import (
+    USER_AGENT,
+    AdaptiveTimeout,
+    B2Http,
+    B2HttpApiConfig,
+    CircuitBreaker,
+    ClockSkewHook,
+    ConnectionPoolStats,
+    RetryBudget,
+)
 from apiver_deps_exception import (
     B2ConnectionError,
     B2RequestTimeout,
@@ -25,6 +35,7 @@ from apiver_deps_exception import (
     BadJson,
     BadRequest,
     BrokenPipe,
+    CircuitBreakerOpen,
     ClockSkew,
     ConnectionReset,
     PotentialS3EndpointPassedAsRealm,
@@ -388,6 +399,181 @@ class TestTranslateAndRetry:
         assert mock_time.mock_calls == [call(1.0), call(5), call(2.25)]
 
 
+@pytest.mark.apiver(from_ver=2)
+class TestRetryResilience:
+    URL = 'http://example.com'
+
+    @pytest.fixture
+    def mock_time(self, mocker: MockerFixture):
+        return mocker.patch('time.sleep')
+
+    def _make_b2_http(self, **kwargs):
+        return B2Http(B2HttpApiConfig(install_clock_skew_hook=False, **kwargs))
+
+    @responses.activate
+    def test_retry_budget_spent(self, mock_time: MagicMock):
+        budget = RetryBudget(retry_ratio=0.5, initial_tokens=1)
+        b2_http = self._make_b2_http(retry_budget=budget)
+        for _ in range(3):
+            _mock_error_response(self.URL, status=503)
+
+        with pytest.raises(ServiceError):
+            b2_http.request(responses.GET, self.URL, {}, try_count=5)
+
+        assert len(responses.calls) == 2
+        assert mock_time.mock_calls == [call(1.0)]
+        assert (budget.retries_allowed, budget.retries_denied) == (1, 1)
+
+    @responses.activate
+    def test_retry_budget_refilled_by_successes(self, mock_time: MagicMock):
+        budget = RetryBudget(retry_ratio=0.5, initial_tokens=0)
+        b2_http = self._make_b2_http(retry_budget=budget)
+        responses.get(self.URL)
+        responses.get(self.URL)
+        _mock_error_response(self.URL, status=503)
+        responses.get(self.URL)
+
+        for _ in range(3):
+            b2_http.request(responses.GET, self.URL, {}, try_count=5)
+
+        assert budget.retries_allowed == 1
+
+    @responses.activate
+    def test_circuit_breaker_opens(self, mock_time: MagicMock):
+        b2_http = self._make_b2_http(
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        )
+        _mock_error_response(self.URL, status=503)
+
+        with pytest.raises(ServiceError):
+            b2_http.request(responses.GET, self.URL, {}, try_count=2)
+        with pytest.raises(CircuitBreakerOpen) as exc_info:
+            b2_http.request(responses.GET, self.URL + '/other/path', {}, try_count=1)
+
+        assert exc_info.value.endpoint == self.URL
+        assert 0 < exc_info.value.retry_after_seconds <= 30
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_circuit_breaker_ignores_non_retryable_errors(self, mock_time: MagicMock):
+        b2_http = self._make_b2_http(circuit_breaker=CircuitBreaker(failure_threshold=1))
+        _mock_error_response(self.URL, status=400, code='bad_json')
+
+        for _ in range(2):
+            with pytest.raises(BadJson):
+                b2_http.request(responses.GET, self.URL, {}, try_count=1)
+
+    def test_circuit_breaker_half_open(self, mocker: MockerFixture):
+        monotonic = mocker.patch('time.monotonic', return_value=100.0)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        endpoint = breaker.get_endpoint('https://pod-000.backblaze.com/b2api/v3/b2_upload_file')
+        assert endpoint == 'https://pod-000.backblaze.com'
+
+        breaker.record_failure(endpoint)
+        assert breaker.get_open_time_left(endpoint) == 10
+        monotonic.return_value = 110.0
+        assert breaker.get_open_time_left(endpoint) == 0  # the probe
+        assert breaker.get_open_time_left(endpoint) == 10  # others wait for the probe
+        breaker.record_success(endpoint)
+        assert breaker.get_open_time_left(endpoint) == 0
+
+    @responses.activate
+    def test_decorrelated_jitter(self, mock_time: MagicMock):
+        b2_http = self._make_b2_http(decorrelated_jitter=True)
+        for _ in range(6):
+            _mock_error_response(self.URL, status=503)
+
+        with pytest.raises(ServiceError):
+            b2_http.request(responses.GET, self.URL, {}, try_count=6)
+
+        sleeps = [c.args[0] for c in mock_time.mock_calls]
+        assert sleeps[0] == 1.0
+        for previous, current in zip(sleeps, sleeps[1:]):
+            assert 1.0 <= current <= previous * 3
+
+
+def test_adaptive_timeout():
+    adaptive_timeout = AdaptiveTimeout(
+        min_timeout=10, max_timeout=300, min_throughput=1000, slowdown_factor=10
+    )
+    assert adaptive_timeout.get_read_timeout(0) == 10
+    assert adaptive_timeout.get_read_timeout(50_000) == 60
+    assert adaptive_timeout.get_read_timeout(10**9) == 300
+
+    adaptive_timeout.record_transfer(1000, 1)  # too small to be measured
+    assert adaptive_timeout.throughput is None
+
+    adaptive_timeout.record_transfer(10 * 2**20, 1)
+    adaptive_timeout.record_transfer(20 * 2**20, 1)
+    assert adaptive_timeout.throughput == 12 * 2**20
+    assert adaptive_timeout.get_read_timeout(12 * 2**20) == 20
+
+
+@pytest.mark.apiver(from_ver=2)
+class TestAdaptiveTimeout:
+    URL = 'http://example.com'
+
+    @pytest.fixture
+    def b2_http(self):
+        return B2Http(
+            B2HttpApiConfig(
+                install_clock_skew_hook=False,
+                adaptive_timeout=AdaptiveTimeout(min_timeout=10, min_throughput=1000),
+            )
+        )
+
+    def _expect_timeout(self, read_timeout):
+        return matchers.request_kwargs_matcher(
+            {'timeout': (B2Http.CONNECTION_TIMEOUT, read_timeout)}
+        )
+
+    @responses.activate
+    def test_json_call(self, b2_http):
+        expected_timeout = 10 + len(b'{}') / 1000
+        responses.post(
+            self.URL + '/b2_list_file_names',
+            json={},
+            match=[self._expect_timeout(expected_timeout)],
+        )
+        b2_http.post_json_return_json(self.URL + '/b2_list_file_names', {}, {}, try_count=1)
+
+    @responses.activate
+    def test_copy_keeps_its_timeout(self, b2_http):
+        responses.post(
+            self.URL + '/b2_copy_part',
+            json={},
+            match=[self._expect_timeout(B2Http.TIMEOUT_FOR_COPY)],
+        )
+        b2_http.post_json_return_json(self.URL + '/b2_copy_part', {}, {}, try_count=1)
+
+    @responses.activate
+    def test_upload(self, b2_http):
+        responses.post(self.URL, json={}, match=[self._expect_timeout(600)])  # capped
+        data = io.BytesIO(b'x' * 2**20)
+        b2_http.post_content_return_json(
+            self.URL, {'Content-Length': str(2**20)}, data, try_count=1
+        )
+        assert b2_http.adaptive_timeout.throughput is not None
+
+    @responses.activate
+    def test_download_keeps_its_timeout(self, b2_http):
+        responses.get(self.URL, match=[self._expect_timeout(B2Http.TIMEOUT)])
+        with b2_http.get_content(self.URL, {}, try_count=1):
+            pass
+
+    @responses.activate
+    def test_download_timeout_floor(self):
+        b2_http = B2Http(
+            B2HttpApiConfig(
+                install_clock_skew_hook=False,
+                adaptive_timeout=AdaptiveTimeout(min_timeout=300),
+            )
+        )
+        responses.get(self.URL, match=[self._expect_timeout(300)])
+        with b2_http.get_content(self.URL, {}, try_count=1):
+            pass
+
+
 class TestB2Http:
     URL = 'http://example.com'
     HEADERS = dict(my_header='my_value')
@@ -479,6 +665,29 @@ class TestB2Http:
 
         assert response.headers['color'] == 'blue'
 
+    def test_set_connection_pool_size(self, b2_http: B2Http):
+        old_adapters = list(b2_http.session.adapters.values())
+        b2_http.set_connection_pool_size(pool_maxsize=64)
+
+        assert not set(map(id, b2_http.session.adapters.values())) & set(map(id, old_adapters))
+        for adapter in b2_http.session.adapters.values():
+            assert adapter._pool_connections == requests.adapters.DEFAULT_POOLSIZE
+            assert adapter._pool_maxsize == 64
+            pool = adapter.poolmanager.connection_from_url(self.URL)
+            assert pool.pool.maxsize == 64
+
+    def test_get_connection_pool_stats(self, b2_http: B2Http):
+        assert b2_http.get_connection_pool_stats() == ConnectionPoolStats()
+
+        adapter = b2_http.session.get_adapter(self.URL)
+        pool = adapter.poolmanager.connection_from_url(self.URL)
+        pool.num_connections = 2
+        pool.num_requests = 5
+
+        stats = b2_http.get_connection_pool_stats()
+        assert stats == ConnectionPoolStats(connections_created=2, requests=5)
+        assert stats.connections_reused_estimate == 3
+
 
 class TestB2HttpUserAgentAppend(TestB2Http):
     UA_APPEND = 'ua_extra_string'
@@ -547,3 +756,25 @@ class TestClockSkewHook(TestBase):
         response.headers = {'Date': now_str}
         with self.assertRaises(ClockSkew):
             ClockSkewHook().post_request('POST', 'http://example.com', {}, response)
+
+    def test_does_not_switch_locale(self):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        response = MagicMock()
+        response.headers = {'Date': now.strftime('%a, %d %b %Y %H:%M:%S GMT')}
+        with patch('locale.setlocale') as setlocale_mock:
+            ClockSkewHook().post_request('POST', 'http://example.com', {}, response)
+        setlocale_mock.assert_not_called()
+
+    def test_check_interval(self):
+        skewed = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=11)
+        response = MagicMock()
+        response.headers = {'Date': skewed.strftime('%a, %d %b %Y %H:%M:%S GMT')}
+        hook = ClockSkewHook(check_interval=60)
+        with patch('time.monotonic', return_value=1000.0):
+            with self.assertRaises(ClockSkew):
+                hook.post_request('POST', 'http://example.com', {}, response)
+        with patch('time.monotonic', return_value=1059.0):
+            hook.post_request('POST', 'http://example.com', {}, response)
+        with patch('time.monotonic', return_value=1060.0):
+            with self.assertRaises(ClockSkew):
+                hook.post_request('POST', 'http://example.com', {}, response)
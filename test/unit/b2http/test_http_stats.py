@@ -0,0 +1,133 @@
+######################################################################
+#
+# File: test/unit/b2http/test_http_stats.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import threading
+
+import pytest
+import responses
+from apiver_deps import (
+    B2Api,
+    B2Http,
+    B2HttpApiConfig,
+    Histogram,
+    HttpTimingCallback,
+    InMemoryAccountInfo,
+)
+from pytest_mock import MockerFixture
+
+from b2sdk._internal.http_stats import get_api_name
+
+pytestmark = pytest.mark.apiver(from_ver=2)
+
+API_URL = 'https://api000.backblazeb2.com/b2api/v3/b2_list_file_names'
+DOWNLOAD_URL = 'https://f000.backblazeb2.com/file/bucket/some/file.txt'
+
+
+@pytest.mark.parametrize(
+    'url,api_name',
+    [
+        (API_URL, 'b2_list_file_names'),
+        ('https://pod-000.backblaze.com/b2api/v3/b2_upload_part/4_z1/c001', 'b2_upload_part'),
+        ('https://f000.backblazeb2.com/b2api/v3/b2_download_file_by_id', 'b2_download_file_by_id'),
+        (DOWNLOAD_URL, 'download_file_by_name'),
+        ('https://example.com/', 'other'),
+    ],
+)
+def test_get_api_name(url, api_name):
+    assert get_api_name(url) == api_name
+
+
+def test_histogram():
+    histogram = Histogram(unit=0.001)
+    for value in [0.0005, 0.003, 0.003, 0.1]:
+        histogram.add(value)
+
+    assert histogram.counts == [1, 0, 2] + [0] * 4 + [1]
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(0.1065 / 4)
+    assert histogram.percentile(50) == 0.004
+    assert histogram.percentile(100) == 0.1
+
+    other = Histogram(unit=0.001)
+    other.add(0.0001)
+    histogram.merge(other)
+    assert histogram.counts[0] == 2
+    assert histogram.count == 5
+
+
+@pytest.fixture
+def timing_callback():
+    return HttpTimingCallback()
+
+
+@pytest.fixture
+def b2_http(timing_callback):
+    b2_http = B2Http(B2HttpApiConfig(install_clock_skew_hook=False))
+    b2_http.add_callback(timing_callback)
+    return b2_http
+
+
+@responses.activate
+def test_json_call(b2_http, timing_callback, mocker: MockerFixture):
+    mocker.patch('time.sleep')
+    responses.post(API_URL, status=503, json={'status': 503, 'code': 'busy', 'message': ''})
+    responses.post(API_URL, json={'files': []})
+
+    b2_http.post_json_return_json(API_URL, {}, {'bucketId': '1'})
+
+    stats = timing_callback.get_stats()['b2_list_file_names']
+    assert stats.attempts == 2
+    assert stats.retries == 1
+    assert stats.failed_attempts == 1
+    assert stats.time_to_first_byte.count == 2
+    assert stats.body_read_time.count == 1
+    assert stats.bytes_read.total == len(b'{"files": []}')
+    assert stats.bytes_sent.total == 2 * len(b'{"bucketId": "1"}')
+
+
+@responses.activate
+def test_streamed_download(b2_http, timing_callback):
+    responses.get(DOWNLOAD_URL, body=b'x' * 1000)
+
+    with b2_http.get_content(DOWNLOAD_URL, {}) as response:
+        assert timing_callback.get_stats()['download_file_by_name'].body_read_time.count == 0
+        for _ in response.iter_content(100):
+            pass
+
+    stats = timing_callback.get_stats()['download_file_by_name']
+    assert stats.attempts == 1
+    assert stats.retries == 0
+    assert stats.body_read_time.count == 1
+    assert stats.bytes_read.total == 1000
+
+
+@responses.activate
+def test_threads_merged(b2_http, timing_callback):
+    responses.post(API_URL, json={})
+
+    threads = [
+        threading.Thread(target=b2_http.post_json_return_json, args=(API_URL, {}, {}))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert timing_callback.get_stats()['b2_list_file_names'].attempts == 4
+
+
+def test_b2api_get_http_stats():
+    assert B2Api(InMemoryAccountInfo()).get_http_stats() == {}
+
+    b2_api = B2Api(InMemoryAccountInfo(), api_config=B2HttpApiConfig(collect_http_stats=True))
+    assert b2_api.http_timing_callback in b2_api.session.raw_api.b2_http.callbacks
+    assert b2_api.get_http_stats() == {}
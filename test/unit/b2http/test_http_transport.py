@@ -0,0 +1,129 @@
+######################################################################
+#
+# File: test/unit/b2http/test_http_transport.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from apiver_deps import B2Http, B2HttpApiConfig, RequestsTransport, Urllib3Transport
+from apiver_deps_exception import B2ConnectionError, ServiceError
+
+pytestmark = pytest.mark.apiver(from_ver=2)
+
+PAYLOAD = bytes(range(256)) * 1024
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        path = urlsplit(self.path)
+        if path.path == '/json':
+            self._send(200, json.dumps(parse_qs(path.query)).encode(), 'application/json')
+        elif path.path == '/payload':
+            self._send(200, PAYLOAD, 'application/octet-stream')
+        else:
+            error = {'status': 503, 'code': 'service_unavailable', 'message': 'busy'}
+            self._send(503, json.dumps(error).encode(), 'application/json')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self._send(200, json.dumps({'received': json.loads(body)}).encode(), 'application/json')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:%d' % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=[RequestsTransport, Urllib3Transport])
+def b2_http(request):
+    b2_http = B2Http(
+        B2HttpApiConfig(install_clock_skew_hook=False, http_transport_factory=request.param)
+    )
+    yield b2_http
+    b2_http.close()
+
+
+def test_get_json_with_params(b2_http, server_url):
+    result = b2_http.request_content_return_json(
+        'GET', server_url + '/json', {}, params={'maxFileCount': 3}, try_count=1
+    )
+    assert result == {'maxFileCount': ['3']}
+
+
+def test_post_json(b2_http, server_url):
+    result = b2_http.post_json_return_json(server_url + '/json', {}, {'a': 1}, try_count=1)
+    assert result == {'received': {'a': 1}}
+
+
+def test_stream(b2_http, server_url):
+    with b2_http.get_content(server_url + '/payload', {}, try_count=1) as response:
+        assert response.headers['content-length'] == str(len(PAYLOAD))
+        assert response.request.url == server_url + '/payload'
+        assert b''.join(response.iter_content(chunk_size=1000)) == PAYLOAD
+        assert response.raw.tell() == len(PAYLOAD)
+        response.close()
+
+
+def test_error_translated(b2_http, server_url):
+    with pytest.raises(ServiceError):
+        b2_http.request('GET', server_url + '/unavailable', {}, try_count=1)
+
+
+def test_connection_refused(b2_http):
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    with pytest.raises(B2ConnectionError):
+        b2_http.request('GET', 'http://127.0.0.1:%d/json' % port, {}, try_count=1)
+
+
+def test_connections_reused(b2_http, server_url):
+    for _ in range(3):
+        b2_http.request_content_return_json('GET', server_url + '/json', {}, try_count=1)
+
+    stats = b2_http.get_connection_pool_stats()
+    assert stats.connections_created == 1
+    assert stats.connections_reused_estimate == 2
+
+
+def test_urllib3_readinto(server_url):
+    b2_http = B2Http(
+        B2HttpApiConfig(install_clock_skew_hook=False, http_transport_factory=Urllib3Transport)
+    )
+    buffer = bytearray(len(PAYLOAD))
+    view = memoryview(buffer)
+    with b2_http.get_content(server_url + '/payload', {}, try_count=1) as response:
+        offset = 0
+        while size := response.readinto(view[offset : offset + 10000]):
+            offset += size
+        response.close()
+    assert offset == len(PAYLOAD)
+    assert buffer == PAYLOAD
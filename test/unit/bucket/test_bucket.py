@@ -13,6 +13,7 @@ import contextlib
 import dataclasses
 import datetime
 import io
+import json
 import os
 import pathlib
 import platform
@@ -31,6 +32,7 @@ from apiver_deps_exception import (
     B2Error,
     B2RequestTimeoutDuringUpload,
     BucketIdNotFound,
+    ChecksumMismatch,
     DestinationDirectoryDoesntAllowOperation,
     DestinationDirectoryDoesntExist,
     DestinationIsADirectory,
@@ -77,6 +79,7 @@ from apiver_deps import (
     BucketSimulator,
     CopySource,
     DownloadedFile,
+    DownloadJournal,
     DownloadVersion,
     DummyCache,
     EncryptionAlgorithm,
@@ -100,10 +103,12 @@ from apiver_deps import (
     RetentionMode,
     RetentionPeriod,
     SimpleDownloader,
+    StreamingParallelDownloader,
     StubAccountInfo,
     UploadMode,
     UploadSourceBytes,
     UploadSourceLocalFile,
+    UsageStats,
     WriteIntent,
     hex_sha1_of_bytes,
 )
@@ -430,6 +435,10 @@ class TestListParts(TestCaseWithBucket):
             Part('9999', 3, 11, content_sha1),
         ]
         self.assertEqual(expected_parts, list(self.bucket.list_parts(file1.file_id, batch_size=1)))
+        self.assertEqual(
+            expected_parts,
+            list(self.bucket.list_parts(file1.file_id, batch_size=1, read_ahead_pages=2)),
+        )
 
 
 class TestUploadPart(TestCaseWithBucket):
@@ -720,6 +729,117 @@ class TestLs(TestCaseWithBucket):
         ]
         self.assertEqual(expected, actual)
 
+    def test_recursive_parallel_and_read_ahead(self):
+        data = b'hello world'
+        for file_name in ['a', 'b/1/x', 'b/1/y', 'b/2', 'b/20/x', 'b/3', 'bb', 'c/\u017c', 'd']:
+            self.bucket.upload_bytes(data, file_name)
+        self.bucket.upload_bytes(data, 'b/1/x')
+        self.bucket.hide_file('b/20/x')
+
+        for path in ['', 'b/']:
+            for show_versions in [False, True]:
+                expected = [
+                    (info.file_name, info.id_)
+                    for info, _ in self.bucket_ls(path, show_versions=show_versions, recursive=True)
+                ]
+                actual = [
+                    (info.file_name, info.id_)
+                    for info, _ in self.bucket_ls(
+                        path,
+                        show_versions=show_versions,
+                        recursive=True,
+                        fetch_count=1,
+                        max_workers=4,
+                    )
+                ]
+                assert actual == expected
+
+                actual = [
+                    (info.file_name, info.id_)
+                    for info, _ in self.bucket_ls(
+                        path,
+                        show_versions=show_versions,
+                        recursive=True,
+                        fetch_count=1,
+                        read_ahead_pages=2,
+                    )
+                ]
+                assert actual == expected
+
+    def test_lazy_file_versions(self):
+        data = b'hello world'
+        for file_name in ['a', 'b/1', 'b/2']:
+            self.bucket.upload_bytes(data, file_name)
+        self.bucket.hide_file('b/2')
+
+        for kwargs in [{}, {'recursive': True}, {'recursive': True, 'show_versions': True}]:
+            expected = list(self.bucket_ls('b/', **kwargs))
+            assert list(self.bucket_ls('b/', lazy_file_versions=True, **kwargs)) == expected
+        assert list(self.bucket.list_file_versions('a', lazy_file_versions=True)) == list(
+            self.bucket.list_file_versions('a')
+        )
+
+    def test_wildcard_matching_parallel(self):
+        data = b'hello world'
+        for file_name in ['a.txt', 'b/1/test-1.txt', 'b/2/test-2.csv', 'b/3/test-3.txt']:
+            self.bucket.upload_bytes(data, file_name)
+        actual = [
+            info.file_name
+            for info, _ in self.bucket_ls(
+                'b/*.txt', recursive=True, with_wildcard=True, fetch_count=1, max_workers=3
+            )
+        ]
+        assert actual == ['b/1/test-1.txt', 'b/3/test-3.txt']
+
+    def test_wildcard_and_filters_list_planned_prefixes(self):
+        data = b'hello world'
+        file_names = [
+            'logs/2024-01/a.gz',
+            'logs/2024-01/b.txt',
+            'logs/2024-02/b.gz',
+            'logs/2024-02/tmp/c.gz',
+            'logs/2024-03/d.gz',
+            'logs/2024-04/e.gz',
+            'logs/2024-10/f.gz',
+        ]
+        for file_name in file_names:
+            self.bucket.upload_bytes(data, file_name)
+        expected = ['logs/2024-01/a.gz', 'logs/2024-02/b.gz', 'logs/2024-03/d.gz']
+
+        for kwargs in [{}, {'max_workers': 3}, {'read_ahead_pages': 2}]:
+            with mock.patch.object(
+                self.simulator, 'list_file_names', wraps=self.simulator.list_file_names
+            ) as list_file_names:
+                actual = [
+                    info.file_name
+                    for info, _ in self.bucket_ls(
+                        'logs/2024-0[1-3]/*.gz',
+                        recursive=True,
+                        with_wildcard=True,
+                        filters=[Filter.exclude('logs/2024-02/tmp/*')],
+                        fetch_count=1,
+                        **kwargs,
+                    )
+                ]
+            assert actual == expected
+            prefixes = {call.kwargs['prefix'] for call in list_file_names.call_args_list}
+            assert prefixes == {'logs/2024-01/', 'logs/2024-02/', 'logs/2024-03/'}
+            assert not any(
+                call.kwargs['start_file_name'].startswith('logs/2024-02/tmp/')
+                for call in list_file_names.call_args_list
+            )
+
+        actual = [
+            (info.file_name, folder)
+            for info, folder in self.bucket_ls(
+                'logs/', filters=[Filter.include('logs/2024-0[24]/*')]
+            )
+        ]
+        assert actual == [
+            ('logs/2024-02/b.gz', 'logs/2024-02/'),
+            ('logs/2024-04/e.gz', 'logs/2024-04/'),
+        ]
+
     def test_wildcard_matching(self):
         data = b'hello world'
         self.bucket.upload_bytes(data, 'a')
@@ -1148,6 +1268,70 @@ class TestGetFreshState(TestCaseWithBucket):
             self.bucket.get_fresh_state()
 
 
+class TestGetUsage(TestCaseWithBucket):
+    def setUp(self):
+        super().setUp()
+        for file_name, data in [
+            ('a', b'1'),
+            ('b/1', b'22'),
+            ('b/1', b'333'),
+            ('b/c/2', b'4444'),
+            ('b/c/3', b'55555'),
+            ('d/4', b'666666'),
+        ]:
+            self.bucket.upload_bytes(data, file_name)
+        self.bucket.hide_file('b/c/3')
+        large_file = self.api.services.large_file.start_large_file(self.bucket_id, 'b/big')
+        large_file_upload_state = mock.MagicMock()
+        large_file_upload_state.has_error.return_value = False
+        self.api.services.upload_manager.upload_part(
+            self.bucket_id,
+            large_file.file_id,
+            UploadSourceBytes(b'hello world'),
+            1,
+            large_file_upload_state,
+        ).result()
+
+    def get_counts_and_sizes(self, *args, **kwargs):
+        return {
+            folder: (stats.count, stats.size)
+            for folder, stats in self.bucket.get_usage(*args, **kwargs).items()
+        }
+
+    def test_latest_only(self):
+        assert self.get_counts_and_sizes() == {'': (4, 14)}
+        assert self.get_counts_and_sizes(depth=2) == {
+            '': (4, 14),
+            'b/': (2, 7),
+            'b/c/': (1, 4),
+            'd/': (1, 6),
+        }
+        assert self.get_counts_and_sizes('b', depth=5, max_workers=3, fetch_count=1) == {
+            'b/': (2, 7),
+            'b/c/': (1, 4),
+        }
+
+    def test_hidden_and_unfinished(self):
+        assert self.get_counts_and_sizes('b/', depth=1, include_hidden=True) == {
+            'b/': (3, 12),
+            'b/c/': (2, 9),
+        }
+        assert self.get_counts_and_sizes('b/', include_unfinished=True) == {'b/': (3, 18)}
+
+    def test_all_versions(self):
+        assert self.get_counts_and_sizes('b/', depth=1, latest_only=False) == {
+            'b/': (4, 14),
+            'b/c/': (2, 9),
+        }
+
+    def test_upload_timestamps(self):
+        file_versions = list(self.bucket.list_file_versions('b/1'))
+        stats = self.bucket.get_usage('b/', latest_only=False)['b/']
+        assert stats.newest_upload_timestamp >= stats.oldest_upload_timestamp
+        assert stats.oldest_upload_timestamp <= file_versions[-1].upload_timestamp
+        assert self.bucket.get_usage('x/')['x/'] == UsageStats()
+
+
 class TestListVersions(TestCaseWithBucket):
     def test_single_version(self):
         data = b'hello world'
@@ -1192,6 +1376,12 @@ class TestListVersions(TestCaseWithBucket):
         ]
         self.assertEqual(expected, actual)
 
+        actual = [
+            (info.id_, info.file_name, info.size, info.action)
+            for info in self.bucket.list_file_versions('a', fetch_count=1, read_ahead_pages=1)
+        ]
+        self.assertEqual(expected, actual)
+
     def test_ignores_subdirectory(self):
         data = b'hello world'
         file_id = self.bucket.upload_bytes(data, 'a/b').id_
@@ -2655,7 +2845,7 @@ class DownloadTests(DownloadTestsBase):
         non_seekable_strategies = [
             strat
             for strat in self.bucket.api.services.download_manager.strategies
-            if not isinstance(strat, ParallelDownloader)
+            if not strat.REQUIRES_SEEKING
         ]
         context = (
             contextlib.nullcontext()
@@ -2680,7 +2870,7 @@ class DownloadTests(DownloadTestsBase):
         non_seekable_strategies = [
             strat
             for strat in self.bucket.api.services.download_manager.strategies
-            if not isinstance(strat, ParallelDownloader)
+            if not strat.REQUIRES_SEEKING
         ]
         context = (
             contextlib.nullcontext()
@@ -2755,7 +2945,7 @@ class TestChooseStrategy(TestCaseWithBucket):
             min_part_size=16,
             thread_pool=download_manager._thread_pool,
         )
-        simple_downloader = download_manager.strategies[1]
+        simple_downloader = download_manager.strategies[-1]
         download_manager.strategies = [
             parallel_downloader,
             simple_downloader,
@@ -2814,6 +3004,26 @@ class TestDownloadParallel(
         ]
 
 
+class TestDownloadStreamingParallel(
+    DownloadTests,
+    UnverifiedChecksumDownloadScenarioMixin,
+    TestCaseWithBucket,
+):
+    def setUp(self):
+        super().setUp()
+        download_manager = self.bucket.api.services.download_manager
+        download_manager.strategies = [
+            # parts of 2 bytes, with 3 streams ahead of the one writing
+            StreamingParallelDownloader(
+                force_chunk_size=1,
+                max_streams=4,
+                min_part_size=2,
+                max_buffer_size=8,
+                thread_pool=download_manager._thread_pool,
+            ),
+        ]
+
+
 class TestDownloadParallelALotOfStreams(DownloadTestsBase, TestCaseWithBucket):
     DATA = ''.join(['01234567890abcdef'] * 32)
 
@@ -2837,6 +3047,122 @@ class TestDownloadParallelALotOfStreams(DownloadTestsBase, TestCaseWithBucket):
         self._verify(self.DATA)
 
 
+@pytest.mark.apiver(from_ver=2)
+class TestDownloadResumable(DownloadTestsBase, TestCaseWithBucket):
+    # small enough to be uploaded as a single part, with its SHA1 known
+    DATA = '0123456789abcdef' * 12
+
+    def set_downloader(self, max_streams):
+        download_manager = self.bucket.api.services.download_manager
+        download_manager.strategies = [
+            ParallelDownloader(
+                force_chunk_size=4,
+                max_streams=max_streams,
+                min_part_size=16,
+                thread_pool=download_manager._thread_pool,
+            ),
+        ]
+
+    def test_save_to__resumed(self):
+        session = self.bucket.api.services.session
+        download_file_from_url = session.download_file_from_url
+        requested_ranges = []
+
+        def recorded_download(url, range_=None, *args, **kwargs):
+            requested_ranges.append(range_)
+            return download_file_from_url(url, range_, *args, **kwargs)
+
+        def interrupt(byte_count):
+            if byte_count > 96:
+                raise ConnectionError('connection lost')
+
+        interrupting_listener = StubProgressListener()
+        interrupting_listener.bytes_completed = interrupt
+
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'file'
+            journal_path = DownloadJournal.get_path(path)
+
+            # a single stream writes the file in order, until the progress listener fails
+            self.set_downloader(max_streams=1)
+            with pytest.raises(ConnectionError):
+                self.bucket.download_file_by_id(
+                    self.file_version.id_, progress_listener=interrupting_listener
+                ).save_to(path, resumable=True)
+            assert json.loads(journal_path.read_text())['ranges'] == [[0, 95]]
+
+            self.set_downloader(max_streams=4)
+            with mock.patch.object(session, 'download_file_from_url', recorded_download):
+                self.bucket.download_file_by_id(
+                    self.file_version.id_, progress_listener=self.progress_listener
+                ).save_to(path, resumable=True)
+
+            assert path.read_bytes() == self.DATA.encode()
+            assert not journal_path.exists()
+            # the original request, then only the missing ranges
+            assert requested_ranges[0] is None
+            assert all(range_[0] >= 96 for range_ in requested_ranges[1:])
+            assert self.progress_listener.last_byte_count == len(self.DATA)
+
+    def test_save_to__not_resumed_for_another_version(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'file'
+            path.write_bytes(b'x' * len(self.DATA))
+            journal = DownloadJournal(
+                DownloadJournal.get_path(path),
+                self.bucket.download_file_by_id(self.file_version.id_).download_version,
+            )
+            journal.add(0, len(self.DATA))
+            journal.save()
+            # the file was overwritten with a new version since
+            file_version = self.bucket.upload_bytes(self.DATA.encode(), 'file1')
+            self.set_downloader(max_streams=4)
+
+            self.bucket.download_file_by_id(file_version.id_).save_to(path, resumable=True)
+
+            assert path.read_bytes() == self.DATA.encode()
+            assert not journal.path.exists()
+
+    def test_save_to__corrupted_data_is_downloaded_again(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'file'
+            path.write_bytes(b'x' * 96)
+            journal = DownloadJournal(
+                DownloadJournal.get_path(path),
+                self.bucket.download_file_by_id(self.file_version.id_).download_version,
+            )
+            journal.add(0, 96)
+            journal.save()
+            self.set_downloader(max_streams=4)
+
+            with pytest.raises(ChecksumMismatch):
+                self.bucket.download_file_by_id(self.file_version.id_).save_to(path, resumable=True)
+            assert not journal.path.exists()
+
+            self.bucket.download_file_by_id(self.file_version.id_).save_to(path, resumable=True)
+
+            assert path.read_bytes() == self.DATA.encode()
+            assert not journal.path.exists()
+
+    def test_save_to__not_resumed_without_sha1(self):
+        downloaded_file = self.bucket.download_file_by_id(self.file_version.id_)
+        downloaded_file.download_version.content_sha1 = 'none'
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'file'
+            path.write_bytes(b'x' * 96)
+            journal = DownloadJournal(
+                DownloadJournal.get_path(path), downloaded_file.download_version
+            )
+            journal.add(0, 96)
+            journal.save()
+            self.set_downloader(max_streams=4)
+
+            downloaded_file.save_to(path, resumable=True)
+
+            # the data which could not be verified is downloaded again
+            assert path.read_bytes() == self.DATA.encode()
+
+
 # Truncated downloads
 
 
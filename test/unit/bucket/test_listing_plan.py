@@ -0,0 +1,96 @@
+######################################################################
+#
+# File: test/unit/bucket/test_listing_plan.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import pytest
+
+from b2sdk._internal.filter import Filter
+from b2sdk._internal.listing_plan import (
+    get_excluded_prefixes,
+    get_filter_prefixes,
+    get_pattern_prefixes,
+    get_prefix_end,
+    get_skip_point,
+    plan_listing_prefixes,
+)
+
+
+@pytest.mark.parametrize(
+    'prefix,prefix_end',
+    [
+        ('a/', 'a0'),
+        ('a/퟿', 'a/'),
+        ('a\U0010ffff', 'b'),
+        ('\U0010ffff', None),
+        ('', None),
+    ],
+)
+def test_get_prefix_end(prefix, prefix_end):
+    assert get_prefix_end(prefix) == prefix_end
+
+
+@pytest.mark.parametrize(
+    'pattern,prefixes',
+    [
+        ('logs/*.gz', ['logs/']),
+        ('logs/2024-0[1-3]/*.gz', ['logs/2024-01/', 'logs/2024-02/', 'logs/2024-03/']),
+        ('a/[ba]/[xy]?', ['a/a/x', 'a/a/y', 'a/b/x', 'a/b/y']),
+        ('a/[!b]/x', ['a/']),
+        ('a/[]]x', ['a/]x']),
+        ('a/[x', ['a/[x']),
+        ('a/[c-a]', []),
+        ('a/[a-z]', ['a/']),
+        ('a/[0-9]*', ['a/0', 'a/1', 'a/2', 'a/3', 'a/4', 'a/5', 'a/6', 'a/7', 'a/8', 'a/9']),
+        ('a/[0-9][0-9]', [f'a/{index}' for index in range(10)]),
+        ('?', ['']),
+    ],
+)
+def test_get_pattern_prefixes(pattern, prefixes):
+    assert get_pattern_prefixes(pattern, max_prefixes=10) == prefixes
+
+
+@pytest.mark.parametrize(
+    'filters,prefixes',
+    [
+        ([], ['']),
+        ([Filter.include('b/*'), Filter.include('a/[12]*')], ['a/1', 'a/2', 'b/']),
+        ([Filter.include('a/*'), Filter.include('a/b/*')], ['a/']),
+        ([Filter.include('a/*'), Filter.exclude('*.txt')], ['']),
+        ([Filter.exclude('*'), Filter.include('a/*'), Filter.exclude('*.txt')], ['a/']),
+        ([Filter.exclude('*.txt'), Filter.include('a/*')], ['']),
+        ([Filter.include('a*'), Filter.include('ab*'), Filter.include('b*')], ['a', 'b']),
+        ([Filter.include(f'a/{name}') for name in 'wxyz'], ['a/']),
+    ],
+)
+def test_get_filter_prefixes(filters, prefixes):
+    assert get_filter_prefixes(filters, max_prefixes=3) == prefixes
+
+
+def test_get_excluded_prefixes():
+    assert get_excluded_prefixes([Filter.exclude('tmp/*'), Filter.exclude('*.txt')]) == ['tmp/']
+    assert get_excluded_prefixes([Filter.exclude('tmp/*'), Filter.include('tmp/a*')]) == []
+    assert get_excluded_prefixes([Filter.include('a/*'), Filter.exclude('a/tmp/*')]) == ['a/tmp/']
+    assert get_excluded_prefixes([Filter.exclude('a?/*')]) == []
+
+
+def test_get_skip_point():
+    assert get_skip_point('a/b', ['a/c/']) == 'a/b'
+    assert get_skip_point('a/c/1', ['a/c/']) == 'a/c0'
+    assert get_skip_point('a/c/1', ['a/c/', 'a/c0']) == 'a/c1'
+    assert get_skip_point('a', ['']) is None
+
+
+def test_plan_listing_prefixes():
+    assert plan_listing_prefixes('logs/') == ['logs/']
+    assert plan_listing_prefixes('logs/', 'logs/202[34]/*') == ['logs/2023/', 'logs/2024/']
+    assert plan_listing_prefixes(
+        'logs/', 'logs/202[34]/*', [Filter.include('logs/2024/0[12]*'), Filter.include('x/*')]
+    ) == ['logs/2024/01', 'logs/2024/02']
+    assert plan_listing_prefixes('logs/', filters=[Filter.include('x/*')]) == []
@@ -0,0 +1,79 @@
+######################################################################
+#
+# File: test/unit/bucket/test_parallel_listing.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import bisect
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from b2sdk._internal.parallel_listing import ParallelLister, get_split_point
+
+
+@pytest.mark.parametrize(
+    'start,end,prefix,split_point',
+    [
+        ('a/x1', None, 'a/', 'a/y'),
+        ('a/x1', 'a/y', 'a/', 'a/x2'),
+        ('a/x1', 'a/x2', 'a/', None),
+        ('a/x1/q', 'a/x2', 'a/', 'a/x10'),
+        ('a/\ud7ff', None, 'a/', 'a/\ue000'),
+        ('a/\U0010ffffb', None, 'a/', 'a/\U0010ffffc'),
+        ('a/', None, 'a/', None),
+    ],
+)
+def test_get_split_point(start, end, prefix, split_point):
+    assert get_split_point(start, end, prefix) == split_point
+
+
+class FakeListing:
+    def __init__(self, file_names, page_size):
+        self.file_names = sorted(file_names)
+        self.page_size = page_size
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def fetch_page(self, start_file_name, start_file_id):
+        with self.lock:
+            self.calls += 1
+        index = bisect.bisect_left(self.file_names, start_file_name)
+        names = self.file_names[index : index + self.page_size]
+        next_index = index + self.page_size
+        next_file_name = self.file_names[next_index] if next_index < len(self.file_names) else None
+        return [SimpleNamespace(file_name=name) for name in names], next_file_name, None
+
+
+@pytest.mark.parametrize('max_workers', [1, 2, 8])
+def test_parallel_lister_order(max_workers):
+    file_names = [f'{a}/{b}/{c}' for a in 'abcdefgh' for b in range(10) for c in 'xyz']
+    listing = FakeListing(file_names, page_size=7)
+
+    lister = ParallelLister(listing.fetch_page, max_workers=max_workers)
+    assert [file_version.file_name for file_version in lister.list()] == sorted(file_names)
+
+
+def test_parallel_lister_exception():
+    def fetch_page(start_file_name, start_file_id):
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError, match='boom'):
+        list(ParallelLister(fetch_page, max_workers=2).list())
+
+
+def test_parallel_lister_closed_early():
+    listing = FakeListing([str(i) for i in range(1000)], page_size=1)
+    file_versions = ParallelLister(listing.fetch_page, max_workers=4).list()
+
+    assert next(file_versions).file_name == '0'
+    file_versions.close()
+    calls = listing.calls
+    # the threads do not keep listing once the generator is closed
+    assert calls < 50
@@ -29,7 +29,10 @@ from apiver_deps import (
     RawSimulator,
     RetentionMode,
 )
-from apiver_deps_exception import AccessDenied, FileNotPresent
+from apiver_deps_exception import AccessDenied, FileNotPresent, UnexpectedCloudBehaviour
+
+if apiver_deps.V >= 3:
+    from apiver_deps import LazyFileVersion
 
 if apiver_deps.V <= 1:
     from apiver_deps import FileVersionInfo as VFileVersion
@@ -212,3 +215,128 @@ class TestFileVersion:
 
     # FileVersion.download tests are not here, because another test file already has all the facilities for such test
     # prepared
+
+
+FILE_VERSION_DICT = {
+    'accountId': 'account',
+    'action': 'upload',
+    'bucketId': 'bucket',
+    'contentLength': 7,
+    'contentSha1': '0feca720e2c29dafb2c900713ba560e03b758711',
+    'contentType': 'text/plain',
+    'fileId': 'id_0',
+    'fileInfo': {},
+    'fileName': 'file_0',
+    'fileRetention': {'isClientAuthorizedToRead': True, 'value': {'mode': None}},
+    'legalHold': {'isClientAuthorizedToRead': True, 'value': None},
+    'serverSideEncryption': {'algorithm': 'AES256', 'mode': 'SSE-B2'},
+    'uploadTimestamp': 1000,
+}
+
+
+class TestFileVersionFactory:
+    @pytest.fixture
+    def factory(self):
+        return B2Api(InMemoryAccountInfo()).file_version_factory
+
+    def test_from_api_response_list(self, factory):
+        file_version_dicts = [
+            FILE_VERSION_DICT,
+            {**FILE_VERSION_DICT, 'fileId': 'id_1', 'fileName': 'file_1'},
+            {
+                **FILE_VERSION_DICT,
+                'fileId': 'id_2',
+                'fileName': 'file_2',
+                'fileRetention': {
+                    'isClientAuthorizedToRead': True,
+                    'value': {'mode': 'governance', 'retainUntilTimestamp': 2000},
+                },
+                'legalHold': {'isClientAuthorizedToRead': False, 'value': None},
+            },
+            {
+                **FILE_VERSION_DICT,
+                'fileId': 'id_3',
+                'fileName': 'file_3',
+                'fileInfo': {'sse_c_key_id': 'key_3'},
+                'serverSideEncryption': {'algorithm': 'AES256', 'mode': 'SSE-C'},
+            },
+            {
+                **FILE_VERSION_DICT,
+                'fileId': 'id_4',
+                'fileName': 'file_4',
+                'fileInfo': {'sse_c_key_id': 'key_4'},
+                'serverSideEncryption': {'algorithm': 'AES256', 'mode': 'SSE-C'},
+            },
+        ]
+
+        file_versions = list(factory.from_api_response_list(file_version_dicts))
+
+        assert [file_version.as_dict() for file_version in file_versions] == [
+            factory.from_api_response(file_version_dict).as_dict()
+            for file_version_dict in file_version_dicts
+        ]
+        assert file_versions[0].server_side_encryption is file_versions[1].server_side_encryption
+        assert file_versions[2].file_retention == FileRetentionSetting(
+            RetentionMode.GOVERNANCE, 2000
+        )
+        assert file_versions[2].legal_hold == LegalHold.UNKNOWN
+        assert file_versions[3].server_side_encryption.key.key_id == 'key_3'
+        assert file_versions[4].server_side_encryption.key.key_id == 'key_4'
+
+    def test_from_api_response_list_missing_lock_settings(self, factory):
+        hide_marker_dict = {
+            'accountId': 'account',
+            'action': 'hide',
+            'bucketId': 'bucket',
+            'fileId': 'id_1',
+            'fileName': 'file_0',
+            'size': 0,
+            'uploadTimestamp': 2000,
+        }
+        upload_dict = {**hide_marker_dict, 'action': 'upload', 'fileId': 'id_0'}
+
+        file_versions = factory.from_api_response_list([hide_marker_dict, upload_dict])
+
+        assert next(file_versions).legal_hold == LegalHold.UNSET
+        with pytest.raises(UnexpectedCloudBehaviour):
+            next(file_versions)
+
+    @pytest.mark.apiver(from_ver=3)
+    def test_from_api_response_list_lazy(self, factory):
+        file_version_dicts = [
+            FILE_VERSION_DICT,
+            {**FILE_VERSION_DICT, 'fileId': 'id_1', 'fileInfo': {'src_last_modified_millis': '10'}},
+        ]
+
+        file_versions = list(factory.from_api_response_list(file_version_dicts, lazy=True))
+
+        assert all(isinstance(file_version, LazyFileVersion) for file_version in file_versions)
+        assert file_versions == [
+            factory.from_api_response(file_version_dict) for file_version_dict in file_version_dicts
+        ]
+        assert file_versions[1].mod_time_millis == 10
+        assert file_versions[0].as_dict() == factory.from_api_response(FILE_VERSION_DICT).as_dict()
+        clone = file_versions[0]._clone(legal_hold=LegalHold.ON)
+        assert type(clone) is VFileVersion
+        assert clone.legal_hold == LegalHold.ON
+
+    @pytest.mark.apiver(from_ver=3)
+    def test_lazy_file_version_decoded_on_access(self, factory):
+        file_version_dict = {**FILE_VERSION_DICT}
+        del file_version_dict['fileRetention']
+
+        file_version = next(factory.from_api_response_list([file_version_dict], lazy=True))
+
+        assert (file_version.id_, file_version.file_name, file_version.size) == (
+            'id_0',
+            'file_0',
+            7,
+        )
+        assert file_version.legal_hold == LegalHold.UNSET
+        with pytest.raises(UnexpectedCloudBehaviour):
+            file_version.file_retention
+
+    @pytest.mark.apiver(to_ver=2)
+    def test_from_api_response_list_lazy_ignored(self, factory):
+        file_version = next(factory.from_api_response_list([FILE_VERSION_DICT], lazy=True))
+        assert type(file_version) is VFileVersion
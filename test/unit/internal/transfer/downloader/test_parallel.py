@@ -8,6 +8,8 @@
 #
 ######################################################################
 import hashlib
+import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from unittest.mock import Mock
@@ -15,6 +17,20 @@ from unittest.mock import Mock
 import pytest
 from requests import RequestException
 
+from b2sdk._internal.progress import AbstractProgressListener
+from b2sdk._internal.stream.progress import WritingStreamWithProgress
+from b2sdk._internal.transfer.inbound.download_journal import DownloadJournal
+from b2sdk._internal.transfer.inbound.downloader.parallel import (
+    OrderedHasher,
+    OrderedWriter,
+    PartScheduler,
+    PositionalWriter,
+    WriterThread,
+    gen_parts,
+)
+from b2sdk._internal.utils.range_ import Range
+from test.helpers import NonSeekableIO
+
 
 def mock_download_response_factory(apiver_module, bucket, file_size: int = 0):
     hasher = hashlib.sha1()
@@ -169,3 +185,391 @@ def test_download_file__data_stream_error__multiple_errors_recovery(
 
     assert bytes_written == file_size
     assert output_file.getvalue() == b'dUMMY' + b'DUMMY' * 19
+
+
+def test_download_file__stalled_stream_is_taken_over(
+    apiver_module, b2api, bucket, thread_pool, output_file
+):
+    """
+    Test that the end of the part of a stalled stream is downloaded by another stream.
+    """
+    downloader = apiver_module.ParallelDownloader(
+        min_part_size=2,
+        max_streams=2,
+        force_chunk_size=5,
+        thread_pool=thread_pool,
+    )
+    file_size = 100
+    mock_response, download_version = mock_download_response_factory(
+        apiver_module, bucket, file_size=file_size
+    )
+    original_iter_content = mock_response.iter_content
+    taken_over = threading.Event()
+
+    def iter_content(chunk_size=1, decode_unicode=False):
+        iterator = original_iter_content(chunk_size=chunk_size)
+        yield next(iterator)
+        # the first part ends at byte 11 and the other stream has to take over its end
+        assert taken_over.wait(timeout=10)
+        yield from iterator
+
+    mock_response.iter_content = iter_content
+
+    download_func = bucket.api.services.session.download_file_from_url
+    requested_ranges = []
+
+    def download_func_mock(url, range_=None, *args, **kwargs):
+        requested_ranges.append(range_)
+        if range_[0] < 12:
+            taken_over.set()
+        return download_func(url, range_, *args, **kwargs)
+
+    bucket.api.services.session.download_file_from_url = download_func_mock
+
+    bytes_written, hash_hex = downloader.download(
+        output_file, mock_response, download_version, b2api.session
+    )
+
+    assert bytes_written == file_size
+    assert hash_hex == '7804df8c623573ccfc1993e04981006e5bc30383'
+    assert output_file.getvalue() == b'dummy' * 20
+    assert (8, 11) in requested_ranges
+
+
+@pytest.mark.parametrize('hashing_buffer_size', [0, 1024])
+def test_download_file__hashed_while_written(
+    apiver_module, b2api, bucket, downloader, output_file, hashing_buffer_size
+):
+    downloader.HASHING_BUFFER_SIZE = hashing_buffer_size
+    file_size = 100
+    mock_response, download_version = mock_download_response_factory(
+        apiver_module, bucket, file_size=file_size
+    )
+    output_file.read = Mock(side_effect=output_file.read)
+
+    bytes_written, hash_hex = downloader.download(
+        output_file, mock_response, download_version, b2api.session
+    )
+
+    assert bytes_written == file_size
+    assert hash_hex == '7804df8c623573ccfc1993e04981006e5bc30383'
+    # chunks are only read back if they do not fit in the buffer
+    assert output_file.read.called == (hashing_buffer_size == 0)
+
+
+@pytest.mark.skipif(not hasattr(os, 'pwrite'), reason='positional writes are not supported')
+@pytest.mark.parametrize('preallocate', [False, True])
+@pytest.mark.parametrize('hashing_buffer_size', [0, 1024])
+def test_download_file__positional_writes(
+    apiver_module, b2api, bucket, thread_pool, tmp_path, preallocate, hashing_buffer_size
+):
+    downloader = apiver_module.ParallelDownloader(
+        min_part_size=10,
+        force_chunk_size=5,
+        thread_pool=thread_pool,
+        preallocate=preallocate,
+    )
+    downloader.HASHING_BUFFER_SIZE = hashing_buffer_size
+    file_size = 100
+    mock_response, download_version = mock_download_response_factory(
+        apiver_module, bucket, file_size=file_size
+    )
+    progress_listener = Mock(spec=AbstractProgressListener)
+
+    with open(tmp_path / 'file', 'wb+') as file:
+        file.write(b'header')
+        output_file = WritingStreamWithProgress(file, progress_listener)
+        bytes_written, hash_hex = downloader.download(
+            output_file, mock_response, download_version, b2api.session
+        )
+
+    assert bytes_written == file_size
+    assert hash_hex == '7804df8c623573ccfc1993e04981006e5bc30383'
+    assert (tmp_path / 'file').read_bytes() == b'header' + b'dummy' * 20
+    assert progress_listener.bytes_completed.call_args_list[-1].args == (file_size,)
+
+
+@pytest.mark.parametrize('check_hash', [False, True])
+@pytest.mark.parametrize('positional_writes', [False, True])
+def test_download_file__position_after_data(
+    apiver_module, b2api, bucket, thread_pool, tmp_path, positional_writes, check_hash
+):
+    downloader = apiver_module.ParallelDownloader(
+        min_part_size=10,
+        force_chunk_size=5,
+        thread_pool=thread_pool,
+        positional_writes=positional_writes,
+        check_hash=check_hash,
+    )
+    file_size = 100
+    mock_response, download_version = mock_download_response_factory(
+        apiver_module, bucket, file_size=file_size
+    )
+
+    with open(tmp_path / 'file', 'wb+') as file:
+        file.write(b'header')
+        downloader.download(file, mock_response, download_version, b2api.session)
+        assert file.tell() == 6 + file_size
+        file.write(b'trailer')
+
+    assert (tmp_path / 'file').read_bytes() == b'header' + b'dummy' * 20 + b'trailer'
+
+
+@pytest.mark.parametrize('positional_writes', [False, True])
+def test_download_file__resumed(
+    apiver_module, b2api, bucket, thread_pool, tmp_path, positional_writes
+):
+    downloader = apiver_module.ParallelDownloader(
+        min_part_size=10,
+        force_chunk_size=5,
+        thread_pool=thread_pool,
+        positional_writes=positional_writes,
+    )
+    file_size = 100
+    mock_response, download_version = mock_download_response_factory(
+        apiver_module, bucket, file_size=file_size
+    )
+    mock_response.close = Mock(side_effect=mock_response.close)
+    journal = DownloadJournal(tmp_path / 'file.b2journal', download_version)
+    journal.add(0, 30)
+    journal.add(60, 20)
+    journal.sync = None
+
+    download_func = bucket.api.services.session.download_file_from_url
+    requested_ranges = []
+
+    def download_func_mock(url, range_=None, *args, **kwargs):
+        requested_ranges.append(range_)
+        return download_func(url, range_, *args, **kwargs)
+
+    bucket.api.services.session.download_file_from_url = download_func_mock
+
+    with open(tmp_path / 'file', 'wb+') as file:
+        # the ranges which are not in the journal are overwritten
+        file.write(b'dummy' * 6 + b'x' * 30 + b'dummy' * 4)
+        file.seek(0)
+        bytes_written, hash_hex = downloader.download(
+            file, mock_response, download_version, b2api.session, journal=journal
+        )
+
+    assert bytes_written == file_size
+    assert hash_hex == '7804df8c623573ccfc1993e04981006e5bc30383'
+    assert (tmp_path / 'file').read_bytes() == b'dummy' * 20
+    mock_response.close.assert_called_once()
+    assert sorted(requested_ranges) == [(30, 39), (40, 49), (50, 59), (80, 89), (90, 99)]
+    assert journal.written_ranges == [Range(0, 99)]
+    assert DownloadJournal(journal.path, download_version).load()
+
+
+@pytest.mark.skipif(not hasattr(os, 'pwrite'), reason='positional writes are not supported')
+@pytest.mark.parametrize(
+    'mode,positional_writes,writer_class',
+    [
+        ('wb+', True, PositionalWriter),
+        ('wb+', False, WriterThread),
+        ('ab+', True, WriterThread),
+    ],
+)
+def test_get_writer(downloader, tmp_path, mode, positional_writes, writer_class):
+    downloader.positional_writes = positional_writes
+    with open(tmp_path / 'file', mode) as file:
+        assert isinstance(downloader._get_writer(file, Range(0, 9), 2), writer_class)
+    assert isinstance(downloader._get_writer(BytesIO(), Range(0, 9), 2), WriterThread)
+
+
+def make_scheduler(size, part_count, min_part_size=1):
+    return PartScheduler(
+        gen_parts(Range(0, size - 1), Range(0, size - 1), part_count),
+        min_part_size=min_part_size,
+    )
+
+
+class TestPartScheduler:
+    def test_get_part(self):
+        scheduler = make_scheduler(100, 4, min_part_size=10)
+
+        parts = [scheduler.get_part() for _ in range(4)]
+
+        assert [part.cloud_range for part in parts] == [
+            Range(0, 24),
+            Range(25, 49),
+            Range(50, 74),
+            Range(75, 99),
+        ]
+        assert scheduler.claim(parts[0], 5) == 5
+        for part in parts[1:]:
+            assert scheduler.claim(part, 20) == 20
+            scheduler.finish(part)
+        split_part = scheduler.get_part()
+        assert split_part.cloud_range == Range(15, 24)
+        assert split_part.local_range == Range(15, 24)
+        assert parts[0].cloud_range == Range(0, 14)
+        assert parts[0].local_range == Range(0, 14)
+        assert scheduler.get_part() is None
+
+    def test_get_part__splits_stalled_part_first(self):
+        scheduler = make_scheduler(100, 2)
+        first_part, second_part = scheduler.get_part(), scheduler.get_part()
+        scheduler.claim(second_part, 10)
+
+        split_part = scheduler.get_part()
+
+        assert split_part.cloud_range == Range(25, 49)
+        assert first_part.cloud_range == Range(0, 24)
+        assert second_part.cloud_range == Range(50, 99)
+
+    def test_get_part__aborted(self):
+        scheduler = make_scheduler(100, 4)
+        scheduler.get_part()
+
+        scheduler.abort()
+
+        assert scheduler.get_part() is None
+
+    def test_claim__after_split(self):
+        scheduler = make_scheduler(100, 1, min_part_size=10)
+        part = scheduler.get_part()
+        assert scheduler.claim(part, 30) == 30
+        assert scheduler.get_part().cloud_range == Range(65, 99)
+
+        assert scheduler.claim(part, 30) == 30
+        assert scheduler.claim(part, 30) == 5
+        assert scheduler.claim(part, 30) == 0
+
+    def test_claim__extend(self):
+        scheduler = make_scheduler(100, 4)
+        first_part = scheduler.get_part()
+        assert scheduler.claim(first_part, 20) == 20
+
+        assert scheduler.claim(first_part, 20, extend=True) == 20
+        assert first_part.cloud_range == Range(0, 49)
+        third_part = scheduler.get_part()
+        assert third_part.cloud_range == Range(50, 74)
+        assert scheduler.claim(first_part, 20, extend=True) == 10
+        assert first_part.cloud_range == Range(0, 49)
+
+
+class TestOrderedHasher:
+    DATA = bytes(range(100))
+
+    @pytest.fixture
+    def read(self):
+        return Mock(side_effect=lambda offset, size: self.DATA[offset - 10 : offset - 10 + size])
+
+    def make_hasher(self, read, max_buffer_size):
+        return OrderedHasher(hashlib.sha1(), Range(10, 109), read, max_buffer_size=max_buffer_size)
+
+    def write(self, ordered_hasher, *offsets):
+        for offset in offsets:
+            ordered_hasher.update(offset + 10, self.DATA[offset : offset + 10])
+
+    def test_update(self, read):
+        ordered_hasher = self.make_hasher(read, max_buffer_size=100)
+
+        self.write(ordered_hasher, 0, 10, 40, 30, 20)
+        assert ordered_hasher.bytes_hashed == 50
+        self.write(ordered_hasher, 60, 70, 80, 90, 50)
+
+        assert ordered_hasher.bytes_hashed == 100
+        assert ordered_hasher.hasher.hexdigest() == hashlib.sha1(self.DATA).hexdigest()
+        read.assert_not_called()
+
+    def test_update__buffer_exceeded(self, read):
+        ordered_hasher = self.make_hasher(read, max_buffer_size=20)
+
+        self.write(ordered_hasher, 10, 20, 30, 40, 0)
+        assert ordered_hasher.bytes_hashed == 50
+        self.write(ordered_hasher, 90, 80, 70, 60, 50)
+
+        assert ordered_hasher.bytes_hashed == 100
+        assert ordered_hasher.hasher.hexdigest() == hashlib.sha1(self.DATA).hexdigest()
+        assert [call.args for call in read.call_args_list] == [
+            (40, 10),
+            (50, 10),
+            (70, 10),
+            (80, 10),
+        ]
+        assert ordered_hasher.bytes_read_back == 40
+
+    def test_add_written(self, read):
+        ordered_hasher = self.make_hasher(read, max_buffer_size=100)
+        ordered_hasher.add_written(10, 30)
+        ordered_hasher.add_written(80, 30)
+        ordered_hasher.READ_BACK_SIZE = 20
+        ordered_hasher.finish()
+        assert ordered_hasher.bytes_hashed == 30
+
+        self.write(ordered_hasher, 60, 30, 40, 50)
+        ordered_hasher.finish()
+
+        assert ordered_hasher.bytes_hashed == 100
+        assert ordered_hasher.hasher.hexdigest() == hashlib.sha1(self.DATA).hexdigest()
+        assert [call.args for call in read.call_args_list] == [
+            (10, 20),
+            (30, 10),
+            (80, 20),
+            (100, 10),
+        ]
+
+
+class TestOrderedWriter:
+    def test_queue_write(self):
+        output_file = NonSeekableIO()
+        with OrderedWriter(output_file, start_offset=10, max_buffer_size=4) as writer:
+            writer.queue_write(14, b'ef')
+            writer.queue_write(12, b'cd')
+            assert output_file.getvalue() == b''
+            writer.queue_write(10, b'ab')
+
+        assert output_file.getvalue() == b'abcdef'
+        assert writer.total == 6
+
+    def test_queue_write__waits_for_room_in_buffer(self):
+        output_file = NonSeekableIO()
+        writer = OrderedWriter(output_file, start_offset=0, max_buffer_size=2)
+        writer.queue_write(2, b'cd')
+        thread = threading.Thread(target=writer.queue_write, args=(4, b'ef'))
+        thread.start()
+        thread.join(timeout=0.1)
+        assert thread.is_alive()
+
+        writer.queue_write(0, b'ab')
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert output_file.getvalue() == b'abcdef'
+
+    def test_abort(self):
+        output_file = NonSeekableIO()
+        writer = OrderedWriter(output_file, start_offset=0, max_buffer_size=0)
+        thread = threading.Thread(target=writer.queue_write, args=(2, b'cd'))
+        thread.start()
+
+        writer.abort()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert output_file.getvalue() == b''
+
+
+def test_streaming_download_file(apiver_module, b2api, bucket, thread_pool):
+    downloader = apiver_module.StreamingParallelDownloader(
+        min_part_size=10,
+        max_buffer_size=20,
+        force_chunk_size=5,
+        thread_pool=thread_pool,
+    )
+    file_size = 100
+    mock_response, download_version = mock_download_response_factory(
+        apiver_module, bucket, file_size=file_size
+    )
+    output_file = NonSeekableIO()
+
+    assert downloader.is_suitable(download_version, allow_seeking=False)
+    bytes_written, hash_hex = downloader.download(
+        output_file, mock_response, download_version, b2api.session
+    )
+
+    assert bytes_written == file_size
+    assert hash_hex == '7804df8c623573ccfc1993e04981006e5bc30383'
+    assert output_file.getvalue() == b'dummy' * 20
@@ -0,0 +1,89 @@
+######################################################################
+#
+# File: test/unit/internal/transfer/test_download_journal.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from b2sdk._internal.transfer.inbound.download_journal import DownloadJournal
+from b2sdk._internal.utils.range_ import Range
+
+
+@pytest.fixture
+def download_version(bucket):
+    file_version = bucket.upload_bytes(b'hello world', 'file')
+    return bucket.download_file_by_id(file_version.id_).download_version
+
+
+@pytest.fixture
+def journal(tmp_path, download_version):
+    return DownloadJournal(DownloadJournal.get_path(tmp_path / 'file'), download_version)
+
+
+def test_get_path(tmp_path):
+    assert DownloadJournal.get_path(tmp_path / 'file') == tmp_path / 'file.b2journal'
+
+
+def test_add(journal):
+    for offset, size in [(20, 10), (0, 5), (40, 5), (5, 5), (30, 5), (12, 0), (50, 1)]:
+        journal.add(offset, size)
+
+    assert journal.written_ranges == [Range(0, 9), Range(20, 34), Range(40, 44), Range(50, 50)]
+
+    journal.add(10, 10)
+    journal.add(35, 5)
+
+    assert journal.written_ranges == [Range(0, 44), Range(50, 50)]
+
+
+def test_add__saves_periodically(journal):
+    journal.sync = mock.Mock()
+    journal.add(0, 5)
+    assert not journal.path.exists()
+
+    with mock.patch('time.monotonic', return_value=journal._saved_at + journal.SAVE_INTERVAL):
+        journal.add(5, 5)
+
+    journal.sync.assert_called_once_with()
+    assert json.loads(journal.path.read_text())['ranges'] == [[0, 9]]
+
+
+def test_load(tmp_path, bucket, download_version, journal):
+    journal.add(0, 5)
+    journal.add(8, 2)
+    journal.save()
+
+    loaded_journal = DownloadJournal(journal.path, download_version)
+    assert loaded_journal.load()
+    assert loaded_journal.written_ranges == [Range(0, 4), Range(8, 9)]
+
+    journal.remove()
+    assert not loaded_journal.load()
+
+
+def test_load__different_download(tmp_path, bucket, download_version, journal):
+    journal.add(0, 5)
+    journal.save()
+
+    # the file was overwritten with a new version since
+    file_version = bucket.upload_bytes(b'hello world', 'file')
+    new_download_version = bucket.download_file_by_id(file_version.id_).download_version
+    assert not DownloadJournal(journal.path, new_download_version).load()
+    # a different range of the same version
+    assert not DownloadJournal(journal.path, download_version, range_=(0, 5)).load()
+
+
+def test_load__corrupted(journal, download_version):
+    journal.path.write_text('{"header"')
+
+    assert not journal.load()
+    assert journal.written_ranges == []
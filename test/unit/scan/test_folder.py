@@ -13,6 +13,7 @@ import platform
 from pathlib import Path
 
 import pytest
+from apiver_deps import B2Folder, B2Path
 
 from b2sdk._internal.scan.exception import UnsupportedFilename
 from b2sdk._internal.scan.folder import LocalFolder
@@ -44,3 +45,49 @@ class TestFolder:
 
         with pytest.raises(UnsupportedFilename):
             folder.make_full_path(str(file_path))
+
+
+class TestB2Folder:
+    @pytest.fixture(autouse=True)
+    def setup(self, b2api, bucket):
+        for file_name in ['folder/a', 'folder/a', 'folder/a', 'folder/b', 'folder/c', 'folder/c']:
+            bucket.upload_bytes(b'hello', file_name)
+        bucket.hide_file('folder/b')
+        self.b2api = b2api
+        self.bucket = bucket
+
+    def test_stream_versions(self):
+        expected = [
+            (path.relative_path, path.selected_version, list(path.all_versions))
+            for path in B2Folder(self.bucket.name, 'folder', self.b2api).all_files(None)
+        ]
+        assert [len(versions) for _, _, versions in expected] == [3, 2, 2]
+
+        folder = B2Folder(self.bucket.name, 'folder', self.b2api, stream_versions=True)
+        actual = []
+        for path in folder.all_files(None):
+            assert repr(path).endswith(', ...])')
+            actual.append((path.relative_path, path.selected_version, list(path.all_versions)))
+            with pytest.raises(RuntimeError):
+                list(path.all_versions)
+        assert actual == expected
+
+    def test_stream_versions_not_iterated(self):
+        folder = B2Folder(self.bucket.name, 'folder', self.b2api, stream_versions=True)
+        paths = folder.all_files(None)
+        next(paths)
+        path = next(paths)
+        assert path.relative_path == 'b'
+        assert [version.action for version in path.all_versions] == ['hide', 'upload']
+        assert [path.relative_path for path in paths] == ['c']
+
+    def test_stream_versions_compared(self):
+        paths = list(B2Folder(self.bucket.name, 'folder', self.b2api).all_files(None))
+        folder = B2Folder(self.bucket.name, 'folder', self.b2api, stream_versions=True)
+
+        for path, streamed_path in zip(paths, folder.all_files(None)):
+            assert streamed_path == path
+            assert path == streamed_path
+            assert streamed_path != B2Path('other', path.selected_version, path.all_versions)
+            # the versions are not consumed by comparing the paths
+            assert list(streamed_path.all_versions) == path.all_versions
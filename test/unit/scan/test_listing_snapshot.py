@@ -0,0 +1,183 @@
+######################################################################
+#
+# File: test/unit/scan/test_listing_snapshot.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+import pytest
+from apiver_deps import B2Folder, LocalFolder, Synchronizer
+
+from b2sdk._internal.scan.listing_snapshot import ListingSnapshot
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return ListingSnapshot(str(tmp_path / 'snapshot.sqlite'))
+
+
+@pytest.fixture
+def list_file_versions(b2api_simulator):
+    with mock.patch.object(
+        b2api_simulator, 'list_file_versions', wraps=b2api_simulator.list_file_versions
+    ) as list_file_versions:
+        yield list_file_versions
+
+
+def listed(file_versions):
+    return [(file_version.file_name, file_version.id_) for file_version in file_versions]
+
+
+class TestListingSnapshot:
+    @pytest.fixture(autouse=True)
+    def setup(self, b2api, bucket):
+        for file_name in ['a/1', 'a/2', 'a/2', 'a/3/x', 'b']:
+            bucket.upload_bytes(b'hello', file_name)
+        bucket.hide_file('a/1')
+        self.bucket = bucket
+        self.folder = B2Folder(bucket.name, 'a', b2api)
+
+    def test_list_file_versions(self, snapshot, list_file_versions):
+        expected = listed(self.folder.get_file_versions())
+        list_file_versions.reset_mock()
+
+        assert listed(snapshot.list_file_versions(self.bucket, 'a/')) == expected
+        assert list_file_versions.call_count == 1
+        assert listed(snapshot.list_file_versions(self.bucket, 'a/')) == expected
+        assert list_file_versions.call_count == 1
+
+    def test_invalidate(self, snapshot, list_file_versions):
+        list(snapshot.list_file_versions(self.bucket, 'a/'))
+        file_version = self.bucket.upload_bytes(b'hello', 'a/2')
+        snapshot.invalidate(self.bucket.id_, 'a/2')
+        snapshot.invalidate(self.bucket.id_, 'b')
+        list_file_versions.reset_mock()
+
+        file_versions = listed(snapshot.list_file_versions(self.bucket, 'a/'))
+
+        assert [call.kwargs['prefix'] for call in list_file_versions.call_args_list] == ['a/2']
+        assert ('a/2', file_version.id_) in file_versions
+        assert file_versions == listed(self.folder.get_file_versions())
+
+    def test_expired(self, snapshot, list_file_versions):
+        list(snapshot.list_file_versions(self.bucket, 'a/'))
+        self.bucket.upload_bytes(b'hello', 'a/4')
+        list_file_versions.reset_mock()
+
+        with mock.patch('time.time', return_value=time.time() + snapshot.max_age + 1):
+            file_versions = listed(snapshot.list_file_versions(self.bucket, 'a/'))
+
+        assert [call.kwargs['prefix'] for call in list_file_versions.call_args_list] == ['a/']
+        assert file_versions[-1][0] == 'a/4'
+
+    def test_expired__listed_page_by_page(self, snapshot, list_file_versions):
+        list(snapshot.list_file_versions(self.bucket, 'a/'))
+        self.bucket.upload_bytes(b'hello', 'a/2')
+        expected = listed(self.folder.get_file_versions())
+
+        # with single file pages, the versions of a/2 are split between pages
+        with mock.patch('b2sdk._internal.scan.listing_snapshot.LIST_FILE_NAMES_MAX_LIMIT', 1):
+            with mock.patch('time.time', return_value=time.time() + snapshot.max_age + 1):
+                file_versions = listed(snapshot.list_file_versions(self.bucket, 'a/'))
+
+        assert file_versions == expected
+
+    def test_listed_outside_of_transaction(self, snapshot, list_file_versions):
+        other_snapshot = ListingSnapshot(snapshot.filename)
+
+        def list_and_invalidate(*args, **kwargs):
+            # another process can write while the listing goes on
+            other_snapshot.invalidate(self.bucket.id_, 'a/3')
+            return mock.DEFAULT
+
+        list_file_versions.side_effect = list_and_invalidate
+        # fail right away if the database is locked
+        other_snapshot._get_connection().execute('PRAGMA busy_timeout = 0;')
+        list(snapshot.list_file_versions(self.bucket, 'a/'))
+        list_file_versions.side_effect = None
+        list_file_versions.reset_mock()
+
+        list(snapshot.list_file_versions(self.bucket, 'a/'))
+
+        assert [call.kwargs['prefix'] for call in list_file_versions.call_args_list] == ['a/3']
+
+    def test_failed_listing_is_listed_again(self, snapshot, list_file_versions):
+        list(snapshot.list_file_versions(self.bucket, 'a/'))
+        snapshot.invalidate(self.bucket.id_, 'a/2')
+        list_file_versions.side_effect = RuntimeError('connection lost')
+        with pytest.raises(RuntimeError):
+            list(snapshot.list_file_versions(self.bucket, 'a/'))
+        list_file_versions.side_effect = None
+        list_file_versions.reset_mock()
+
+        file_versions = listed(snapshot.list_file_versions(self.bucket, 'a/'))
+
+        assert [call.kwargs['prefix'] for call in list_file_versions.call_args_list] == ['a/2']
+        assert file_versions == listed(self.folder.get_file_versions())
+
+
+def test_sync_invalidates_changed_files(tmp_path, b2api, bucket, snapshot, list_file_versions):
+    local_path = tmp_path / 'local'
+    local_path.mkdir()
+    (local_path / 'a.txt').write_bytes(b'hello')
+    synchronizer = Synchronizer(1)
+
+    def sync():
+        synchronizer.sync_folders(
+            source_folder=LocalFolder(str(local_path)),
+            dest_folder=B2Folder(bucket.name, 'folder', b2api, listing_snapshot=snapshot),
+            now_millis=int(time.time() * 1000),
+            reporter=mock.MagicMock(),
+        )
+
+    sync()
+    sync()
+
+    assert [call.kwargs['prefix'] for call in list_file_versions.call_args_list] == [
+        'folder/',
+        'folder/a.txt',
+    ]
+    assert [
+        file_version.file_name for file_version in bucket.list_file_versions('folder/a.txt')
+    ] == ['folder/a.txt']
+
+
+class FolderWithoutSnapshot(B2Folder):
+    """
+    Like the b2 folders of other classes, which do not know about listing snapshots.
+    """
+
+    def __getattribute__(self, name):
+        if name == 'listing_snapshot':
+            raise AttributeError(name)
+        return super().__getattribute__(name)
+
+    def get_file_versions(self):
+        for file_version, _ in self.bucket.ls(self.folder_name, latest_only=False, recursive=True):
+            yield file_version
+
+
+@pytest.mark.apiver(from_ver=2)
+def test_sync_to_folder_without_snapshot(tmp_path, b2api, bucket):
+    local_path = tmp_path / 'local'
+    local_path.mkdir()
+    (local_path / 'a.txt').write_bytes(b'hello')
+    dest_folder = FolderWithoutSnapshot(bucket.name, 'folder', b2api)
+
+    Synchronizer(1).sync_folders(
+        source_folder=LocalFolder(str(local_path)),
+        dest_folder=dest_folder,
+        now_millis=int(time.time() * 1000),
+        reporter=mock.MagicMock(),
+    )
+
+    assert [
+        file_version.file_name for file_version in bucket.list_file_versions('folder/a.txt')
+    ] == ['folder/a.txt']
@@ -12,7 +12,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import pytest
-from apiver_deps import AuthInfoCache, DummyCache, InMemoryAccountInfo, InMemoryCache
+from apiver_deps import (
+    AuthInfoCache,
+    DummyCache,
+    InMemoryAccountInfo,
+    InMemoryCache,
+    TtlBucketCache,
+)
 from pytest_lazy_fixtures import lf
 
 
@@ -31,7 +37,15 @@ def auth_info_cache():
     return AuthInfoCache(InMemoryAccountInfo())
 
 
-@pytest.fixture(scope='function', params=[lf('in_memory_cache'), lf('auth_info_cache')])
+@pytest.fixture
+def ttl_bucket_cache():
+    return TtlBucketCache()
+
+
+@pytest.fixture(
+    scope='function',
+    params=[lf('in_memory_cache'), lf('auth_info_cache'), lf('ttl_bucket_cache')],
+)
 def cache(request):
     return request.param
 
@@ -40,6 +54,7 @@ def cache(request):
 class DummyBucket:
     name: str
     id_: str
+    bucket_dict: dict | None = None
 
 
 @pytest.fixture
@@ -83,3 +98,52 @@ class TestCache:
 
         assert cache.get_bucket_id_or_none_from_bucket_name('bucket1') == 'ID-1'
         assert cache.get_bucket_id_or_none_from_bucket_name('bucket2') is None
+
+
+class TestTtlBucketCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
+        self.monotonic = mocker.patch('time.monotonic', return_value=1000)
+        self.cache = TtlBucketCache(ttl=100, negative_ttl=10, max_buckets=2)
+
+    def test_bucket_dict(self):
+        bucket_dict = {'bucketName': 'bucket0', 'bucketId': 'ID-0', 'bucketType': 'allPrivate'}
+        self.cache.save_bucket(DummyBucket('bucket0', 'ID-0', bucket_dict))
+        assert self.cache.get_bucket_dict_or_none_from_bucket_name('bucket0') == bucket_dict
+        assert self.cache.get_bucket_dict_or_none_from_bucket_id('ID-0') == bucket_dict
+
+        # saving just the name and id keeps the details
+        self.cache.save_bucket(DummyBucket('bucket0', 'ID-0'))
+        assert self.cache.get_bucket_dict_or_none_from_bucket_id('ID-0') == bucket_dict
+
+        self.cache.remove_bucket(DummyBucket('bucket0', 'ID-0'))
+        assert self.cache.get_bucket_dict_or_none_from_bucket_id('ID-0') is None
+        assert self.cache.get_bucket_id_or_none_from_bucket_name('bucket0') is None
+
+    def test_expiration(self):
+        self.cache.save_bucket(DummyBucket('bucket0', 'ID-0'))
+        self.monotonic.return_value = 1099
+        assert self.cache.get_bucket_id_or_none_from_bucket_name('bucket0') == 'ID-0'
+        self.monotonic.return_value = 1100
+        assert self.cache.get_bucket_id_or_none_from_bucket_name('bucket0') is None
+        assert self.cache.get_bucket_name_or_none_from_bucket_id('ID-0') is None
+        assert self.cache.list_bucket_names_ids() == []
+
+    def test_least_recently_used_evicted(self):
+        self.cache.save_bucket(DummyBucket('bucket0', 'ID-0'))
+        self.cache.save_bucket(DummyBucket('bucket1', 'ID-1'))
+        self.cache.get_bucket_id_or_none_from_bucket_name('bucket0')
+        self.cache.save_bucket(DummyBucket('bucket2', 'ID-2'))
+        assert self.cache.list_bucket_names_ids() == [('bucket0', 'ID-0'), ('bucket2', 'ID-2')]
+        assert self.cache.get_bucket_name_or_none_from_bucket_id('ID-1') is None
+
+    def test_missing_bucket_name(self):
+        assert not self.cache.is_bucket_name_missing('bucket0')
+        self.cache.save_missing_bucket_name('bucket0')
+        assert self.cache.is_bucket_name_missing('bucket0')
+        self.monotonic.return_value = 1010
+        assert not self.cache.is_bucket_name_missing('bucket0')
+
+        self.cache.save_missing_bucket_name('bucket0')
+        self.cache.save_bucket(DummyBucket('bucket0', 'ID-0'))
+        assert not self.cache.is_bucket_name_missing('bucket0')
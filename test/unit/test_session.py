@@ -9,11 +9,14 @@
 ######################################################################
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
-from apiver_deps import AuthInfoCache, B2Session, DummyCache, InMemoryAccountInfo
-from apiver_deps_exception import Unauthorized
+from apiver_deps import AuthInfoCache, B2HttpApiConfig, B2Session, DummyCache, InMemoryAccountInfo
+from apiver_deps_exception import BadUploadUrl, InvalidAuthToken, Unauthorized
 
 from .account_info.fixtures import *  # noqa
 from .fixtures import *  # noqa
@@ -134,3 +137,226 @@ def test_session__with_in_memory_account_info(apiver_int):
     else:
         assert isinstance(b2_session.cache, AuthInfoCache)
         assert b2_session.cache.info is memory_info
+
+
+def test_session__coalesce_requests(fake_account_info, fake_cache, fake_b2_raw_api):
+    b2_session = B2Session(
+        account_info=fake_account_info,
+        cache=fake_cache,
+        api_config=B2HttpApiConfig(coalesce_requests=True),
+    )
+    b2_session.raw_api = fake_b2_raw_api
+    release = threading.Event()
+
+    def list_buckets(*args, **kwargs):
+        release.wait(5)
+        return {'buckets': []}
+
+    fake_b2_raw_api.list_buckets.side_effect = list_buckets
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [
+            executor.submit(b2_session.list_buckets, 'account_id', bucket_name='bucket')
+            for _ in range(3)
+        ]
+        while b2_session.single_flight.calls_coalesced < 2:
+            time.sleep(0.001)
+        release.set()
+
+    assert [future.result() for future in futures] == [{'buckets': []}] * 3
+    assert fake_b2_raw_api.list_buckets.call_count == 1
+
+
+def test_session__coalesce_requests_disabled(b2_session):
+    assert b2_session.single_flight is None
+
+
+class TestAuthTokenRefresh:
+    @pytest.fixture
+    def b2_session(self, fake_account_info, fake_cache, fake_b2_raw_api):
+        b2_session = B2Session(
+            account_info=fake_account_info,
+            cache=fake_cache,
+            api_config=B2HttpApiConfig(auth_token_refresh_interval=100),
+        )
+        b2_session.raw_api = fake_b2_raw_api
+        return b2_session
+
+    def test_old_token_refreshed_in_background(self, b2_session):
+        b2_session.authorize_account('dev', '123', '456')
+        b2_session.get_file_info_by_id('file_id')
+        assert b2_session._auth_refresh_thread is None
+
+        b2_session._auth_time -= 101
+        b2_session.get_file_info_by_id('file_id')
+        refresh_thread = b2_session._auth_refresh_thread
+        if refresh_thread is not None:
+            refresh_thread.join()
+
+        assert b2_session.raw_api.authorize_account.call_count == 2
+        assert b2_session.raw_api.get_file_info_by_id.call_count == 2
+        assert b2_session.proactive_auth_refreshes == 1
+        assert b2_session.reactive_auth_refreshes == 0
+
+    def test_token_of_unknown_age_not_refreshed(self, b2_session):
+        b2_session.get_file_info_by_id('file_id')
+
+        assert b2_session._auth_refresh_thread is None
+        b2_session.raw_api.authorize_account.assert_not_called()
+
+    def test_expired_token(self, b2_session):
+        b2_session.raw_api.get_file_info_by_id.side_effect = [InvalidAuthToken('expired', ''), {}]
+
+        assert b2_session.get_file_info_by_id('file_id') == {}
+        assert b2_session.raw_api.authorize_account.call_count == 1
+        assert b2_session.reactive_auth_refreshes == 1
+
+    def test_expired_token__reauthorization_shared(self, b2_session):
+        release = threading.Event()
+
+        def authorize_account(*args):
+            release.wait(5)
+            return mock.DEFAULT
+
+        b2_session.raw_api.authorize_account.side_effect = authorize_account
+        b2_session.raw_api.get_file_info_by_id.side_effect = [
+            InvalidAuthToken('expired', ''),
+            InvalidAuthToken('expired', ''),
+            {},
+            {},
+        ]
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(b2_session.get_file_info_by_id, 'file_id') for _ in range(2)]
+            while b2_session._reauthorization.calls_coalesced < 1:
+                time.sleep(0.001)
+            release.set()
+
+        assert [future.result() for future in futures] == [{}, {}]
+        assert b2_session.raw_api.authorize_account.call_count == 1
+        assert b2_session.reactive_auth_refreshes == 1
+
+    def test_refresh_keeps_cached_data(self, account_info, fake_cache, fake_b2_raw_api):
+        b2_session = B2Session(account_info=account_info, cache=fake_cache)
+        b2_session.raw_api = fake_b2_raw_api
+        b2_session.authorize_account('dev', '123', '456')
+        account_info.put_bucket_upload_url('bucket_id', 'https://pod/upload', 'upload_token')
+        fake_b2_raw_api.authorize_account.return_value = {
+            **fake_b2_raw_api.authorize_account.return_value,
+            'authorizationToken': 'new_token',
+        }
+        fake_b2_raw_api.get_file_info_by_id.side_effect = [InvalidAuthToken('expired', ''), {}]
+
+        with mock.patch.object(account_info, 'set_auth_data') as set_auth_data:
+            assert b2_session.get_file_info_by_id('file_id') == {}
+
+        set_auth_data.assert_not_called()
+        assert account_info.get_account_auth_token() == 'new_token'
+        assert account_info.take_bucket_upload_url('bucket_id') == (
+            'https://pod/upload',
+            'upload_token',
+        )
+
+    def test_refresh_of_other_account_stores_all_data(
+        self, account_info, fake_cache, fake_b2_raw_api
+    ):
+        b2_session = B2Session(account_info=account_info, cache=fake_cache)
+        b2_session.raw_api = fake_b2_raw_api
+        b2_session.authorize_account('dev', '123', '456')
+        fake_b2_raw_api.authorize_account.return_value = {
+            **fake_b2_raw_api.authorize_account.return_value,
+            'accountId': 'other_account',
+        }
+        fake_cache.clear.reset_mock()
+        fake_b2_raw_api.get_file_info_by_id.side_effect = [InvalidAuthToken('expired', ''), {}]
+
+        assert b2_session.get_file_info_by_id('file_id') == {}
+
+        assert account_info.get_account_id() == 'other_account'
+        fake_cache.clear.assert_called_once_with()
+
+
+class TestUploadUrls:
+    @pytest.fixture
+    def b2_session(self, fake_account_info, fake_cache, fake_b2_raw_api):
+        b2_session = B2Session(
+            account_info=fake_account_info,
+            cache=fake_cache,
+            api_config=B2HttpApiConfig(upload_url_prefetch_count=3),
+        )
+        b2_session.raw_api = fake_b2_raw_api
+        fake_account_info.take_bucket_upload_url.return_value = (None, None)
+        fake_account_info.count_bucket_upload_urls.side_effect = (
+            lambda bucket_id: fake_account_info.put_bucket_upload_url.call_count
+        )
+        fake_b2_raw_api.get_upload_url.side_effect = [
+            {'uploadUrl': f'https://pod-{i}/upload', 'authorizationToken': f'token_{i}'}
+            for i in range(5)
+        ]
+        return b2_session
+
+    def test_prefetch(self, b2_session):
+        b2_session._get_upload_data('bucket_id')
+        b2_session._get_upload_data(
+            'bucket_id'
+        )  # the urls are either prefetched or being prefetched
+        b2_session._upload_url_prefetch_executor.shutdown(wait=True)
+
+        assert b2_session.raw_api.get_upload_url.call_count == 2 + 3
+        assert b2_session.account_info.put_bucket_upload_url.call_count == 3
+        assert not b2_session._upload_urls_prefetching
+
+    def test_upload_failure_recorded(self, b2_session):
+        b2_session.upload_url_prefetch_count = 0
+        b2_session.raw_api.upload_file.side_effect = BadUploadUrl('pod is busy')
+
+        with pytest.raises(BadUploadUrl):
+            b2_session.upload_file('bucket_id', 'file', 1, 'b2/x-auto', 'sha1', {}, b'x')
+
+        b2_session.account_info.record_upload_url_failure.assert_called_once_with(
+            'https://pod-0/upload'
+        )
+        b2_session.account_info.put_bucket_upload_url.assert_not_called()
+
+    def test_upload_success_recorded(self, b2_session):
+        b2_session.upload_url_prefetch_count = 0
+        b2_session.raw_api.upload_file.return_value = {}
+
+        b2_session.upload_file('bucket_id', 'file', 1, 'b2/x-auto', 'sha1', {}, b'x')
+
+        b2_session.account_info.record_upload_url_success.assert_called_once_with(
+            'https://pod-0/upload', mock.ANY, 1
+        )
+
+    def test_prefetched_url_not_pooled_after_large_file_finished(self, b2_session):
+        account_info = b2_session.account_info
+        account_info.take_large_file_upload_url.return_value = (None, None)
+        account_info.count_large_file_upload_urls.return_value = 0
+        b2_session.upload_url_prefetch_count = 1
+        release = threading.Event()
+
+        def get_upload_part_url(*args):
+            if threading.current_thread().name.startswith('b2sdk-upload-url-prefetch'):
+                release.wait(5)
+            return {'uploadUrl': 'https://pod/upload', 'authorizationToken': 'token'}
+
+        b2_session.raw_api.get_upload_part_url.side_effect = get_upload_part_url
+        b2_session._get_upload_part_data('file_id')
+        b2_session.finish_large_file('file_id', [])
+        release.set()
+        b2_session._upload_url_prefetch_executor.shutdown(wait=True)
+
+        account_info.put_large_file_upload_url.assert_not_called()
+        account_info.clear_large_file_upload_urls.assert_called_once_with('file_id')
+        assert not b2_session._upload_urls_prefetching
+        assert not b2_session._upload_urls_cleared
+
+    def test_close(self, b2_session):
+        b2_session._get_upload_data('bucket_id')
+        executor = b2_session._upload_url_prefetch_executor
+
+        b2_session.close()
+
+        assert b2_session._upload_url_prefetch_executor is None
+        executor.shutdown(wait=True)
+        assert not b2_session._upload_urls_prefetching
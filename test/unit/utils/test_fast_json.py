@@ -0,0 +1,27 @@
+######################################################################
+#
+# File: test/unit/utils/test_fast_json.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import pytest
+
+from b2sdk._internal.utils import fast_json
+
+
+def test_loads_bytes():
+    assert fast_json.loads('{"fileName": "zażółć", "size": 12345678901234}'.encode()) == {
+        'fileName': 'zażółć',
+        'size': 12345678901234,
+    }
+
+
+@pytest.mark.parametrize('data', [b'{"files": [', b'\xff\xfe', b''])
+def test_loads_invalid(data):
+    with pytest.raises(ValueError):
+        fast_json.loads(data)
@@ -0,0 +1,45 @@
+######################################################################
+#
+# File: test/unit/utils/test_http_date.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+from b2sdk._internal.utils.http_date import parse_http_date, parse_imf_fixdate
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        'Fri, 16 Dec 2016 20:52:30 GMT',
+        'Sun, 06 Nov 1994 08:49:37 GMT',
+        'Mon, 29 Feb 2016 00:00:00 GMT',
+    ],
+)
+def test_parse_imf_fixdate(value):
+    assert parse_imf_fixdate(value) == parse_http_date(value)
+    assert parse_imf_fixdate(value).tzinfo is dt.timezone.utc
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        'bad format',
+        'Fri, 16 XXX 2016 20:52:30 GMT',
+        'Fri, 16 Dec 2016 20:52:30 UTC',
+        'Fri, 32 Dec 2016 20:52:30 GMT',
+        'Fri, 16 Dec 2016 25:52:30 GMT',
+        'Sunday, 06-Nov-94 08:49:37 GMT',
+    ],
+)
+def test_parse_imf_fixdate_invalid(value):
+    with pytest.raises(ValueError):
+        parse_imf_fixdate(value)
@@ -0,0 +1,65 @@
+######################################################################
+#
+# File: test/unit/utils/test_read_ahead.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from b2sdk._internal.utils.read_ahead import read_ahead
+
+
+@pytest.mark.parametrize('depth', [0, 1, 3])
+def test_read_ahead(depth):
+    assert list(read_ahead(iter(range(10)), depth)) == list(range(10))
+
+
+def test_read_ahead_produces_in_background():
+    produced = []
+    third_produced = threading.Event()
+
+    def items():
+        for item in range(5):
+            produced.append(item)
+            if item == 2:
+                third_produced.set()
+            yield item
+
+    iterator = read_ahead(items(), 2)
+    assert next(iterator) == 0
+    # the item being consumed and two items ahead of it
+    assert third_produced.wait(5)
+    assert list(iterator) == [1, 2, 3, 4]
+
+
+def test_read_ahead_exception():
+    def items():
+        yield 1
+        raise ValueError('boom')
+
+    iterator = read_ahead(items(), 3)
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match='boom'):
+        next(iterator)
+
+
+def test_read_ahead_closed():
+    finished = threading.Event()
+
+    def items():
+        try:
+            yield from range(1000)
+        finally:
+            finished.set()
+
+    iterator = read_ahead(items(), 1)
+    assert next(iterator) == 0
+    iterator.close()
+    assert finished.wait(5)
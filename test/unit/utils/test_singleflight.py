@@ -0,0 +1,72 @@
+######################################################################
+#
+# File: test/unit/utils/test_singleflight.py
+#
+# Copyright 2026 Backblaze Inc. All Rights Reserved.
+#
+# License https://www.backblaze.com/using_b2_code.html
+#
+######################################################################
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from b2sdk._internal.utils.singleflight import SingleFlight
+
+
+def _call_concurrently(single_flight, key, fcn, count):
+    """
+    Make `count` concurrent calls; whichever of them runs, it blocks until all others are waiting for it.
+    """
+    release = threading.Event()
+
+    def blocking_fcn():
+        release.wait(5)
+        return fcn()
+
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(single_flight.do, key, blocking_fcn) for _ in range(count)]
+        while single_flight.calls_coalesced < count - 1:
+            time.sleep(0.001)
+        release.set()
+    return futures
+
+
+def test_concurrent_calls_coalesced():
+    calls = []
+
+    def fcn():
+        calls.append(1)
+        return {'buckets': []}
+
+    futures = _call_concurrently(SingleFlight(), 'key', fcn, 4)
+
+    results = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert results == [{'buckets': []}] * 4
+    # every caller gets an object of its own
+    assert len({id(result) for result in results}) == 4
+
+
+def test_exception_shared():
+    def fcn():
+        raise ValueError('no')
+
+    futures = _call_concurrently(SingleFlight(), 'key', fcn, 3)
+
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result()
+
+
+def test_sequential_calls_not_cached():
+    single_flight = SingleFlight()
+    results = iter([1, 2])
+
+    assert single_flight.do('key', lambda: next(results)) == 1
+    assert single_flight.do('key', lambda: next(results)) == 2
+    assert single_flight.calls_coalesced == 0